@@ -1,12 +1,15 @@
 """配置模块（配置接口和实现）"""
 
 import logging
-from typing import List, Optional, Protocol, Callable
+from typing import Callable, FrozenSet, List, Optional, Protocol, Tuple
 
 from pydantic import BaseModel
 
 logger = logging.getLogger(__name__)
 
+# 共享的空列表（作为缓存身份比较的稳定对象，不要修改）
+_EMPTY_LIST: list = []
+
 __all__ = ["Config", "LKMLConfig", "set_config", "get_config"]
 
 
@@ -25,6 +28,10 @@ class Config(Protocol):
         """获取支持的子系统列表（动态合并 vger 缓存和手动配置）"""
         ...  # pylint: disable=unnecessary-ellipsis  # Protocol 必需，表示抽象方法
 
+    def get_supported_subsystems_set(self) -> FrozenSet[str]:
+        """获取支持的子系统集合（用于 O(1) 成员判断）"""
+        ...  # pylint: disable=unnecessary-ellipsis  # Protocol 必需，表示抽象方法
+
     @property
     def max_news_count(self) -> int:
         """最大新闻数量"""
@@ -108,6 +115,9 @@ class LKMLConfig(BaseModel):
     _vger_subsystems_getter: Optional[Callable[[], List[str]]] = (
         None  # 用于获取 vger 缓存中的子系统
     )
+    # 支持的子系统集合缓存：(vger 列表对象, 手动配置列表对象, 合并后的集合)
+    # vger 缓存刷新时会替换列表对象，按对象身份判断缓存是否失效
+    _supported_set_cache: Optional[Tuple[list, list, FrozenSet[str]]] = None
 
     class Config:  # pylint: disable=too-few-public-methods
         """Pydantic 配置类
@@ -144,25 +154,47 @@ class LKMLConfig(BaseModel):
         Returns:
             合并后的子系统列表（去重并排序）
         """
-        # 从 vger 缓存获取内核子系统
-        vger_subsystems = []
-        if self._vger_subsystems_getter:
-            try:
-                result = self._vger_subsystems_getter()
-                # 确保返回的是列表，如果返回 None 则使用空列表
-                if result is not None:
-                    vger_subsystems = result if isinstance(result, list) else []
-            except (TypeError, ValueError, AttributeError) as e:
-                logger.warning("Failed to get vger subsystems: %s", e)
+        # 合并并去重
+        return sorted(self.get_supported_subsystems_set())
 
+    def get_supported_subsystems_set(self) -> FrozenSet[str]:
+        """获取支持的子系统集合（用于 O(1) 成员判断）
+
+        vger 缓存列表和手动配置列表对象不变时复用上次合并的结果。
+
+        Returns:
+            合并后的子系统集合
+        """
+        vger_subsystems = self._get_vger_subsystems()
         # 确保 manual_subsystems 不为 None
         manual_subsystems = (
             self.manual_subsystems if self.manual_subsystems is not None else []
         )
 
-        # 合并并去重
-        all_subsystems = list(set(vger_subsystems + manual_subsystems))
-        return sorted(all_subsystems)
+        cached = self._supported_set_cache
+        if (
+            cached is not None
+            and cached[0] is vger_subsystems
+            and cached[1] is manual_subsystems
+        ):
+            return cached[2]
+
+        supported = frozenset(vger_subsystems).union(manual_subsystems)
+        self._supported_set_cache = (vger_subsystems, manual_subsystems, supported)
+        return supported
+
+    def _get_vger_subsystems(self) -> list:
+        """从 vger 缓存获取内核子系统（获取失败时返回空列表）"""
+        if not self._vger_subsystems_getter:
+            return _EMPTY_LIST
+        try:
+            result = self._vger_subsystems_getter()
+            # 确保返回的是列表，如果返回 None 则使用空列表
+            if isinstance(result, list):
+                return result
+        except (TypeError, ValueError, AttributeError) as e:
+            logger.warning("Failed to get vger subsystems: %s", e)
+        return _EMPTY_LIST
 
     @staticmethod
     def _parse_manual_subsystems() -> List[str]:
@@ -13,6 +13,12 @@ from ..models import FeedMessageModel
 
 logger = logging.getLogger(__name__)
 
+# 批量查询时每条 SQL 包含的消息 ID 数量上限
+# 每个 ID 生成两个 OR 条件，SQLite 默认表达式深度上限为 1000
+_REPLIES_QUERY_CHUNK_SIZE = 200
+# IN 查询时每条 SQL 绑定的参数数量上限（旧版 SQLite 默认最多 999 个变量）
+_IN_QUERY_CHUNK_SIZE = 500
+
 
 @dataclass
 class FeedMessageData:
@@ -101,6 +107,32 @@ class FeedMessageRepository:
         model = result.scalar_one_or_none()
         return self._model_to_data(model) if model else None
 
+    async def find_by_message_id_headers(
+        self, message_id_headers: list[str]
+    ) -> dict[str, FeedMessageData]:
+        """根据多个 Message-ID Header 批量查找 Feed 消息
+
+        Args:
+            message_id_headers: Message-ID 头部列表
+
+        Returns:
+            {Message-ID 头部: Feed 消息数据}，不存在的消息不包含在结果中
+        """
+        found: dict[str, FeedMessageData] = {}
+        ids = list(dict.fromkeys(message_id_headers))
+
+        for start in range(0, len(ids), _IN_QUERY_CHUNK_SIZE):
+            chunk = ids[start : start + _IN_QUERY_CHUNK_SIZE]
+            result = await self.session.execute(
+                select(FeedMessageModel).where(
+                    FeedMessageModel.message_id_header.in_(chunk)
+                )
+            )
+            for model in result.scalars():
+                found[model.message_id_header] = self._model_to_data(model)
+
+        return found
+
     async def find_by_message_id(self, message_id: str) -> Optional[FeedMessageData]:
         """根据消息ID查找 Feed 消息
 
@@ -262,6 +294,73 @@ class FeedMessageRepository:
         models = result.scalars().all()
         return [self._model_to_data(model) for model in models]
 
+    async def find_replies_to_many(
+        self, message_id_headers: list[str], limit: int = 10
+    ) -> dict[str, list[FeedMessageData]]:
+        """批量查找回复多个消息的 REPLY
+
+        与 ``find_replies_to`` 的匹配规则一致（精确匹配或 LIKE 模糊匹配），
+        但多个被回复消息合并为一次查询（按 ``_REPLIES_QUERY_CHUNK_SIZE`` 分批，
+        避免 SQLite 表达式深度超限）。
+
+        Args:
+            message_id_headers: 被回复的消息 ID 列表
+            limit: 每个被回复消息最多返回的 REPLY 数量
+
+        Returns:
+            {被回复消息 ID: REPLY 消息数据列表}，每个列表按时间正序排序（最早的在前）
+        """
+        grouped: dict[str, list[FeedMessageData]] = {
+            message_id_header: [] for message_id_header in message_id_headers
+        }
+        ids = list(grouped)
+
+        for start in range(0, len(ids), _REPLIES_QUERY_CHUNK_SIZE):
+            chunk = ids[start : start + _REPLIES_QUERY_CHUNK_SIZE]
+            result = await self.session.execute(
+                select(FeedMessageModel)
+                .where(self._replies_to_chunk_condition(chunk))
+                .order_by(FeedMessageModel.received_at.asc())
+            )
+            self._group_replies_by_parent(result.scalars(), chunk, grouped, limit)
+
+        return grouped
+
+    @staticmethod
+    def _replies_to_chunk_condition(chunk: list[str]):
+        """构建匹配一批被回复消息的查询条件（精确匹配或 LIKE 模糊匹配）"""
+        conditions = []
+        for message_id_header in chunk:
+            conditions.append(FeedMessageModel.in_reply_to_header == message_id_header)
+            conditions.append(
+                FeedMessageModel.in_reply_to_header.like(f"%{message_id_header}%")
+            )
+        return or_(*conditions)
+
+    def _group_replies_by_parent(
+        self,
+        models,
+        chunk: list[str],
+        grouped: dict[str, list[FeedMessageData]],
+        limit: int,
+    ) -> None:
+        """将一批查询结果按被回复消息分组，追加到 grouped 中（每组最多 limit 条）
+
+        同一条 REPLY 可能同时匹配多个被回复消息，每组各自转换一份数据对象，
+        调用方修改某一组的数据不会影响其他组。
+        """
+        # SQLite 的 LIKE 对 ASCII 不区分大小写，分组时保持一致
+        lowered_chunk = [(mid, mid.lower()) for mid in chunk]
+        for model in models:
+            header = model.in_reply_to_header or ""
+            header_lower = header.lower()
+            for message_id_header, message_id_lower in lowered_chunk:
+                replies = grouped[message_id_header]
+                if len(replies) >= limit:
+                    continue
+                if header == message_id_header or message_id_lower in header_lower:
+                    replies.append(self._model_to_data(model))
+
     async def find_series_patches(
         self, series_message_id: str
     ) -> list[FeedMessageData]:
@@ -140,6 +140,66 @@ class PatchCardFilterRepository:
 
         return self._model_to_data(model)
 
+    async def upsert_by_name(self, data: PatchCardFilterData) -> PatchCardFilterData:
+        """按名称创建或更新过滤规则（单条 INSERT ... ON CONFLICT 语句）
+
+        同名规则已存在时更新 enabled、filter_conditions 和 description，
+        保留原有的 created_by 和 created_at；并发创建同名规则时不会触发唯一约束错误。
+
+        Args:
+            data: 过滤规则数据（id 字段被忽略）
+
+        Returns:
+            创建或更新后的过滤规则数据
+        """
+        import json
+        from sqlalchemy import text
+
+        # 显式序列化 JSON 数据，确保 SQLite 能正确存储
+        filter_conditions_json = json.dumps(data.filter_conditions, ensure_ascii=False)
+
+        await self.session.execute(
+            text(
+                """
+                INSERT INTO patch_card_filters (
+                    name, enabled, filter_conditions, description, created_by,
+                    created_at, updated_at
+                )
+                VALUES (
+                    :name, :enabled, :filter_conditions, :description, :created_by,
+                    CURRENT_TIMESTAMP, CURRENT_TIMESTAMP
+                )
+                ON CONFLICT (name) DO UPDATE
+                SET enabled = excluded.enabled,
+                    filter_conditions = excluded.filter_conditions,
+                    description = excluded.description,
+                    updated_at = CURRENT_TIMESTAMP
+            """
+            ),
+            {
+                "name": data.name,
+                "enabled": data.enabled,
+                "filter_conditions": filter_conditions_json,
+                "description": data.description,
+                "created_by": data.created_by,
+            },
+        )
+        await self.session.flush()
+
+        # 重新查询以获取写入后的记录
+        # populate_existing：原生 SQL 不会刷新会话中已加载的同一对象
+        result = await self.session.execute(
+            select(PatchCardFilterModel)
+            .where(PatchCardFilterModel.name == data.name)
+            .limit(1)
+            .execution_options(populate_existing=True)
+        )
+        model = result.scalar_one_or_none()
+        if not model:
+            raise RuntimeError(f"Failed to retrieve upserted filter: {data.name}")
+
+        return self._model_to_data(model)
+
     async def find_by_id(self, filter_id: int) -> Optional[PatchCardFilterData]:
         """根据 ID 查找过滤规则
 
@@ -165,7 +225,9 @@ class PatchCardFilterRepository:
             过滤规则数据，如果不存在则返回 None
         """
         result = await self.session.execute(
-            select(PatchCardFilterModel).where(PatchCardFilterModel.name == name)
+            select(PatchCardFilterModel)
+            .where(PatchCardFilterModel.name == name)
+            .limit(1)
         )
         model = result.scalar_one_or_none()
         return self._model_to_data(model) if model else None
@@ -11,6 +11,26 @@ import httpx
 
 logger = logging.getLogger(__name__)
 
+# 模块级共享的 HTTP 客户端（首次使用时创建），每个 PATCH 都要抓取一次 lore 页面，
+# 复用连接池和 keep-alive 连接，避免每次请求都重新进行 TCP/TLS 握手
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """获取共享的 HTTP 客户端（首次使用或已关闭时创建）"""
+    global _http_client  # pylint: disable=global-statement
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(timeout=30.0, follow_redirects=True)
+    return _http_client
+
+
+async def aclose_http_client() -> None:
+    """关闭共享的 HTTP 客户端（在 bot 关闭时调用）"""
+    global _http_client  # pylint: disable=global-statement
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
 
 def _extract_emails_from_text(text: str) -> List[str]:
     """从文本中提取邮箱地址
@@ -72,7 +92,9 @@ def _extract_field_from_pre(pre_content: str, field_name: str) -> List[str]:
     field_text = _clean_html_text(field_text)
     emails = _extract_emails_from_text(field_text)
     if emails:
-        logger.debug(f"Found {len(emails)} {field_name} addresses: {emails[:3]}...")
+        logger.debug(
+            "Found %d %s addresses: %s...", len(emails), field_name, emails[:3]
+        )
     return emails
 
 
@@ -100,7 +122,7 @@ def _extract_emails_from_table_format(html_content: str, field_name: str) -> Lis
             emails = _extract_emails_from_text(field_text)
             if emails:
                 logger.debug(
-                    f"Found {len(emails)} {field_name} addresses: {emails[:3]}..."
+                    "Found %d %s addresses: %s...", len(emails), field_name, emails[:3]
                 )
                 return emails
     return []
@@ -119,21 +141,20 @@ async def _fetch_html_content(url: str) -> Optional[str]:
     if not base_url.endswith("/"):
         base_url += "/"
 
-    async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-        response = await client.get(base_url)
+    response = await _get_http_client().get(base_url)
 
-        if response.status_code != 200:
-            logger.warning(
-                f"Failed to fetch HTML page from {url} (status {response.status_code})"
-            )
-            return None
+    if response.status_code != 200:
+        logger.warning(
+            "Failed to fetch HTML page from %s (status %s)", url, response.status_code
+        )
+        return None
 
-        html_content = response.text
-        if not html_content:
-            logger.warning(f"Empty HTML content from {url}")
-            return None
+    html_content = response.text
+    if not html_content:
+        logger.warning("Empty HTML content from %s", url)
+        return None
 
-        return html_content
+    return html_content
 
 
 async def fetch_cc_list_from_url(url: str) -> Optional[List[str]]:
@@ -180,15 +201,18 @@ async def fetch_cc_list_from_url(url: str) -> Optional[List[str]]:
         result = list(set(all_emails)) if all_emails else []
         if result:
             logger.info(
-                f"Extracted {len(result)} email addresses (To+CC) from {url}: {result[:5]}..."
+                "Extracted %d email addresses (To+CC) from %s: %s...",
+                len(result),
+                url,
+                result[:5],
             )
             return result
-        logger.debug(f"No To/CC addresses found in HTML page from {url}")
+        logger.debug("No To/CC addresses found in HTML page from %s", url)
         return None
 
     except httpx.HTTPError as e:
-        logger.warning(f"Failed to fetch To/CC list from {url}: {e}")
+        logger.warning("Failed to fetch To/CC list from %s: %s", url, e)
         return None
     except (ValueError, KeyError, AttributeError, re.error) as e:
-        logger.error(f"Error parsing To/CC list from {url}: {e}", exc_info=True)
+        logger.error("Error parsing To/CC list from %s: %s", url, e, exc_info=True)
         return None
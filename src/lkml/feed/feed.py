@@ -313,25 +313,17 @@ class FeedProcessor:
         in_reply_to_header = self._extract_in_reply_to_header(entry)
         return (email, received_at, message_id, message_id_header, in_reply_to_header)
 
-    def _convert_repo_to_service_feed_message(
-        self, repo_data: "FeedMessageData"
-    ) -> FeedMessage:
-        """将 Repository 层的 FeedMessageData 转换为 Service 层的 FeedMessage"""
-        from ..service.helpers import extract_common_feed_message_fields
-
-        common_fields = extract_common_feed_message_fields(repo_data)
-        return FeedMessage(**common_fields)
-
     async def _save_service_feed_message_to_repo(
         self, feed_message_repo, service_feed_message_data
     ):
         """将 Service 层的 FeedMessage 转换为 Repo 层数据并保存"""
         from ..db.repo import FeedMessageData as RepoFeedMessageData
 
-        from ..service.helpers import extract_common_feed_message_fields
+        from ..service.helpers import extract_common_feed_message_values
 
-        common_fields = extract_common_feed_message_fields(service_feed_message_data)
-        repo_feed_message_data = RepoFeedMessageData(**common_fields)
+        repo_feed_message_data = RepoFeedMessageData(
+            *extract_common_feed_message_values(service_feed_message_data)
+        )
 
         return await feed_message_repo.create_or_update(data=repo_feed_message_data)
 
@@ -402,13 +394,12 @@ class FeedProcessor:
                     in_reply_to_header=base_data[4],
                     message_id_header=msg_id_header,
                 )
-                converted_message = self._convert_repo_to_service_feed_message(
-                    existing_message_data
-                )
                 # 附加分类信息以便后续处理
+                # Service 层 FeedMessage 使用 __slots__，无法附加额外属性，
+                # 因此直接返回 Repository 层数据（与新消息路径一致）
                 # pylint: disable=protected-access
-                converted_message._classification = classification  # type: ignore
-                return converted_message
+                existing_message_data._classification = classification  # type: ignore
+                return existing_message_data
 
         # 使用标准化的消息分类器判断消息类型
         classification = classify_message(
@@ -11,7 +11,10 @@
 
 # pylint: disable=too-many-lines
 
+import asyncio
 import logging
+import time
+from dataclasses import replace
 from typing import Optional, Protocol, runtime_checkable
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -32,6 +35,89 @@ from .patch_card_service import PatchCardService
 
 logger = logging.getLogger(__name__)
 
+# _find_target_patch_for_reply 未命中时的共享返回值
+_NO_MATCH: tuple[Optional[SeriesPatchInfo], Optional[int]] = (None, None)
+
+# 异常日志限流：每种异常类型在每个时间窗口内最多输出若干条带 traceback 的日志
+_EXC_LOG_WINDOW_SECONDS = 1.0
+_EXC_LOG_MAX_PER_WINDOW = 5
+# 已知的瞬时性错误（超时、连接中断）：重试即可恢复，记录 repr 即可，不格式化 traceback
+_TRANSIENT_EXCEPTIONS = (TimeoutError, asyncio.TimeoutError, ConnectionError)
+# {异常类型: [窗口起始时间, 已输出条数, 已抑制条数, 被抑制日志的最高级别]}
+_exc_log_state: dict[type, list] = {}
+
+
+def _flush_suppressed_logs(exc_type: type, window_start: float) -> None:
+    """时间窗口结束时汇总输出该窗口内被抑制的日志条数
+
+    Args:
+        exc_type: 异常类型
+        window_start: 安排汇总时的窗口起始时间（窗口已被新窗口替换时不再输出）
+    """
+    state = _exc_log_state.get(exc_type)
+    if state is None or state[0] != window_start or not state[2]:
+        return
+    logger.log(
+        state[3],
+        "Suppressed %d similar %s log(s) in the last %.1fs",
+        state[2],
+        exc_type.__name__,
+        _EXC_LOG_WINDOW_SECONDS,
+    )
+    state[2] = 0
+
+
+def _log_exception(
+    message: str, exc: BaseException, level: int = logging.ERROR
+) -> None:
+    """按异常类型限流记录异常日志
+
+    错误风暴（如批量的异常 feed）时，每条日志都格式化 traceback 开销很大。
+    窗口内超出配额的日志只计数，在窗口结束时汇总输出一次；
+    除已知的瞬时性错误外都附带 traceback（DEBUG 级别下瞬时性错误也附带）。
+
+    Args:
+        message: 日志格式字符串（包含一个 ``%s`` 占位符，对应异常）
+        exc: 捕获到的异常
+        level: 日志级别
+    """
+    now = time.monotonic()
+    exc_type = type(exc)
+    state = _exc_log_state.get(exc_type)
+    if state is None or now - state[0] >= _EXC_LOG_WINDOW_SECONDS:
+        if state is not None:
+            # 定时汇总尚未执行（如没有运行中的事件循环）时，在新窗口开始前补充输出
+            _flush_suppressed_logs(exc_type, state[0])
+        state = [now, 0, 0, level]
+        _exc_log_state[exc_type] = state
+
+    if state[1] < _EXC_LOG_MAX_PER_WINDOW:
+        state[1] += 1
+        # AttributeError 等在本服务中多为程序错误，需要 traceback 定位；
+        # 只有已知的瞬时性错误（且未开启 DEBUG 日志）只记录 repr
+        if isinstance(exc, _TRANSIENT_EXCEPTIONS) and not logger.isEnabledFor(
+            logging.DEBUG
+        ):
+            logger.log(level, message, repr(exc), stacklevel=2)
+        else:
+            logger.log(level, message, exc, exc_info=exc, stacklevel=2)
+        return
+
+    if not state[2]:
+        # 窗口内第一次抑制：安排在窗口结束时汇总输出
+        try:
+            asyncio.get_running_loop().call_later(
+                state[0] + _EXC_LOG_WINDOW_SECONDS - now,
+                _flush_suppressed_logs,
+                exc_type,
+                state[0],
+            )
+        except RuntimeError:
+            pass
+        state[3] = level
+    state[2] += 1
+    state[3] = max(state[3], level)
+
 
 @runtime_checkable
 class ReplyNotificationSender(Protocol):
@@ -167,7 +253,9 @@ class FeedMessageService:
 
             # 将匹配的过滤规则名称传递给 service_feed_message（用于后续渲染）
             if matched_filters:
-                service_feed_message.matched_filters = matched_filters
+                service_feed_message = replace(
+                    service_feed_message, matched_filters=matched_filters
+                )
 
             # 检查 PATCH 卡片是否已存在
             async with get_patch_card_service() as service:
@@ -485,7 +573,9 @@ class FeedMessageService:
             )
 
             if matched_filters:
-                service_feed_message.matched_filters = matched_filters
+                service_feed_message = replace(
+                    service_feed_message, matched_filters=matched_filters
+                )
 
             patch_card = await self._get_existing_patch_card_for_reply(
                 session, existing_patch_card, target_patch
@@ -623,6 +713,25 @@ class FeedMessageService:
         feed_message_repo = FeedMessageRepository(session)
         from .thread_service import _extract_message_id_from_header
 
+        parent_id = (
+            _extract_message_id_from_header(reply_message.in_reply_to_header)
+            or reply_message.in_reply_to_header
+        )
+
+        # 预先已知的消息（父消息、Series 根）合并为一次批量查询，链式查找时复用
+        known_ids = [parent_id]
+        if reply_message.series_message_id:
+            known_ids.append(reply_message.series_message_id)
+        messages: dict[str, Optional[FeedMessageData]] = dict.fromkeys(known_ids)
+        messages.update(await feed_message_repo.find_by_message_id_headers(known_ids))
+
+        async def find_message(message_id_header: str) -> Optional[FeedMessageData]:
+            if message_id_header not in messages:
+                messages[message_id_header] = (
+                    await feed_message_repo.find_by_message_id_header(message_id_header)
+                )
+            return messages[message_id_header]
+
         async def find_patch_in_chain(
             message_id_header: str,
         ) -> Optional[FeedMessageData]:
@@ -636,7 +745,7 @@ class FeedMessageService:
                     break
                 visited.add(current_id)
 
-                msg = await feed_message_repo.find_by_message_id_header(current_id)
+                msg = await find_message(current_id)
                 if not msg:
                     return None
 
@@ -646,9 +755,7 @@ class FeedMessageService:
                         and not msg.is_cover_letter
                         and msg.series_message_id
                     ):
-                        cover = await feed_message_repo.find_by_message_id_header(
-                            msg.series_message_id
-                        )
+                        cover = await find_message(msg.series_message_id)
                         if cover and cover.is_patch and not cover.is_reply:
                             return cover
                     return msg
@@ -657,10 +764,7 @@ class FeedMessageService:
                 depth += 1
             return None
 
-        parent = await feed_message_repo.find_by_message_id_header(
-            _extract_message_id_from_header(reply_message.in_reply_to_header)
-            or reply_message.in_reply_to_header
-        )
+        parent = messages[parent_id]
 
         # 优先沿 in-reply-to 链找到真正的 PATCH
         resolved = await find_patch_in_chain(reply_message.in_reply_to_header)
@@ -672,7 +776,7 @@ class FeedMessageService:
             parent.series_message_id if parent else None
         )
         if series_id:
-            root = await feed_message_repo.find_by_message_id_header(series_id)
+            root = await find_message(series_id)
             if root and root.is_patch and not root.is_reply:
                 return root
 
@@ -815,7 +919,7 @@ class FeedMessageService:
     ):
         """当 Reply 到达时，更新 Thread
 
-        根据是否配置了 ``thread_sender``，选择对应的更新实现。
+        未配置 ``thread_sender`` 时无法更新 Thread，直接跳过。
 
         Args:
             session: 数据库会话（用于查询，确保能查询到新保存的 REPLY）
@@ -823,13 +927,14 @@ class FeedMessageService:
             patch_card: PATCH 卡片对象
             in_reply_to_header: Reply 的 in_reply_to 头部
         """
-        if self.thread_sender:
-            await self._update_thread_with_reply_via_thread_sender(
-                session, thread, patch_card, in_reply_to_header
+        if not self.thread_sender:
+            logger.debug(
+                "No thread sender configured, skip updating thread %s",
+                thread.thread_id,
             )
             return
 
-        await self._update_thread_with_reply_via_renderers(
+        await self._update_thread_with_reply_via_thread_sender(
             session, thread, patch_card, in_reply_to_header
         )
 
@@ -842,126 +947,62 @@ class FeedMessageService:
     ) -> None:
         """当 Reply 到达时，使用 ``thread_sender`` 更新 Thread。"""
         try:
-            target_patch, target_patch_index = await self._find_target_patch_for_reply(
-                patch_card, in_reply_to_header
-            )
-
-            if not target_patch or target_patch_index is None:
-                logger.debug(
-                    "Could not find target patch for reply: %s", in_reply_to_header
-                )
-                return
-
-            message_id = self._get_thread_overview_message_id(thread)
-
-            if not message_id:
-                logger.warning(
-                    "No overview message_id found for thread %s",
-                    thread.thread_id,
-                )
-                return
-
-            overview_data = await self._prepare_thread_overview_data(
-                session, patch_card.message_id_header
-            )
-
-            if not overview_data:
-                return
-
-            success = await self.thread_sender.update_thread_overview(
-                thread.thread_id,
-                message_id,
-                overview_data,
+            await self._update_thread_with_reply_via_thread_sender_impl(
+                session, thread, patch_card, in_reply_to_header
             )
-
-            if success:
-                logger.info(
-                    "Updated thread overview message in thread %s",
-                    thread.thread_id,
-                )
-                await self._send_thread_update_notification(thread, patch_card)
-            else:
-                logger.warning(
-                    "Failed to update thread overview message in thread %s",
-                    thread.thread_id,
-                )
         except (RuntimeError, ValueError, AttributeError) as e:
-            logger.error(
-                "Failed to update thread with reply: %s",
-                e,
-                exc_info=True,
-            )
+            _log_exception("Failed to update thread with reply: %s", e)
 
-    async def _update_thread_with_reply_via_renderers(
+    async def _update_thread_with_reply_via_thread_sender_impl(
         self,
         session: AsyncSession,
         thread: PatchThread,
         patch_card: PatchCard,
         in_reply_to_header: str,
     ) -> None:
-        """当 Reply 到达时，通过渲染器列表更新 Thread。"""
-        try:
-            target_patch, target_patch_index = await self._find_target_patch_for_reply(
-                patch_card, in_reply_to_header
-            )
-
-            if not target_patch or target_patch_index is None:
-                logger.debug(
-                    "Could not find target patch for reply: %s", in_reply_to_header
-                )
-                return
+        """``_update_thread_with_reply_via_thread_sender`` 的实现（异常由外层统一处理）"""
+        target_patch, target_patch_index = await self._find_target_patch_for_reply(
+            patch_card, in_reply_to_header
+        )
 
-            message_id = self._get_thread_overview_message_id(thread)
+        if not target_patch or target_patch_index is None:
+            logger.debug(
+                "Could not find target patch for reply: %s", in_reply_to_header
+            )
+            return
 
-            if not message_id:
-                logger.warning(
-                    "No overview message_id found for thread %s",
-                    thread.thread_id,
-                )
-                return
+        message_id = self._get_thread_overview_message_id(thread)
 
-            overview_data = await self._prepare_thread_overview_data(
-                session, patch_card.message_id_header
+        if not message_id:
+            logger.warning(
+                "No overview message_id found for thread %s",
+                thread.thread_id,
             )
+            return
 
-            if not overview_data:
-                return
+        overview_data = await self._prepare_thread_overview_data(
+            session, patch_card.message_id_header
+        )
 
-            successes: list[bool] = []
-            for renderer in self.thread_overview_renderers:
-                try:
-                    result = await renderer.update_sub_patch_message(
-                        thread.thread_id,
-                        message_id,
-                        overview_data,
-                    )
-                    successes.append(bool(result))
-                except (RuntimeError, ValueError, AttributeError) as e:
-                    successes.append(False)
-                    logger.error(
-                        "Failed to update patch [%s] message in thread %s: %s",
-                        target_patch_index,
-                        thread.thread_id,
-                        e,
-                        exc_info=True,
-                    )
+        if not overview_data:
+            return
 
-            if any(successes):
-                logger.info(
-                    "Updated thread overview message in thread %s",
-                    thread.thread_id,
-                )
-                await self._send_thread_update_notification(thread, patch_card)
-            else:
-                logger.warning(
-                    "Failed to update thread overview message in thread %s",
-                    thread.thread_id,
-                )
-        except (RuntimeError, ValueError, AttributeError) as e:
-            logger.error(
-                "Failed to update thread with reply: %s",
-                e,
-                exc_info=True,
+        success = await self.thread_sender.update_thread_overview(
+            thread.thread_id,
+            message_id,
+            overview_data,
+        )
+
+        if success:
+            logger.info(
+                "Updated thread overview message in thread %s",
+                thread.thread_id,
+            )
+            await self._send_thread_update_notification(thread, patch_card)
+        else:
+            logger.warning(
+                "Failed to update thread overview message in thread %s",
+                thread.thread_id,
             )
 
     async def _find_target_patch_for_reply(
@@ -974,7 +1015,7 @@ class FeedMessageService:
             in_reply_to_header: Reply 的 in_reply_to 头部
 
         Returns:
-            (target_patch, target_patch_index) 元组，如果找不到返回 (None, None)
+            (target_patch, target_patch_index) 元组，如果找不到返回 ``_NO_MATCH``
         """
         from .helpers import build_single_patch_info
         from .thread_service import _extract_message_id_from_header
@@ -982,86 +1023,108 @@ class FeedMessageService:
         # 提取 in_reply_to 中的 message_id
         in_reply_to = _extract_message_id_from_header(in_reply_to_header)
         if not in_reply_to:
-            return None, None
-
-        target_patch = None
-        target_patch_index = None
+            return _NO_MATCH
 
         # 单 Patch：直接匹配
         if not patch_card.is_series_patch:
             if patch_card.message_id_header in in_reply_to:
-                target_patch = build_single_patch_info(patch_card)
-                target_patch_index = 1
-            return target_patch, target_patch_index
+                return build_single_patch_info(patch_card), 1
+            return _NO_MATCH
 
         # Series Patch：首先检查是否回复 Cover Letter
         if patch_card.message_id_header in in_reply_to:
-            # 回复 Cover Letter，查找 Cover Letter 对应的 patch
-            if patch_card.series_patches:
-                for patch in patch_card.series_patches:
-                    if patch.patch_index == 0:  # Cover Letter
-                        target_patch = patch
-                        target_patch_index = 0
-                        break
-            # 如果找不到 Cover Letter 的 patch，使用 patch_card 构建一个
-            # 这种情况不应该发生，但为了健壮性，我们处理它
-            if not target_patch:
-                logger.warning(
-                    f"Cover Letter patch not found in series_patches for {patch_card.message_id_header}, "
-                    f"using patch_card to build patch info"
-                )
-                target_patch = SeriesPatchInfo(
-                    subject=patch_card.subject,
-                    patch_index=0,
-                    patch_total=patch_card.patch_total or 1,
-                    message_id=patch_card.message_id_header,
-                    url=patch_card.url or "",
-                )
-                target_patch_index = 0
-
-            return target_patch, target_patch_index
-
-        # Series Patch：查找匹配的子 Patch
-        if patch_card.series_patches:
-            for patch in patch_card.series_patches:
-                if patch.patch_index == 0:  # 跳过 Cover Letter
-                    continue
-                if patch.message_id and patch.message_id in in_reply_to:
-                    target_patch = patch
-                    target_patch_index = patch.patch_index
-                    break
+            return self._find_cover_letter_patch(patch_card), 0
+
+        return self._find_series_sub_patch(patch_card, in_reply_to)
+
+    @staticmethod
+    def _find_cover_letter_patch(patch_card: PatchCard) -> SeriesPatchInfo:
+        """查找系列 PATCH 的 Cover Letter 对应的 patch
+
+        Args:
+            patch_card: 系列 PATCH 卡片对象
+
+        Returns:
+            Cover Letter 的 patch 信息；series_patches 中找不到时用 patch_card 构建
+        """
+        for patch in patch_card.series_patches or ():
+            if patch.patch_index == 0:  # Cover Letter
+                return patch
+
+        # 这种情况不应该发生，但为了健壮性，我们处理它
+        logger.warning(
+            "Cover Letter patch not found in series_patches for %s, "
+            "using patch_card to build patch info",
+            patch_card.message_id_header,
+        )
+        return SeriesPatchInfo(
+            subject=patch_card.subject,
+            patch_index=0,
+            patch_total=patch_card.patch_total or 1,
+            message_id=patch_card.message_id_header,
+            url=patch_card.url or "",
+        )
+
+    @staticmethod
+    def _find_series_sub_patch(patch_card: PatchCard, in_reply_to: str) -> tuple:
+        """查找 REPLY 对应的系列子 Patch（先按 message_id 精确匹配，再回退到包含匹配）
+
+        Args:
+            patch_card: 系列 PATCH 卡片对象
+            in_reply_to: Reply 的 in_reply_to message_id
+
+        Returns:
+            (target_patch, target_patch_index) 元组，如果找不到返回 ``_NO_MATCH``
+        """
+        if not patch_card.series_patches:
+            return _NO_MATCH
+
+        patch = patch_card.series_patch_index().get(in_reply_to)
+        if patch is not None and patch.patch_index != 0:
+            return patch, patch.patch_index
 
-        return target_patch, target_patch_index
+        for patch in patch_card.series_patches:
+            if patch.patch_index == 0:  # 跳过 Cover Letter
+                continue
+            if patch.message_id and patch.message_id in in_reply_to:
+                return patch, patch.patch_index
+
+        return _NO_MATCH
 
     def _get_thread_overview_message_id(self, thread: PatchThread) -> Optional[str]:
         """获取 Thread Overview 的消息 ID。"""
-        sub_patch_messages = thread.sub_patch_messages or {}
-        if sub_patch_messages:
-            return next(iter(sub_patch_messages.values()))
-        return None
+        sub_patch_messages = thread.sub_patch_messages
+        if not sub_patch_messages:
+            return None
+        return next(iter(sub_patch_messages.values()), None)
 
     async def _prepare_thread_overview_data(
         self, session: AsyncSession, message_id_header: str
     ) -> Optional[ThreadOverviewData]:
         """准备 Thread Overview 数据（用于更新单条概览消息）。"""
-        from .helpers import create_repositories_and_services
-
         try:
-            (
-                _,
-                _,
-                _,
-                _,
-                thread_service,
-            ) = create_repositories_and_services(session)
-            return await thread_service.prepare_thread_overview_data(message_id_header)
-        except (RuntimeError, ValueError, AttributeError) as e:
-            logger.error(
-                f"Failed to prepare thread overview data: {e}",
-                exc_info=True,
+            return await self._prepare_thread_overview_data_impl(
+                session, message_id_header
             )
+        except (RuntimeError, ValueError, AttributeError) as e:
+            _log_exception("Failed to prepare thread overview data: %s", e)
             return None
 
+    async def _prepare_thread_overview_data_impl(
+        self, session: AsyncSession, message_id_header: str
+    ) -> Optional[ThreadOverviewData]:
+        """``_prepare_thread_overview_data`` 的实现（异常由外层统一处理）"""
+        from .helpers import create_repositories_and_services
+
+        (
+            _,
+            _,
+            _,
+            _,
+            thread_service,
+        ) = create_repositories_and_services(session)
+        return await thread_service.prepare_thread_overview_data(message_id_header)
+
     async def _should_create_patch_card(
         self,
         session: AsyncSession,
@@ -1081,33 +1144,45 @@ class FeedMessageService:
             - matched_filter_names: 匹配的过滤规则名称列表
         """
         try:
-            from ..db.repo import (
-                PatchCardFilterRepository as LocalPatchCardFilterRepository,
-                PatchCardRepository as LocalPatchCardRepository,
-                FilterConfigRepository,
-                FeedMessageRepository as LocalFeedMessageRepository,
-            )
-            from .patch_card_filter_service import PatchCardFilterService
-
-            filter_repo = LocalPatchCardFilterRepository(session)
-            patch_card_repo = LocalPatchCardRepository(session)
-            filter_config_repo = FilterConfigRepository(session)
-            feed_message_repo = LocalFeedMessageRepository(session)
-            filter_service = PatchCardFilterService(
-                filter_repo, patch_card_repo, filter_config_repo, feed_message_repo
-            )
-
-            return await filter_service.should_create_patch_card(
-                service_feed_message, patch_info
+            return await self._should_create_patch_card_impl(
+                session, service_feed_message, patch_info
             )
         except (RuntimeError, ValueError, AttributeError) as e:
-            logger.warning(
-                f"Failed to check filter rules, allowing creation by default: {e}",
-                exc_info=True,
+            _log_exception(
+                "Failed to check filter rules, allowing creation by default: %s",
+                e,
+                level=logging.WARNING,
             )
             # 如果过滤检查失败，默认允许创建（保持原有行为）
             return (True, [])
 
+    async def _should_create_patch_card_impl(
+        self,
+        session: AsyncSession,
+        service_feed_message: ServiceFeedMessage,
+        patch_info,
+    ) -> tuple[bool, list[str]]:
+        """``_should_create_patch_card`` 的实现（异常由外层统一处理）"""
+        from ..db.repo import (
+            PatchCardFilterRepository as LocalPatchCardFilterRepository,
+            PatchCardRepository as LocalPatchCardRepository,
+            FilterConfigRepository,
+            FeedMessageRepository as LocalFeedMessageRepository,
+        )
+        from .patch_card_filter_service import PatchCardFilterService
+
+        filter_repo = LocalPatchCardFilterRepository(session)
+        patch_card_repo = LocalPatchCardRepository(session)
+        filter_config_repo = FilterConfigRepository(session)
+        feed_message_repo = LocalFeedMessageRepository(session)
+        filter_service = PatchCardFilterService(
+            filter_repo, patch_card_repo, filter_config_repo, feed_message_repo
+        )
+
+        return await filter_service.should_create_patch_card(
+            service_feed_message, patch_info
+        )
+
     def _convert_to_service_feed_message(
         self, feed_message, patch_info, series_message_id
     ) -> ServiceFeedMessage:
@@ -3,6 +3,7 @@
 提供数据转换和实例创建的辅助函数，减少重复代码。
 """
 
+from operator import attrgetter
 from typing import Dict, Any, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -39,41 +40,60 @@ def extract_common_patch_card_fields(data: Any) -> Dict[str, Any]:
         "patch_version": data.patch_version,
         "patch_index": data.patch_index,
         "patch_total": data.patch_total,
-        "has_thread": getattr(data, "has_thread", False),
-        "to_cc_list": getattr(data, "to_cc_list", None),
+        # PatchCard 与 PatchCardData 都定义了以下字段（带默认值），直接访问即可
+        "has_thread": data.has_thread,
+        "to_cc_list": data.to_cc_list,
         # 注意：is_cover_letter 不在数据库中存储，只在 Service 层使用
     }
 
 
+# FeedMessage 的公共字段
+# 注意：顺序与 FeedMessage（Service 层）和 FeedMessageData（Repository 层）
+# dataclass 的前 18 个字段定义顺序一致，因此提取出的值元组可以直接按位置构造两者
+FEED_MESSAGE_COMMON_FIELDS = (
+    "subsystem_name",
+    "message_id_header",
+    "subject",
+    "author",
+    "author_email",
+    "message_id",
+    "in_reply_to_header",
+    "content",
+    "url",
+    "received_at",
+    "is_patch",
+    "is_reply",
+    "is_series_patch",
+    "patch_version",
+    "patch_index",
+    "patch_total",
+    "is_cover_letter",
+    "series_message_id",
+)
+
+extract_common_feed_message_values = attrgetter(*FEED_MESSAGE_COMMON_FIELDS)
+"""按 FEED_MESSAGE_COMMON_FIELDS 顺序提取 FeedMessage 公共字段的值（元组）
+
+用于 ``FeedMessage(*values)`` / ``FeedMessageData(*values)`` 按位置构造，
+避免构建中间 dict 和关键字参数解包。
+"""
+
+
 def extract_common_feed_message_fields(data: Any) -> Dict[str, Any]:
     """提取 FeedMessage 的公共字段
 
+    需要关键字参数的场景（如 SQLAlchemy 模型）使用；构造 FeedMessage /
+    FeedMessageData 时优先使用 ``extract_common_feed_message_values``。
+
     Args:
         data: FeedMessage 或 FeedMessageData 对象
 
     Returns:
         包含公共字段的字典
     """
-    return {
-        "subsystem_name": data.subsystem_name,
-        "message_id_header": data.message_id_header,
-        "subject": data.subject,
-        "author": data.author,
-        "author_email": data.author_email,
-        "message_id": data.message_id,
-        "in_reply_to_header": data.in_reply_to_header,
-        "content": data.content,
-        "url": data.url,
-        "received_at": data.received_at,
-        "is_patch": data.is_patch,
-        "is_reply": data.is_reply,
-        "is_series_patch": data.is_series_patch,
-        "patch_version": data.patch_version,
-        "patch_index": data.patch_index,
-        "patch_total": data.patch_total,
-        "is_cover_letter": data.is_cover_letter,
-        "series_message_id": data.series_message_id,
-    }
+    return dict(
+        zip(FEED_MESSAGE_COMMON_FIELDS, extract_common_feed_message_values(data))
+    )
 
 
 def create_repositories_and_services(
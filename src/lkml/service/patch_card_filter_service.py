@@ -5,6 +5,7 @@
 
 import logging
 import re
+from functools import lru_cache
 from typing import List, Optional
 
 from ..db.repo import (
@@ -16,6 +17,46 @@ from .types import FeedMessage
 logger = logging.getLogger(__name__)
 
 
+def _parse_regex_pattern(pattern_str: str) -> tuple[str | None, bool]:
+    """解析正则表达式模式
+
+    Args:
+        pattern_str: 模式字符串
+
+    Returns:
+        (pattern, case_insensitive) 元组
+        - pattern: 提取的正则表达式模式，如果不是正则则返回 None
+        - case_insensitive: 是否不区分大小写
+    """
+    if not pattern_str.startswith("/"):
+        return (None, False)
+
+    if pattern_str.endswith("/i"):
+        return (pattern_str[1:-2], True)  # 不区分大小写
+    if pattern_str.endswith("/"):
+        return (pattern_str[1:-1], False)  # 区分大小写
+
+    return (None, False)
+
+
+@lru_cache(maxsize=1024)
+def _compile_regex_condition(pattern_str: str) -> Optional["re.Pattern[str]"]:
+    """将 ``/.../`` 或 ``/.../i`` 形式的条件编译为正则表达式
+
+    结果按模式字符串在进程内缓存，所有过滤器中相同的模式只解析、编译一次。
+
+    Args:
+        pattern_str: 模式字符串
+
+    Returns:
+        编译后的正则表达式，如果不是正则形式则返回 None
+    """
+    pattern, case_insensitive = _parse_regex_pattern(pattern_str)
+    if pattern is None:
+        return None
+    return re.compile(pattern, re.IGNORECASE if case_insensitive else 0)
+
+
 class PatchCardFilterService:
     """PATCH 卡片过滤服务类"""
 
@@ -72,11 +113,6 @@ class PatchCardFilterService:
 
         matched_filters = []
 
-        # 获取全局独占模式配置
-        exclusive_mode = False
-        if self.filter_config_repo:
-            exclusive_mode = await self.filter_config_repo.get_exclusive_mode()
-
         # 检查所有过滤器（每个过滤器就是一个规则组，组间 OR 逻辑）
         for filter_data in all_filters:
             if await self._matches_filter(feed_message, _patch_info, filter_data):
@@ -86,45 +122,24 @@ class PatchCardFilterService:
                     f"{feed_message.message_id_header}"
                 )
 
-        # 如果启用了独占模式
-        if exclusive_mode:
-            # 必须匹配至少一个规则才能创建
-            if matched_filters:
-                return (True, matched_filters)
+        # 有匹配的规则则允许创建并标记（与独占模式无关）
+        if matched_filters:
+            return (True, matched_filters)
+
+        # 没有匹配的规则时才需要全局独占模式配置，避免每条消息都查询一次
+        if (
+            self.filter_config_repo
+            and await self.filter_config_repo.get_exclusive_mode()
+        ):
             logger.debug(
                 f"Feed message does not match any filter (exclusive mode enabled): "
                 f"{feed_message.message_id_header}"
             )
             return (False, [])
 
-        # 如果未启用独占模式，有匹配的规则则允许创建并标记
-        if matched_filters:
-            return (True, matched_filters)
-
         # 没有匹配的规则，默认允许创建（保持原有行为）
         return (True, [])
 
-    def _parse_regex_pattern(self, pattern_str: str) -> tuple[str | None, bool]:
-        """解析正则表达式模式
-
-        Args:
-            pattern_str: 模式字符串
-
-        Returns:
-            (pattern, case_insensitive) 元组
-            - pattern: 提取的正则表达式模式，如果不是正则则返回 None
-            - case_insensitive: 是否不区分大小写
-        """
-        if not pattern_str.startswith("/"):
-            return (None, False)
-
-        if pattern_str.endswith("/i"):
-            return (pattern_str[1:-2], True)  # 不区分大小写
-        if pattern_str.endswith("/"):
-            return (pattern_str[1:-1], False)  # 区分大小写
-
-        return (None, False)
-
     def _match_single_pattern(self, val: str, pattern_str: str) -> bool:
         """匹配单个模式
 
@@ -135,10 +150,9 @@ class PatchCardFilterService:
         Returns:
             True 表示匹配，False 表示不匹配
         """
-        pattern, case_insensitive = self._parse_regex_pattern(pattern_str)
-        if pattern is not None:
-            flags = re.IGNORECASE if case_insensitive else 0
-            return bool(re.search(pattern, val, flags))
+        regex = _compile_regex_condition(pattern_str)
+        if regex is not None:
+            return regex.search(val) is not None
         # 普通字符串匹配（不区分大小写）
         return pattern_str.lower() in val.lower()
 
@@ -402,35 +416,28 @@ class PatchCardFilterService:
         created_by: Optional[str] = None,
         enabled: bool = True,
     ) -> PatchCardFilterData:
-        """创建或合并过滤规则（同名时合并条件，去重追加）"""
+        """创建或合并过滤规则（同名时合并条件，去重追加）
+
+        合并条件需要先读取现有规则；写入统一走 ``upsert_by_name``，
+        即使在读取之后有同名规则被并发创建也不会违反唯一约束。
+        """
         existing = await self.filter_repo.find_by_name(name)
         if existing:
-            merged_conditions = self._merge_filter_conditions(
+            filter_conditions = self._merge_filter_conditions(
                 existing.filter_conditions, filter_conditions
             )
+            if description is None:
+                description = existing.description
 
-            data = PatchCardFilterData(
-                id=existing.id,
-                name=name,
-                enabled=enabled,
-                filter_conditions=merged_conditions,
-                description=(
-                    description if description is not None else existing.description
-                ),
-                created_by=(
-                    created_by if created_by is not None else existing.created_by
-                ),
-            )
-            return await self.filter_repo.update(existing.id, data)
         data = PatchCardFilterData(
-            id=0,
+            id=existing.id if existing else 0,
             name=name,
             enabled=enabled,
             filter_conditions=filter_conditions,
             description=description,
             created_by=created_by,
         )
-        return await self.filter_repo.create(data)
+        return await self.filter_repo.upsert_by_name(data)
 
     async def list_filters(
         self, enabled_only: bool = False
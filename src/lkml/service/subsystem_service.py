@@ -36,8 +36,7 @@ class SubsystemService:
             database = get_database()
             async with database.get_db_session() as session:
                 # 检查子系统是否支持
-                supported_subsystems = config.get_supported_subsystems()
-                if subsystem_name not in supported_subsystems:
+                if subsystem_name not in config.get_supported_subsystems_set():
                     return False
 
                 # 获取或创建子系统
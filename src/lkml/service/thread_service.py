@@ -6,15 +6,19 @@ Service 层通过依赖注入接受 Repository 实例。
 """
 
 import logging
+from contextlib import contextmanager
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional, Dict, List
 
 from ..db.repo import (
+    FeedMessageData as RepoFeedMessageData,
     FeedMessageRepository,
     PatchCardRepository,
     PatchThreadData as RepoPatchThreadData,
     PatchThreadRepository,
 )
+from .helpers import extract_common_feed_message_values
 from .types import (
     PatchThread,
     ThreadOverviewData,
@@ -25,10 +29,28 @@ from .types import (
 
 logger = logging.getLogger(__name__)
 
+# 本地时区（模块导入时确定一次，避免每次解析回复时间都查询系统时区）
+LOCAL_TZ = datetime.now().astimezone().tzinfo
+
 
 # ========== 回复处理辅助函数 ==========
 
 
+def _repo_data_to_feed_message(repo_data: RepoFeedMessageData) -> FeedMessage:
+    """将 repo 层的 FeedMessageData 转换为 service 层的 FeedMessage（不做类型检查）
+
+    供已知数据来自 FeedMessageRepository 的内部热路径使用；
+    外部调用方应使用 ThreadService._repo_data_to_service_feed_message。
+
+    Args:
+        repo_data: repo 层的 FeedMessageData
+
+    Returns:
+        service 层的 FeedMessage
+    """
+    return FeedMessage(*extract_common_feed_message_values(repo_data))
+
+
 def parse_reply_time(reply) -> Optional[datetime]:
     """解析回复时间
 
@@ -45,18 +67,39 @@ def parse_reply_time(reply) -> Optional[datetime]:
         # FeedMessage.received_at 是 datetime 对象，直接返回
         reply_time = reply.received_at
         if reply_time.tzinfo:
-            reply_time = reply_time.astimezone(datetime.now().astimezone().tzinfo)
-        else:
-            reply_time = reply_time.replace(tzinfo=datetime.now().astimezone().tzinfo)
-        return reply_time
+            return reply_time.astimezone(LOCAL_TZ)
+        return reply_time.replace(tzinfo=LOCAL_TZ)
     except (ValueError, TypeError):
         return None
 
 
+def _reply_sort_time(reply, default: datetime) -> datetime:
+    """获取回复用于排序的时间
+
+    带时区的时间可以直接比较，排序时无需转换到本地时区；
+    不带时区的时间按本地时区处理，保证与带时区的时间可比较。
+
+    Args:
+        reply: FeedMessage 对象
+        default: 没有时间时使用的默认值（带时区）
+
+    Returns:
+        带时区的 datetime 对象
+    """
+    reply_time = reply.received_at
+    if not isinstance(reply_time, datetime):
+        return default
+    if reply_time.tzinfo:
+        return reply_time
+    return reply_time.replace(tzinfo=LOCAL_TZ)
+
+
+@lru_cache(maxsize=4096)
 def _extract_message_id_from_header(in_reply_to_header: Optional[str]) -> Optional[str]:
     """从 in_reply_to_header 中提取 message_id
 
-    处理可能包含尖括号、多个 message_id 等情况
+    处理可能包含尖括号、多个 message_id 等情况。
+    同一个 in_reply_to 头会在多条回复中反复出现，结果按原始头部缓存。
 
     Args:
         in_reply_to_header: in_reply_to 头部值
@@ -67,26 +110,37 @@ def _extract_message_id_from_header(in_reply_to_header: Optional[str]) -> Option
     if not in_reply_to_header:
         return None
 
-    # 移除尖括号
     cleaned = in_reply_to_header.strip()
-    if cleaned.startswith("<") and cleaned.endswith(">"):
-        cleaned = cleaned[1:-1]
+    if not cleaned:
+        return None
+
+    # 带尖括号：直接取第一个 <...> 中的内容
+    # 如果包含多个 message_id，通常第一个是主要的回复目标
+    if cleaned[0] == "<":
+        end = cleaned.find(">")
+        if end > 0:
+            return cleaned[1:end].strip() or None
+        cleaned = cleaned[1:]
 
-    # 如果包含多个 message_id（用空格或逗号分隔），取第一个
-    # 通常第一个是主要的回复目标
-    parts = cleaned.split()
-    if parts:
-        return parts[0].strip()
+    # 不带尖括号：取第一个空白分隔的部分
+    parts = cleaned.split(None, 1)
+    return parts[0] if parts else None
 
-    return cleaned if cleaned else None
 
+def _normalize_message_id(message_id: str) -> str:
+    """规范化 message_id（去除空白和尖括号），用于回复索引的键"""
+    return message_id.strip().strip("<>")
 
-async def _find_parent_reply_in_list(  # pylint: disable=too-many-return-statements
+
+async def _find_parent_reply_in_list(  # pylint: disable=too-many-return-statements,too-many-arguments
     session,
     in_reply_to: str,
     reply_map: Dict[str, ReplyMapEntry],
     patch_message_id: str,
     max_depth: int = 5,
+    normalized_index: Optional[Dict[str, str]] = None,
+    resolution_cache: Optional[Dict[str, Optional[str]]] = None,
+    message_cache: Optional[Dict[str, Optional[RepoFeedMessageData]]] = None,
 ) -> Optional[str]:
     """在回复列表中查找父回复
 
@@ -98,6 +152,10 @@ async def _find_parent_reply_in_list(  # pylint: disable=too-many-return-stateme
         reply_map: 回复映射字典
         patch_message_id: PATCH 的 message_id
         max_depth: 最大递归深度
+        normalized_index: 规范化 message_id -> reply_map 键 的索引（可选，未提供时现场构建）
+        resolution_cache: message_id -> 已解析出的父回复 的缓存（可选，
+            同一次层级构建中共享 in_reply_to 链的回复只需解析一次）
+        message_cache: message_id -> 数据库消息 的缓存（可选，可预先批量填充）
 
     Returns:
         父回复的 message_id_header，如果找不到则返回 None
@@ -118,28 +176,101 @@ async def _find_parent_reply_in_list(  # pylint: disable=too-many-return-stateme
     if extracted_id in reply_map:
         return extracted_id
 
-    # 尝试模糊匹配（处理带尖括号等情况）
-    for reply_id in reply_map:
-        if extracted_id in reply_id or reply_id in extracted_id:
-            return reply_id
+    # 通过规范化索引匹配（处理带尖括号等情况）
+    if normalized_index is None:
+        normalized_index = {
+            _normalize_message_id(reply_id): reply_id for reply_id in reply_map
+        }
+    reply_id = normalized_index.get(_normalize_message_id(extracted_id))
+    if reply_id is not None:
+        return reply_id
+
+    if resolution_cache is not None and extracted_id in resolution_cache:
+        return resolution_cache[extracted_id]
 
     # 如果找不到，递归查找 in_reply_to 链
-    feed_message_repo = FeedMessageRepository(session)
-    feed_msg = await feed_message_repo.find_by_message_id_header(extracted_id)
+    if message_cache is not None and extracted_id in message_cache:
+        feed_msg = message_cache[extracted_id]
+    else:
+        feed_message_repo = FeedMessageRepository(session)
+        feed_msg = await feed_message_repo.find_by_message_id_header(extracted_id)
+        if message_cache is not None:
+            message_cache[extracted_id] = feed_msg
+
+    parent_id = None
     if feed_msg and feed_msg.in_reply_to_header:
-        return await _find_parent_reply_in_list(
+        parent_id = await _find_parent_reply_in_list(
             session,
             feed_msg.in_reply_to_header,
             reply_map,
             patch_message_id,
             max_depth - 1,
+            normalized_index,
+            resolution_cache,
+            message_cache,
+        )
+
+    if resolution_cache is not None:
+        resolution_cache[extracted_id] = parent_id
+    return parent_id
+
+
+async def _prefetch_reply_ancestors(
+    session,
+    in_reply_to_ids: List[Optional[str]],
+    normalized_index: Dict[str, str],
+    patch_message_ids: List[str],
+    message_cache: Dict[str, Optional[RepoFeedMessageData]],
+    max_depth: int = 5,
+) -> None:
+    """批量预取回复列表之外的 in_reply_to 祖先消息
+
+    按层向上查找：每层把所有未命中回复列表（且不在缓存中）的 in_reply_to
+    合并为一次批量查询，最多 max_depth 层（与 _find_parent_reply_in_list 的递归深度一致）。
+
+    Args:
+        session: 数据库会话
+        in_reply_to_ids: 各回复已提取的 in_reply_to message_id（根回复为 None）
+        normalized_index: 规范化 message_id -> reply_map 键 的索引
+        patch_message_ids: PATCH 的 message_id 列表（回复 PATCH 的链到此为止）
+        message_cache: message_id -> 数据库消息（不存在为 None）的缓存，预取结果写入其中
+        max_depth: 最多向上查找的层数
+    """
+
+    def _needs_lookup(message_id: Optional[str]) -> bool:
+        return bool(
+            message_id
+            and not any(patch_id in message_id for patch_id in patch_message_ids)
+            and _normalize_message_id(message_id) not in normalized_index
         )
 
-    return None
+    pending = {
+        message_id for message_id in in_reply_to_ids if _needs_lookup(message_id)
+    }
+    feed_message_repo = FeedMessageRepository(session)
+
+    for _ in range(max_depth):
+        pending.difference_update(message_cache)
+        if not pending:
+            break
+
+        found = await feed_message_repo.find_by_message_id_headers(list(pending))
+        next_pending = set()
+        for message_id in pending:
+            feed_msg = found.get(message_id)
+            message_cache[message_id] = feed_msg
+            if feed_msg and feed_msg.in_reply_to_header:
+                parent_id = _extract_message_id_from_header(feed_msg.in_reply_to_header)
+                if _needs_lookup(parent_id):
+                    next_pending.add(parent_id)
+        pending = next_pending
 
 
 async def build_reply_hierarchy_internal(
-    session, patch_replies: list, patch_message_id: str
+    session,
+    patch_replies: list,
+    patch_message_id: str,
+    message_cache: Optional[Dict[str, Optional[RepoFeedMessageData]]] = None,
 ) -> ReplyHierarchy:
     """构建回复层级关系
 
@@ -147,64 +278,181 @@ async def build_reply_hierarchy_internal(
 
     Args:
         session: 数据库会话
-        patch_replies: 回复列表（应该已经按时间正序排序）
+        patch_replies: 回复列表（任意顺序，内部按时间正序排序）
         patch_message_id: PATCH 的 message_id
+        message_cache: message_id -> 数据库消息 的缓存（可选，可在多次调用间共享）
 
     Returns:
         回复层级结构
     """
-    # 构建回复映射
+    # 按时间正序（稳定排序，无法解析时间的排在最前）统一排序一次，
+    # 按此顺序追加的根回复和各回复的子回复天然有序
+    earliest = datetime.min.replace(tzinfo=LOCAL_TZ)
+    ordered_replies = sorted(
+        patch_replies, key=lambda reply: _reply_sort_time(reply, earliest)
+    )
+
     reply_map: Dict[str, ReplyMapEntry] = {}
     root_replies: List[str] = []
+    # 规范化 message_id 索引，父回复查找时 O(1) 命中，避免逐个扫描 reply_map
+    normalized_index: Dict[str, str] = {}
+    # 父回复尚未出现在列表中的回复，遍历结束后再沿 in_reply_to 链解析
+    pending: List[tuple] = []
+
+    # 单遍构建回复映射和层级关系：父回复通常早于子回复，已出现时直接挂到父回复下
+    for reply in ordered_replies:
+        reply_id = reply.message_id_header
+        reply_map[reply_id] = ReplyMapEntry(reply=reply, children=[])
+        normalized_index[_normalize_message_id(reply_id)] = reply_id
+
+        # 提取 in_reply_to 的 message_id（处理尖括号、多个 message_id 等情况）
+        in_reply_to = _extract_message_id_from_header(reply.in_reply_to_header)
+        if not in_reply_to or patch_message_id in in_reply_to:
+            # 没有 in_reply_to、无法提取或直接回复 PATCH，作为根回复
+            root_replies.append(reply_id)
+            continue
 
-    for reply in patch_replies:
-        reply_map[reply.message_id_header] = ReplyMapEntry(reply=reply, children=[])
+        parent_id = normalized_index.get(_normalize_message_id(in_reply_to))
+        if parent_id is not None:
+            reply_map[parent_id].children.append(reply_id)
+        else:
+            pending.append((reply_id, in_reply_to))
 
-    # 构建层级关系
-    for reply in patch_replies:
-        in_reply_to_raw = reply.in_reply_to_header
-        if not in_reply_to_raw:
-            # 没有 in_reply_to，作为根回复
-            root_replies.append(reply.message_id_header)
-            continue
+    if pending:
+        await _resolve_pending_replies(
+            session,
+            pending,
+            reply_map,
+            root_replies,
+            normalized_index,
+            patch_message_id,
+            message_cache,
+            earliest,
+        )
 
-        # 提取 message_id（处理尖括号、多个 message_id 等情况）
-        in_reply_to = _extract_message_id_from_header(in_reply_to_raw)
+    return ReplyHierarchy(reply_map=reply_map, root_replies=root_replies)
 
-        if not in_reply_to:
-            # 无法提取 message_id，作为根回复
-            root_replies.append(reply.message_id_header)
-            continue
 
-        # 检查是否是直接回复 PATCH
-        if in_reply_to == patch_message_id or patch_message_id in in_reply_to:
-            root_replies.append(reply.message_id_header)
-            continue
+async def _resolve_pending_replies(  # pylint: disable=too-many-arguments
+    session,
+    pending: List[tuple],
+    reply_map: Dict[str, ReplyMapEntry],
+    root_replies: List[str],
+    normalized_index: Dict[str, str],
+    patch_message_id: str,
+    message_cache: Optional[Dict[str, Optional[RepoFeedMessageData]]],
+    earliest: datetime,
+) -> None:
+    """沿 in_reply_to 链解析父回复未出现在列表中的回复，挂到父回复下或作为根回复
+
+    Args:
+        session: 数据库会话
+        pending: (回复 message_id, 已提取的 in_reply_to) 列表
+        reply_map: 回复映射字典（原地更新子回复列表）
+        root_replies: 根回复列表（原地追加）
+        normalized_index: 规范化 message_id -> reply_map 键 的索引
+        patch_message_id: PATCH 的 message_id
+        message_cache: message_id -> 数据库消息 的缓存（可选）
+        earliest: 没有时间的回复排序时使用的默认时间
+    """
+    # 共享 in_reply_to 链的兄弟回复只解析一次，链上的祖先消息按层批量预取
+    resolution_cache: Dict[str, Optional[str]] = {}
+    if message_cache is None:
+        message_cache = {}
+    await _prefetch_reply_ancestors(
+        session,
+        [in_reply_to for _, in_reply_to in pending],
+        normalized_index,
+        [patch_message_id],
+        message_cache,
+    )
 
+    touched_parent_ids = set()
+    has_late_roots = False
+    for reply_id, in_reply_to in pending:
         # 查找父回复（递归查找 in_reply_to 链）
         parent_id = await _find_parent_reply_in_list(
-            session, in_reply_to_raw, reply_map, patch_message_id
+            session,
+            in_reply_to,
+            reply_map,
+            patch_message_id,
+            normalized_index=normalized_index,
+            resolution_cache=resolution_cache,
+            message_cache=message_cache,
         )
 
         if parent_id:
             # 找到父回复，作为子回复
-            reply_map[parent_id].children.append(reply.message_id_header)
+            reply_map[parent_id].children.append(reply_id)
+            touched_parent_ids.add(parent_id)
         else:
             # 找不到父回复，作为根回复处理
-            root_replies.append(reply.message_id_header)
+            root_replies.append(reply_id)
+            has_late_roots = True
 
-    # 对根回复按时间正序排序
-    root_replies.sort(
-        key=lambda rid: parse_reply_time(reply_map[rid].reply) or datetime.min
-    )
+    # 延后解析的回复追加在列表末尾，只对受影响的列表按时间重新排序
+    def _sort_key(rid: str) -> datetime:
+        return _reply_sort_time(reply_map[rid].reply, earliest)
 
-    # 对每个回复的子回复也按时间正序排序
-    for reply_entry in reply_map.values():
-        reply_entry.children.sort(
-            key=lambda cid: parse_reply_time(reply_map[cid].reply) or datetime.min
-        )
+    if has_late_roots:
+        root_replies.sort(key=_sort_key)
+    for parent_id in touched_parent_ids:
+        reply_map[parent_id].children.sort(key=_sort_key)
 
-    return ReplyHierarchy(reply_map=reply_map, root_replies=root_replies)
+
+class _PatchReplyTraversal:
+    """单个 Patch 的 REPLY 广度优先查找状态
+
+    按层展开：take_level 取出当前层待查的消息，add_replies 收集这些消息的直接 REPLY
+    并生成下一层。去重和展开上限只在本 Patch 内生效，与其他 Patch 互不影响。
+    """
+
+    __slots__ = ("replies", "_included", "_checked", "_pending", "_expanded")
+
+    def __init__(self, patch_message_id: str):
+        self.replies: List[FeedMessage] = []
+        self._included: set = set()
+        self._checked: set = set()
+        self._pending: List[str] = [patch_message_id]
+        self._expanded = 0
+
+    @property
+    def finished(self) -> bool:
+        """没有待查的消息时查找结束"""
+        return not self._pending
+
+    def take_level(self, max_expanded: int) -> List[str]:
+        """取出当前层待查的消息（跳过已查过的，总展开数不超过 max_expanded）"""
+        level: List[str] = []
+        for message_id in self._pending:
+            if message_id in self._checked:
+                continue
+            if self._expanded + len(level) >= max_expanded:
+                break
+            self._checked.add(message_id)
+            level.append(message_id)
+        self._expanded += len(level)
+        self._pending = []
+        return level
+
+    def add_replies(
+        self,
+        level: List[str],
+        replies_by_parent: Dict[str, List[RepoFeedMessageData]],
+    ) -> None:
+        """收集当前层消息的直接 REPLY，新出现的 REPLY 作为下一层待查消息"""
+        next_level: List[str] = []
+        for message_id in level:
+            for reply_data in replies_by_parent[message_id]:
+                reply_id = reply_data.message_id_header
+                if reply_id in self._included:
+                    continue
+                self.replies.append(_repo_data_to_feed_message(reply_data))
+                self._included.add(reply_id)
+                # 将这个 REPLY 加入下一层，以便查找回复它的 REPLY
+                if reply_id not in self._checked:
+                    next_level.append(reply_id)
+        self._pending = next_level
 
 
 # ========== ThreadService 类 ==========
@@ -233,6 +481,25 @@ class ThreadService:
         self.patch_thread_repo = patch_thread_repo
         self.patch_card_repo = patch_card_repo
         self.feed_message_repo = feed_message_repo
+        # 单次请求内共享的 message_id -> 数据库消息 缓存（由 _message_cache_scope 管理）
+        self._message_cache: Optional[Dict[str, Optional[RepoFeedMessageData]]] = None
+
+    @contextmanager
+    def _message_cache_scope(self):
+        """在作用域内启用 Feed 消息查找缓存
+
+        作用域内多次构建回复层级时，同一个祖先消息只查询一次数据库。
+        支持嵌套：只有最外层作用域负责创建和清理缓存。
+        """
+        if self._message_cache is not None:
+            yield
+            return
+
+        self._message_cache = {}
+        try:
+            yield
+        finally:
+            self._message_cache = None
 
     def _repo_data_to_service_feed_message(self, repo_data) -> FeedMessage:
         """将 repo 层的 FeedMessageData 转换为 service 层的 FeedMessage
@@ -243,22 +510,16 @@ class ThreadService:
         Returns:
             service 层的 FeedMessage
         """
-        from ..db.repo import FeedMessageData
+        if isinstance(repo_data, RepoFeedMessageData):
+            return _repo_data_to_feed_message(repo_data)
 
         # 如果已经是 FeedMessage，直接返回（防御性检查）
         if isinstance(repo_data, FeedMessage):
             return repo_data
 
-        # 确保是 FeedMessageData 类型
-        if not isinstance(repo_data, FeedMessageData):
-            raise TypeError(
-                f"Expected FeedMessageData or FeedMessage, got {type(repo_data)}"
-            )
-
-        from .helpers import extract_common_feed_message_fields
-
-        common_fields = extract_common_feed_message_fields(repo_data)
-        return FeedMessage(**common_fields)
+        raise TypeError(
+            f"Expected FeedMessageData or FeedMessage, got {type(repo_data)}"
+        )
 
     def _repo_data_to_service_data(self, repo_data: RepoPatchThreadData) -> PatchThread:
         """将 repo 层的 PatchThreadData 转换为 service 层的 PatchThread
@@ -434,7 +695,42 @@ class ThreadService:
         # 获取 session（从 repository）
         session = self.feed_message_repo.session
         return await build_reply_hierarchy_internal(
-            session, patch_replies, patch_message_id
+            session, patch_replies, patch_message_id, self._message_cache
+        )
+
+    async def _prefetch_reply_ancestors_for_patches(
+        self, replies_by_patch: Dict[str, List[FeedMessage]]
+    ) -> None:
+        """为多个 Patch 的回复合并预取 in_reply_to 祖先消息到请求级缓存
+
+        所有 Patch 的回复按层合并为批量查询，之后逐个 Patch 构建回复层级时
+        祖先消息直接从缓存读取。需要在 _message_cache_scope 作用域内调用。
+
+        Args:
+            replies_by_patch: {patch_message_id: 该 Patch 的所有 REPLY 列表}
+        """
+        if self._message_cache is None:
+            return
+
+        all_replies = [
+            reply
+            for patch_replies in replies_by_patch.values()
+            for reply in patch_replies
+        ]
+        normalized_index = {
+            _normalize_message_id(reply.message_id_header): reply.message_id_header
+            for reply in all_replies
+        }
+        in_reply_to_ids = [
+            _extract_message_id_from_header(reply.in_reply_to_header)
+            for reply in all_replies
+        ]
+        await _prefetch_reply_ancestors(
+            self.feed_message_repo.session,
+            in_reply_to_ids,
+            normalized_index,
+            list(replies_by_patch),
+            self._message_cache,
         )
 
     async def update_sub_patch_messages(
@@ -453,11 +749,12 @@ class ThreadService:
             thread_id, sub_patch_messages
         )
 
-    async def _prepare_single_patch_overview(self, patch):
+    async def _prepare_single_patch_overview(self, patch, patch_replies=None):
         """为单个 Patch 准备 overview 数据
 
         Args:
             patch: Patch 对象（SeriesPatchInfo）
+            patch_replies: 该 Patch 的所有回复（可选，未提供时查询数据库）
 
         Returns:
             SubPatchOverviewData 对象，失败返回 None
@@ -465,7 +762,8 @@ class ThreadService:
         from .types import SubPatchOverviewData
 
         try:
-            patch_replies = await self.get_all_replies_for_patch(patch.message_id)
+            if patch_replies is None:
+                patch_replies = await self.get_all_replies_for_patch(patch.message_id)
             patch_reply_hierarchy = await self.build_reply_hierarchy(
                 patch_replies, patch.message_id
             )
@@ -495,49 +793,77 @@ class ThreadService:
         Returns:
             该 Patch 的所有 REPLY 列表（包括 REPLY 的 REPLY）
         """
-        try:
-            # 使用递归方式查找所有回复（包括间接回复）
-            all_replies = []
-            message_ids_to_check = [patch_message_id]
-            checked_message_ids = set()
-            max_iterations = 20  # 防止无限循环
-
-            iteration = 0
-            while message_ids_to_check and iteration < max_iterations:
-                iteration += 1
-                current_message_id = message_ids_to_check.pop(0)
-
-                # 避免重复检查
-                if current_message_id in checked_message_ids:
-                    continue
-                checked_message_ids.add(current_message_id)
+        replies_by_patch = await self.get_all_replies_for_patches([patch_message_id])
+        return replies_by_patch[patch_message_id]
 
-                # 查找直接回复当前消息的所有 REPLY
-                direct_replies = await self.feed_message_repo.find_replies_to(
-                    current_message_id, limit=100
-                )
+    async def get_all_replies_for_patches(
+        self, patch_message_ids: List[str]
+    ) -> Dict[str, List[FeedMessage]]:
+        """批量获取多个 Patch 的所有 REPLY（包括 REPLY 的 REPLY）
 
-                # 转换为 Service 层的 FeedMessage
-                for reply_data in direct_replies:
-                    reply = self._repo_data_to_service_feed_message(reply_data)
-
-                    # 如果这个 REPLY 还没有被添加到列表中，添加它
-                    if not any(
-                        r.message_id_header == reply.message_id_header
-                        for r in all_replies
-                    ):
-                        all_replies.append(reply)
-                        # 将这个 REPLY 的 message_id 加入待检查列表，以便查找回复它的 REPLY
-                        if reply.message_id_header not in checked_message_ids:
-                            message_ids_to_check.append(reply.message_id_header)
-
-            return all_replies
-        except (RuntimeError, ValueError, AttributeError) as e:
-            logger.error(
-                f"Failed to get all replies for patch {patch_message_id}: {e}",
-                exc_info=True,
+        每个 Patch 各自按层广度优先查找（去重和展开上限互不影响），
+        但同一层中所有 Patch 的待查消息合并为一次批量查询。
+        Series 的查询次数只取决于回复层级深度，与子 Patch 数量无关。
+
+        Args:
+            patch_message_ids: Patch 的 message_id_header 列表
+
+        Returns:
+            {patch_message_id: 该 Patch 的所有 REPLY 列表}
+        """
+        max_iterations = 20  # 每个 Patch 最多展开的消息数，防止无限循环
+
+        traversals = {
+            patch_id: _PatchReplyTraversal(patch_id) for patch_id in patch_message_ids
+        }
+        active = list(traversals.items())
+
+        while active:
+            # 取出每个 Patch 的当前层
+            current_levels = [
+                (patch_id, traversal, traversal.take_level(max_iterations))
+                for patch_id, traversal in active
+            ]
+            current_levels = [item for item in current_levels if item[2]]
+            if not current_levels:
+                break
+
+            # 一次查询所有 Patch 当前层消息的直接 REPLY
+            requested_ids = list(
+                dict.fromkeys(
+                    message_id for _, _, level in current_levels for message_id in level
+                )
             )
-            return []
+            try:
+                replies_by_parent = await self.feed_message_repo.find_replies_to_many(
+                    requested_ids, limit=100
+                )
+            except (RuntimeError, ValueError, AttributeError) as e:
+                # 本层查询失败：保留已经收集到的 REPLY，停止继续展开
+                logger.error(
+                    f"Failed to query replies of {len(requested_ids)} message(s) "
+                    f"for patches {[patch_id for patch_id, _, _ in current_levels]}: {e}",
+                    exc_info=True,
+                )
+                break
+
+            active = []
+            for patch_id, traversal, level in current_levels:
+                try:
+                    traversal.add_replies(level, replies_by_parent)
+                except (RuntimeError, ValueError, AttributeError) as e:
+                    # 单个 Patch 处理失败只停止该 Patch 的展开，不影响其他 Patch
+                    logger.error(
+                        f"Failed to collect replies for patch {patch_id}: {e}",
+                        exc_info=True,
+                    )
+                    continue
+                if not traversal.finished:
+                    active.append((patch_id, traversal))
+
+        return {
+            patch_id: traversal.replies for patch_id, traversal in traversals.items()
+        }
 
     async def prepare_thread_overview_data(
         self, message_id_header: str, patch_card_service=None
@@ -593,12 +919,20 @@ class ThreadService:
                 )
                 return None
 
-            # 3. 为每个 Patch 准备独立的 overview 数据
+            # 3. 一次性批量获取所有 Patch 的回复，再为每个 Patch 准备独立的 overview 数据
+            replies_by_patch = await self.get_all_replies_for_patches(
+                [patch.message_id for patch in patches_to_process]
+            )
             sub_patch_overviews = []
-            for patch in patches_to_process:
-                overview = await self._prepare_single_patch_overview(patch)
-                if overview:
-                    sub_patch_overviews.append(overview)
+            with self._message_cache_scope():
+                # 先为所有 Patch 一次性批量预取祖先消息，逐个构建层级时直接命中缓存
+                await self._prefetch_reply_ancestors_for_patches(replies_by_patch)
+                for patch in patches_to_process:
+                    overview = await self._prepare_single_patch_overview(
+                        patch, replies_by_patch[patch.message_id]
+                    )
+                    if overview:
+                        sub_patch_overviews.append(overview)
 
             # 4. 构建 ThreadOverviewData
             # 注意：replies 和 reply_hierarchy 字段保留用于兼容，但实际使用 sub_patch_overviews
@@ -4,7 +4,7 @@
 避免上层直接依赖 db 和 repo 层的数据结构。
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 
@@ -12,7 +12,7 @@ from typing import Optional, List, Dict, Any
 # 这样 plugins 层就不需要直接依赖 lkml.db.models
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SeriesPatchInfo:
     """系列 PATCH 信息（Service 层）
 
@@ -26,7 +26,7 @@ class SeriesPatchInfo:
     url: str
 
 
-@dataclass
+@dataclass(slots=True)
 class PatchCard:
     """PATCH 卡片数据（Service 层）"""
 
@@ -57,8 +57,26 @@ class PatchCard:
         None  # 匹配的过滤规则名称列表（用于高亮显示）
     )
 
+    # 子 PATCH 索引缓存：(构建时的 series_patches, {message_id: SeriesPatchInfo})
+    _series_patch_index: Optional[tuple] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
-@dataclass
+    def series_patch_index(self) -> Dict[str, SeriesPatchInfo]:
+        """按 message_id 索引的系列子 PATCH（按需构建，series_patches 被替换后自动重建）"""
+        cached = self._series_patch_index
+        if cached is None or cached[0] is not self.series_patches:
+            index = {
+                patch.message_id: patch
+                for patch in self.series_patches or ()
+                if patch.message_id
+            }
+            cached = (self.series_patches, index)
+            self._series_patch_index = cached
+        return cached[1]
+
+
+@dataclass(slots=True, frozen=True)
 class FeedMessage:
     """Feed 消息数据（Service 层）"""
 
@@ -85,7 +103,7 @@ class FeedMessage:
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class PatchThread:
     """PATCH Thread 数据（Service 层）"""
 
@@ -99,7 +117,7 @@ class PatchThread:
     archived_at: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ReplyMapEntry:
     """回复映射条目
 
@@ -110,7 +128,7 @@ class ReplyMapEntry:
     children: List[str]  # 子回复的 message_id_header 列表
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ReplyHierarchy:
     """回复层级结构
 
@@ -121,7 +139,7 @@ class ReplyHierarchy:
     root_replies: List[str]  # 根回复的 message_id_header 列表
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SubPatchOverviewData:
     """单个子 PATCH 的 Overview 数据（供 Plugins 层渲染使用）
 
@@ -136,7 +154,7 @@ class SubPatchOverviewData:
     reply_hierarchy: ReplyHierarchy  # 该 PATCH 的回复层级结构
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ThreadOverviewData:
     """Thread Overview 渲染数据（供 Plugins 层渲染使用）
 
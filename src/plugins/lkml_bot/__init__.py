@@ -10,6 +10,7 @@
   - `.commands.run_monitor`
 """
 
+import os
 import sys
 import logging
 from pathlib import Path
@@ -18,21 +19,23 @@ from nonebot import get_driver
 from nonebot.log import logger, LoguruHandler
 
 # 1) 环境与路径
+# src 目录（src/plugins/lkml_bot/__init__.py 向上三级）和项目根目录下的 .env
+_SRC_DIR = os.fspath(Path(__file__).parents[2])
+_ENV_FILE = os.path.join(os.path.dirname(_SRC_DIR), ".env")
+
 # 加载 .env 文件（如果存在）
 try:
     from dotenv import load_dotenv
 
-    env_path = Path(__file__).parent.parent.parent.parent / ".env"
-    if env_path.exists():
-        load_dotenv(env_path)
+    if os.path.exists(_ENV_FILE):
+        load_dotenv(_ENV_FILE)
 except ImportError:
     # dotenv 未安装，跳过
     pass
 
 # 将 src 目录添加到 Python 路径，以便导入 lkml
-src_path = Path(__file__).parent.parent.parent
-if str(src_path) not in sys.path:
-    sys.path.insert(0, str(src_path))
+if _SRC_DIR not in sys.path:
+    sys.path.insert(0, _SRC_DIR)
 
 # 2) 基础设施装配（配置、数据库）
 # 注意：这些导入在 sys.path 修改之后，是必要的，因此使用 pylint 注释禁用相关警告
@@ -40,6 +43,9 @@ if str(src_path) not in sys.path:
 # pylint: disable=wrong-import-position
 from lkml.config import set_config  # noqa: E402
 from lkml.db import set_database, LKMLDatabase, Base  # noqa: E402
+from lkml.feed.cc_fetcher import (  # noqa: E402
+    aclose_http_client as aclose_cc_fetcher_client,
+)
 from lkml.feed.feed import FeedProcessor  # noqa: E402
 from lkml.feed.feed_monitor import LKMLFeedMonitor  # noqa: E402
 from lkml.feed.vger_subsystems import (
@@ -82,6 +88,7 @@ from .renders.patch_card import FeishuPatchCardRenderer
 from .renders.thread.feishu_render import FeishuThreadOverviewRenderer
 from .client.discord_client import DiscordClient
 from .client.feishu_client import FeishuClient
+from .client.http_pool import aclose_http_client
 from .multi_platform_sender import MultiPlatformPatchCardSender
 
 patch_card_renderer = PatchCardRenderer(config=plugin_config)
@@ -147,6 +154,7 @@ scheduler.monitor = monitor
 # 将调度器注册到 lkml 层
 # pylint: disable=wrong-import-order,wrong-import-position,import-outside-toplevel
 from lkml.scheduler import (
+    get_scheduler,
     set_scheduler,
 )
 
@@ -230,9 +238,6 @@ async def auto_start_monitoring():
         logger.error(f"Failed to initialize vger subsystems cache: {e}", exc_info=True)
 
     try:
-        # pylint: disable=import-outside-toplevel  # noqa: E402
-        from lkml.scheduler import get_scheduler
-
         current_scheduler = get_scheduler()
         if not current_scheduler.is_running:
             logger.info("Auto-starting LKML monitoring scheduler on bot startup")
@@ -247,12 +252,20 @@ async def auto_start_monitoring():
 async def auto_stop_monitoring():
     """在 bot 关闭时停止监控任务"""
     try:
-        # pylint: disable=import-outside-toplevel
-        from lkml.scheduler import get_scheduler
-
         current_scheduler = get_scheduler()
         if current_scheduler.is_running:
             logger.info("Stopping LKML monitoring scheduler on bot shutdown")
             await current_scheduler.stop()
     except (RuntimeError, ValueError, AttributeError) as e:
         logger.error(f"Failed to stop monitoring scheduler: {e}", exc_info=True)
+
+
+@driver.on_shutdown
+async def close_http_clients():
+    """在 bot 关闭时关闭复用的 HTTP 客户端"""
+    try:
+        await aclose_http_client()
+        await feishu_client.aclose()
+        await aclose_cc_fetcher_client()
+    except (RuntimeError, ValueError, AttributeError) as e:
+        logger.error(f"Failed to close HTTP clients: {e}", exc_info=True)
@@ -3,17 +3,12 @@
 负责将邮件列表更新消息发送到 Discord 平台。
 """
 
-try:
-    import httpx  # pylint: disable=unused-import
-except ImportError:
-    httpx = None  # pylint: disable=unused-variable
-
 from nonebot.log import logger
 
 from lkml.feed import SubsystemUpdate
 
 from ..config import get_config
-from ..renders import DiscordRenderer
+from ..renders.discord_render import DiscordRenderer
 from .message_adapter import MessageAdapter
 
 
@@ -24,6 +19,8 @@ class DiscordAdapter(MessageAdapter):
     支持 Thread 模式：PATCH 发送订阅卡片，REPLY 发送到对应 Thread。
     """
 
+    __slots__ = ("config", "renderer", "database")
+
     def __init__(self, database=None):
         """初始化 Discord 适配器
 
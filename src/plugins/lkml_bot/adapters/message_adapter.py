@@ -1,17 +1,18 @@
 """消息适配器基类"""
 
-from abc import ABC, abstractmethod
+from typing import Protocol
 
 from lkml.feed import SubsystemUpdate
 
 
-class MessageAdapter(ABC):  # pylint: disable=too-few-public-methods
-    """消息适配器抽象基类
+class MessageAdapter(Protocol):  # pylint: disable=too-few-public-methods
+    """消息适配器接口
 
-    这是抽象基类，只定义核心接口方法。
+    使用结构化 Protocol 只声明核心接口方法，不引入 ABC 元类开销。
     """
 
-    @abstractmethod
+    __slots__ = ()
+
     async def send_subsystem_update(
         self, subsystem: str, update_data: SubsystemUpdate
     ) -> None:
@@ -3,8 +3,8 @@
 提供 Discord REST API 的底层封装。
 """
 
-from .discord_client import (
-    send_discord_embed,
+from .discord_client import send_discord_embed
+from .discord_thread import (
     create_discord_thread,
     check_thread_exists,
     get_existing_thread_id,
@@ -13,15 +13,19 @@ class PatchCardClient(ABC):
     所有平台都必须实现这个接口，用于发送 Patch Card。
     """
 
+    __slots__ = ()
+
     @abstractmethod
-    async def send_patch_card(self, rendered_data: Any) -> Optional[str]:
+    async def send_patch_card(
+        self, rendered_data: Any
+    ) -> Tuple[Optional[str], Optional[str]]:
         """发送 Patch Card
 
         Args:
             rendered_data: 渲染后的数据（平台特定格式）
 
         Returns:
-            平台消息 ID，失败返回 None
+            (平台消息 ID, 平台频道 ID)，失败或平台不返回 ID 时为 (None, None)
         """
         raise NotImplementedError(
             "PatchCardClient.send_patch_card must be implemented by subclasses"
@@ -35,6 +39,8 @@ class ThreadClient(ABC):
     不支持 Thread 的平台可以实现为发送通知卡片（如 Feishu）。
     """
 
+    __slots__ = ()
+
     @abstractmethod
     async def create_thread(
         self, thread_name: str, message_id: str
@@ -79,13 +85,16 @@ class ThreadClient(ABC):
     ) -> bool:
         """更新 Thread Overview（或发送 Thread 更新通知卡片）
 
+        不支持 Thread 的平台可以把通知放入发送队列后立即返回（如 Feishu 合并短时间内的
+        重复通知），此时返回值只表示通知已被接受，发送失败由实现方记录日志。
+
         Args:
             thread_id: Thread ID（对于不支持 Thread 的平台，可以是任意标识符）
             message_id: 要更新的消息 ID（对于不支持 Thread 的平台，可以忽略）
             overview_data: Thread Overview 数据
 
         Returns:
-            成功返回 True，失败返回 False
+            成功（或已加入发送队列）返回 True，失败返回 False
         """
         raise NotImplementedError(
             "ThreadClient.update_thread_overview must be implemented by subclasses"
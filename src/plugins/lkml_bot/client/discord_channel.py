@@ -1,78 +1,278 @@
 """Discord 频道消息发送工具"""
 
 import asyncio
-from typing import Optional
+import time
+from functools import lru_cache
+from typing import Dict, Optional
 
 import httpx
 from nonebot.log import logger
 
 from .discord_client import truncate_description
+from .http_pool import get_http_client
+from .json_codec import dumps_json, loads_json
 
+# 视为发送成功的 HTTP 状态码
+_OK_STATUSES = frozenset((200, 201))
 
-def _build_channel_headers(config) -> dict:
-    """构建 Discord 请求头"""
+
+@lru_cache(maxsize=4)
+def _channel_headers(bot_token: str) -> dict:
+    """按 token 缓存的 Discord 请求头（只读，调用方不要修改）"""
     return {
-        "Authorization": f"Bot {config.discord_bot_token}",
+        "Authorization": f"Bot {bot_token}",
         "Content-Type": "application/json",
     }
 
 
+@lru_cache(maxsize=4)
+def _channel_url(channel_id: str) -> str:
+    """按频道 ID 缓存的 Discord 频道发送 URL"""
+    return f"https://discord.com/api/v10/channels/{channel_id}/messages"
+
+
+def _build_channel_headers(config) -> dict:
+    """构建 Discord 请求头"""
+    return _channel_headers(config.discord_bot_token)
+
+
 def _build_channel_url(config) -> str:
     """构建 Discord 频道发送 URL"""
-    return f"https://discord.com/api/v10/channels/{config.platform_channel_id}/messages"
+    return _channel_url(config.platform_channel_id)
+
+
+# 限流器最多记录的路由数和限流桶数（超出时淘汰最早记录的条目）
+_RATE_LIMIT_MAX_ENTRIES = 256
+
+
+class DiscordRateLimiter:
+    """基于 Discord 限流响应头的主动限流器
+
+    记录每个限流桶（X-RateLimit-Bucket）的剩余次数和重置时间，
+    剩余次数用完时在发送前等待到重置时间，避免触发 429。
+    发送前只知道路由（如频道 URL），首次响应后记录路由到限流桶的映射。
+    """
+
+    def __init__(self):
+        # {路由键: 限流桶 ID}
+        self._route_buckets: Dict[str, str] = {}
+        # {限流桶 ID: [剩余次数, 重置时间（monotonic 秒）, 额度上限, 重置周期（秒）]}
+        self._buckets: Dict[str, list] = {}
+        # {限流桶 ID: 锁}，同一限流桶的等待者依次检查，唤醒后不会同时放行；
+        # 只为有限流状态的桶创建，状态丢弃时一并移除
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    def _drop_bucket(self, bucket_id: str) -> None:
+        """丢弃限流桶的状态和锁（持有旧锁的等待者重新检查时会直接放行）"""
+        self._buckets.pop(bucket_id, None)
+        self._locks.pop(bucket_id, None)
+
+    async def acquire(self, route_key: str, deadline: Optional[float] = None) -> bool:
+        """发送前调用：限流桶已用完时等待到重置时间
+
+        Args:
+            route_key: 路由键
+            deadline: 截止时间（monotonic 秒），为 None 时不限制等待时间
+
+        Returns:
+            可以发送返回 True；需要等待到截止时间之后才能发送时返回 False
+        """
+        bucket_id = self._route_buckets.get(route_key, route_key)
+        if bucket_id not in self._buckets:
+            # 没有限流状态时无需加锁
+            return deadline is None or deadline > time.monotonic()
+
+        lock = self._locks.get(bucket_id)
+        if lock is None:
+            lock = self._locks[bucket_id] = asyncio.Lock()
+        async with lock:
+            while True:
+                now = time.monotonic()
+                if deadline is not None and deadline <= now:
+                    return False
+
+                state = self._buckets.get(bucket_id)
+                if state is None:
+                    return True
+
+                remaining, reset_at, limit, reset_after = state
+                if reset_at <= now:
+                    # 已过重置时间：已知额度上限时按新周期重置，否则丢弃状态等待下一次响应刷新
+                    if limit is None:
+                        self._drop_bucket(bucket_id)
+                        return True
+                    state[:] = [limit, now + reset_after, limit, reset_after]
+                    continue
+
+                if remaining > 0:
+                    # 预先占用一次额度，避免并发发送同时越过限制
+                    state[0] = remaining - 1
+                    return True
+
+                wait = reset_at - now
+                if deadline is not None and deadline - now < wait:
+                    logger.debug(
+                        "Discord rate limit bucket {} exhausted, "
+                        "reset in {:.2f}s exceeds deadline",
+                        bucket_id,
+                        wait,
+                    )
+                    return False
+                logger.debug(
+                    "Discord rate limit bucket {} exhausted, waiting {:.2f}s",
+                    bucket_id,
+                    wait,
+                )
+                await asyncio.sleep(wait)
+                # 唤醒后重新检查（期间响应可能已刷新状态）
+
+    def update(self, route_key: str, headers: httpx.Headers) -> None:
+        """收到响应后调用：根据响应头刷新限流桶状态"""
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset_after = headers.get("X-RateLimit-Reset-After")
+        if remaining is None or reset_after is None:
+            return
+
+        bucket_id = headers.get("X-RateLimit-Bucket") or route_key
+        if (
+            route_key not in self._route_buckets
+            and len(self._route_buckets) >= _RATE_LIMIT_MAX_ENTRIES
+        ):
+            del self._route_buckets[next(iter(self._route_buckets))]
+        self._route_buckets[route_key] = bucket_id
+
+        limit = headers.get("X-RateLimit-Limit")
+        try:
+            reset_after_seconds = float(reset_after)
+            self._buckets[bucket_id] = [
+                int(remaining),
+                time.monotonic() + reset_after_seconds,
+                int(limit) if limit is not None else None,
+                reset_after_seconds,
+            ]
+        except ValueError:
+            self._drop_bucket(bucket_id)
+            return
+        if len(self._buckets) > _RATE_LIMIT_MAX_ENTRIES:
+            self._drop_bucket(next(iter(self._buckets)))
+
+
+_RATE_LIMITER = DiscordRateLimiter()
+
+
+def _parse_retry_after(response: httpx.Response) -> float:
+    """从 429 响应头中读取重试等待秒数（无需解析响应体 JSON）"""
+    headers = response.headers
+    value = headers.get("X-RateLimit-Reset-After") or headers.get("Retry-After")
+    try:
+        return float(value) if value else 1.0
+    except ValueError:
+        return 1.0
+
+
+async def _sleep_before_deadline(delay: float, deadline: float) -> bool:
+    """在截止时间内等待重试
+
+    Args:
+        delay: 期望等待的秒数
+        deadline: 截止时间（monotonic 秒）
+
+    Returns:
+        等待后仍有剩余时间可重试返回 True，已到截止时间返回 False
+    """
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        return False
+    await asyncio.sleep(min(delay, remaining))
+    return deadline > time.monotonic()
 
 
 async def _post_embed_with_retries(
-    url_path: str, headers: dict, embed: dict, max_retries: int
+    url_path: str,
+    headers: dict,
+    embed: dict,
+    max_retries: int,
+    total_timeout: float = 60.0,
 ) -> Optional[str]:
-    """发送 embed 请求并处理重试"""
+    """发送 embed 请求并处理重试
+
+    所有重试共享一个总截止时间（total_timeout 秒），重试等待时间会被截断到截止时间内，
+    超过截止时间则放弃重试，保证持续限流时调用耗时有上限。
+    """
     result_message_id: Optional[str] = None
+    deadline = time.monotonic() + total_timeout
+    client = get_http_client()
+    # 请求体只编码一次，重试时复用（headers 中已包含 Content-Type）
+    body = dumps_json({"embeds": [embed]})
     for attempt in range(max_retries):
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(
-                    url_path,
-                    json={"embeds": [embed]},
-                    headers=headers,
-                    timeout=30.0,
+        try:
+            if not await _RATE_LIMITER.acquire(url_path, deadline):
+                logger.warning(
+                    "Discord rate limit wait exceeds total timeout, giving up "
+                    "(attempt {}/{})",
+                    attempt + 1,
+                    max_retries,
                 )
+                break
+            response = await client.post(
+                url_path,
+                content=body,
+                headers=headers,
+                # 单次请求超时同样不超过剩余的总时间
+                timeout=max(0.1, min(30.0, deadline - time.monotonic())),
+            )
+            _RATE_LIMITER.update(url_path, response.headers)
 
-                if response.status_code in {200, 201}:
-                    result = response.json()
-                    result_message_id = result.get("id")
-                    break
-
-                if response.status_code == 429:
-                    retry_after = response.json().get("retry_after", 1.0)
+            if response.status_code in _OK_STATUSES:
+                if "application/json" not in response.headers.get("content-type", ""):
                     logger.warning(
-                        "Discord rate limit hit (429), retry after %ss "
-                        "(attempt %d/%d)",
-                        retry_after,
-                        attempt + 1,
-                        max_retries,
+                        "Unexpected non-JSON response sending channel embed: {}",
+                        response.text,
                     )
-                    if attempt < max_retries - 1:
-                        await asyncio.sleep(retry_after)
-                        continue
                     break
+                result = loads_json(response.content)
+                result_message_id = result.get("id")
+                break
 
-                logger.error(
-                    "Failed to send embed to channel: %s, %s",
-                    response.status_code,
-                    response.text,
+            if response.status_code == 429:
+                retry_after = _parse_retry_after(response)
+                logger.warning(
+                    "Discord rate limit hit (429), retry after {}s (attempt {}/{})",
+                    retry_after,
+                    attempt + 1,
+                    max_retries,
                 )
-                break
-            except httpx.TimeoutException:
-                logger.error("Timeout sending Discord channel embed")
-                if attempt < max_retries - 1:
-                    await asyncio.sleep(1)
+                if attempt < max_retries - 1 and await _sleep_before_deadline(
+                    retry_after, deadline
+                ):
                     continue
                 break
-            except (httpx.HTTPError, RuntimeError) as e:
-                logger.error(
-                    "Error sending Discord channel embed: %s", e, exc_info=True
-                )
-                break
+
+            logger.error(
+                "Failed to send embed to channel: {}, {}",
+                response.status_code,
+                response.text,
+            )
+            break
+        except httpx.TransportError as e:
+            # 超时、连接重置、DNS 失败等网络层错误属于瞬时错误：不记录堆栈，在截止时间内重试
+            logger.warning(
+                "{} sending Discord channel embed: {} (attempt {}/{})",
+                type(e).__name__,
+                e,
+                attempt + 1,
+                max_retries,
+            )
+            if attempt < max_retries - 1 and await _sleep_before_deadline(
+                1.0, deadline
+            ):
+                continue
+            break
+        except (httpx.HTTPError, RuntimeError) as e:
+            logger.opt(exception=True).error(
+                "Error sending Discord channel embed: {}", e
+            )
+            break
 
     return result_message_id
 
@@ -80,9 +280,9 @@ async def _post_embed_with_retries(
 def _build_channel_embed(
     title: str, description: str, url: Optional[str], color: Optional[int]
 ) -> dict:
-    """构建 Discord embed 数据"""
+    """构建 Discord embed 数据（embed 在重试循环外只构建一次）"""
     embed = {
-        "title": title[:256],
+        "title": title if len(title) <= 256 else title[:256],
         "description": truncate_description(description),
         "color": color if color is not None else 0x5865F2,
     }
@@ -98,8 +298,9 @@ async def send_channel_embed(
     url: Optional[str] = None,
     color: Optional[int] = None,
     max_retries: int = 3,
+    total_timeout: float = 60.0,
 ) -> Optional[str]:
-    """发送 embed 消息到频道（带 rate limit 处理）"""
+    """发送 embed 消息到频道（带 rate limit 处理，总耗时不超过 total_timeout 秒）"""
     try:
         if not config.discord_bot_token or not config.platform_channel_id:
             logger.error("Discord bot token or channel ID not configured")
@@ -109,7 +310,11 @@ async def send_channel_embed(
         embed = _build_channel_embed(title, description, url, color)
         url_path = _build_channel_url(config)
 
-        return await _post_embed_with_retries(url_path, headers, embed, max_retries)
+        return await _post_embed_with_retries(
+            url_path, headers, embed, max_retries, total_timeout
+        )
     except (ValueError, KeyError) as e:
-        logger.error("Data error sending Discord channel embed: %s", e, exc_info=True)
+        logger.opt(exception=True).error(
+            "Data error sending Discord channel embed: {}", e
+        )
         return None
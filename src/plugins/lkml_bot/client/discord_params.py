@@ -9,7 +9,7 @@ from datetime import datetime
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PatchCardParams:
     """PatchCard 参数（仅用于 Discord API 调用）"""
 
@@ -0,0 +1,547 @@
+"""Discord Thread 相关的 REST API 调用
+
+创建 / 查找 Thread、向 Thread 发送和更新消息、发送 Thread 更新通知。
+"""
+
+import asyncio
+from typing import Dict, Optional, Tuple
+
+import httpx
+from nonebot.log import logger
+
+from .http_pool import get_http_client
+from .json_codec import dumps_json, loads_json
+
+# Discord content 限制为 2000 字符
+DISCORD_CONTENT_MAX_LENGTH = 2000
+# 视为发送成功的 HTTP 状态码
+_OK_STATUSES = frozenset((200, 201))
+
+
+async def _handle_thread_exists_error(config, message_id: str) -> Optional[str]:
+    """处理 Thread 已存在的错误
+
+    Args:
+        config: 配置对象
+        message_id: Discord 消息 ID
+
+    Returns:
+        已存在的 Thread ID，如果无法获取则返回 None
+    """
+    logger.warning(
+        f"Thread already exists for message {message_id}, attempting to retrieve existing thread"
+    )
+    return await _handle_existing_thread_retrieval(config, message_id)
+
+
+async def _handle_existing_thread_retrieval(config, message_id: str) -> Optional[str]:
+    """处理已存在 Thread 的检索逻辑
+
+    Args:
+        config: 配置对象
+        message_id: Discord 消息 ID
+
+    Returns:
+        已存在的 Thread ID，如果无法获取则返回 None
+    """
+    existing_thread_id = await get_existing_thread_id(config, message_id)
+    if existing_thread_id:
+        logger.info(f"Found existing thread: {existing_thread_id}")
+        return existing_thread_id
+    # 无法获取 Thread ID，返回 None（由上层处理错误消息）
+    logger.warning(f"Could not retrieve existing thread ID for message {message_id}")
+    return None
+
+
+async def _create_thread_request(
+    config, thread_name: str, message_id: str
+) -> Tuple[Optional[str], bool]:
+    """发送创建 Thread 的 HTTP 请求
+
+    Args:
+        config: 配置对象
+        thread_name: Thread 名称
+        message_id: Discord 消息 ID
+
+    Returns:
+        (Thread ID, is_thread_exists_error) 元组
+        - Thread ID: 成功创建或获取到的 Thread ID，失败返回 None
+        - is_thread_exists_error: 是否是 "Thread 已存在" 错误（error code 160004）
+    """
+    headers = {
+        "Authorization": f"Bot {config.discord_bot_token}",
+        "Content-Type": "application/json",
+    }
+
+    thread_data = {
+        "name": thread_name[:100],  # Discord thread 名称限制为 100 字符
+        "auto_archive_duration": 10080,  # 7 天后自动归档
+    }
+
+    client = get_http_client()
+    channel_id = config.platform_channel_id
+    url = f"https://discord.com/api/v10/channels/{channel_id}/messages/{message_id}/threads"
+    response = await client.post(
+        url,
+        content=dumps_json(thread_data),
+        headers=headers,
+        timeout=30.0,
+    )
+
+    if response.status_code in _OK_STATUSES:
+        thread_data = loads_json(response.content)
+        thread_id = thread_data.get("id")
+        logger.info(f"Created Discord Thread: {thread_name} (ID: {thread_id})")
+        return thread_id, False
+
+    # 检查是否是 Thread 已存在的错误
+    error_data = loads_json(response.content) if response.text else {}
+    error_code = error_data.get("code")
+
+    if response.status_code == 400 and error_code == 160004:
+        # Thread 已存在，尝试获取 Thread ID
+        thread_id = await _handle_thread_exists_error(config, message_id)
+        if thread_id:
+            return thread_id, True
+        # 如果无法获取 Thread ID，返回 None 但标记为 Thread 已存在错误
+        return None, True
+
+    logger.error(
+        f"Failed to create Discord Thread: {response.status_code}, {response.text}"
+    )
+    return None, False
+
+
+async def create_discord_thread(
+    config, thread_name: str, message_id: str
+) -> Tuple[Optional[str], bool]:
+    """创建 Discord Thread
+
+    Args:
+        config: 配置对象
+        thread_name: Thread 名称
+        message_id: Discord 消息 ID（Thread 将从这条消息创建）
+
+    Returns:
+        (Thread ID, is_thread_exists_error) 元组
+        - Thread ID: 成功创建或获取到的 Thread ID，失败返回 None
+        - is_thread_exists_error: 是否是 "Thread 已存在" 错误
+    """
+    try:
+        if not config.discord_bot_token or not config.platform_channel_id:
+            logger.error("Discord bot token or channel ID not configured")
+            return None, False
+
+        return await _create_thread_request(config, thread_name, message_id)
+
+    except httpx.HTTPError as e:
+        logger.error(f"HTTP error creating Discord Thread: {e}", exc_info=True)
+        return None, False
+    except (ValueError, KeyError) as e:
+        logger.error(f"Data error creating Discord Thread: {e}", exc_info=True)
+        return None, False
+
+
+async def get_existing_thread_id(config, message_id: str) -> Optional[str]:
+    """获取已存在的 Thread ID
+
+    Args:
+        config: 配置对象
+        message_id: Discord 消息 ID
+
+    Returns:
+        Thread ID，如果不存在则返回 None
+    """
+    try:
+        if not config.discord_bot_token:
+            return None
+
+        headers = {
+            "Authorization": f"Bot {config.discord_bot_token}",
+        }
+
+        client = get_http_client()
+        # 方法1: 获取消息对象，检查是否有 thread 字段
+        response = await client.get(
+            f"https://discord.com/api/v10/channels/{config.platform_channel_id}/messages/{message_id}",
+            headers=headers,
+            timeout=30.0,
+        )
+
+        if response.status_code == 200:
+            message_data = loads_json(response.content)
+            # 检查消息是否有 thread 字段
+            thread = message_data.get("thread")
+            if thread and thread.get("id"):
+                return thread.get("id")
+
+        # 方法2: 如果方法1失败，尝试获取活跃的 Threads
+        response = await client.get(
+            f"https://discord.com/api/v10/channels/{config.platform_channel_id}/threads/active",
+            headers=headers,
+            timeout=30.0,
+        )
+
+        if response.status_code == 200:
+            threads_data = loads_json(response.content)
+            threads = threads_data.get("threads", [])
+            # 查找与消息相关的 Thread（通过 parent_id 匹配）
+            for thread in threads:
+                if thread.get("parent_id") == message_id:
+                    return thread.get("id")
+
+        return None
+
+    except httpx.HTTPError as e:
+        logger.warning(f"HTTP error getting existing thread ID: {e}")
+        return None
+    except (ValueError, KeyError) as e:
+        logger.warning(f"Data error getting existing thread ID: {e}")
+        return None
+
+
+async def send_thread_exists_error(  # pylint: disable=unused-argument
+    config, message_id: str
+) -> None:
+    """发送 Thread 已存在的错误消息
+
+    Args:
+        config: 配置对象
+        message_id: Discord 消息 ID
+    """
+    try:
+        if not config.discord_bot_token or not config.platform_channel_id:
+            return
+
+        headers = {
+            "Authorization": f"Bot {config.discord_bot_token}",
+            "Content-Type": "application/json",
+        }
+
+        # 尝试获取已存在的 Thread ID
+        thread_id = await get_existing_thread_id(config, message_id)
+        # 构建错误消息描述
+        description = "此消息已经有一个 Thread 了。\n\n请使用现有的 Thread 继续讨论。"
+        description += f"\n\nThread: <#{thread_id}>"
+
+        error_embed = {
+            "title": "⚠️ Thread 已存在",
+            "description": description,
+            "color": 0xFFA500,  # 橙色
+            "footer": {"text": "LKML Bot"},
+        }
+
+        client = get_http_client()
+        response = await client.post(
+            f"https://discord.com/api/v10/channels/{config.platform_channel_id}/messages",
+            content=dumps_json({"embeds": [error_embed]}),
+            headers=headers,
+            timeout=30.0,
+        )
+
+        if response.status_code in _OK_STATUSES:
+            logger.info("Sent thread exists error message")
+        else:
+            logger.warning(
+                f"Failed to send thread exists error message: {response.status_code}, {response.text}"
+            )
+
+    except httpx.HTTPError as e:
+        logger.warning(f"HTTP error sending thread exists error: {e}")
+    except (ValueError, KeyError) as e:
+        logger.warning(f"Data error sending thread exists error: {e}")
+
+
+def _is_thread_type(thread_data: Dict) -> bool:
+    """检查是否是 Thread 类型
+
+    Args:
+        thread_data: Thread 数据字典
+
+    Returns:
+        如果是 Thread 类型返回 True
+    """
+    thread_type = thread_data.get("type")
+    # Thread 类型是 11 (PUBLIC_THREAD) 或 12 (PRIVATE_THREAD)
+    return thread_type in {11, 12}
+
+
+async def _check_thread_request(config, thread_id: str) -> bool:
+    """发送检查 Thread 的 HTTP 请求
+
+    Args:
+        config: 配置对象
+        thread_id: Discord Thread ID
+
+    Returns:
+        如果 Thread 存在返回 True，否则返回 False
+    """
+    headers = {
+        "Authorization": f"Bot {config.discord_bot_token}",
+    }
+
+    client = get_http_client()
+    response = await client.get(
+        f"https://discord.com/api/v10/channels/{thread_id}",
+        headers=headers,
+        timeout=30.0,
+    )
+
+    if response.status_code == 200:
+        thread_data = loads_json(response.content)
+        return _is_thread_type(thread_data)
+    if response.status_code == 404:
+        return False
+    logger.warning(
+        f"Unexpected status code when checking thread: {response.status_code}"
+    )
+    return False
+
+
+async def check_thread_exists(config, thread_id: str) -> bool:
+    """检查 Thread 是否真的存在于 Discord
+
+    Args:
+        config: 配置对象
+        thread_id: Discord Thread ID
+
+    Returns:
+        如果 Thread 存在返回 True，否则返回 False
+    """
+    try:
+        if not config.discord_bot_token:
+            logger.error("Discord bot token not configured")
+            return False
+
+        return await _check_thread_request(config, thread_id)
+
+    except httpx.HTTPError as e:
+        logger.warning(f"HTTP error checking thread existence: {e}")
+        return False
+    except (ValueError, KeyError) as e:
+        logger.warning(f"Data error checking thread existence: {e}")
+        return False
+
+
+async def send_thread_update_notification(
+    config,
+    channel_id: str,
+    thread_id: str,
+    platform_message_id: Optional[str] = None,  # pylint: disable=unused-argument
+) -> bool:
+    """发送 Thread 更新通知到频道
+
+    Args:
+        config: 配置对象
+        channel_id: 频道 ID
+        thread_id: Thread ID
+        platform_message_id: Patch Card 的消息 ID（用于构建 Thread 链接）
+
+    Returns:
+        成功返回 True，失败返回 False
+    """
+    try:
+        if not config.discord_bot_token:
+            logger.error("Discord bot token not configured")
+            return False
+
+        headers = {
+            "Authorization": f"Bot {config.discord_bot_token}",
+            "Content-Type": "application/json",
+        }
+
+        # 使用 Thread 提及格式 <#{thread_id}>
+        thread_mention = f"Thread: <#{thread_id}>"
+
+        # 构建通知消息
+        content = f"🔄 **Thread Overview 已更新**\n\n{thread_mention}\n\n"
+
+        message_data = {"content": content}
+
+        client = get_http_client()
+        response = await client.post(
+            f"https://discord.com/api/v10/channels/{channel_id}/messages",
+            content=dumps_json(message_data),
+            headers=headers,
+            timeout=30.0,
+        )
+
+        if response.status_code in _OK_STATUSES:
+            logger.debug(f"Sent Thread update notification to channel {channel_id}")
+            return True
+        logger.error(
+            f"Failed to send Thread update notification: {response.status_code}, {response.text}"
+        )
+        return False
+
+    except httpx.HTTPError as e:
+        logger.error(
+            f"HTTP error sending Thread update notification: {e}", exc_info=True
+        )
+        return False
+    except (ValueError, KeyError) as e:
+        logger.error(
+            f"Data error sending Thread update notification: {e}", exc_info=True
+        )
+        return False
+
+
+def _build_thread_message_data(content: Optional[str], embed: Optional[Dict]) -> Dict:
+    """构建 Thread 消息请求体（content 超过 Discord 限制时截断）
+
+    Args:
+        content: 消息内容
+        embed: 可选的 embed 字典
+
+    Returns:
+        消息请求体字典
+    """
+    message_data = {}
+    if content:
+        # Discord content 限制为 2000 字符
+        if len(content) > DISCORD_CONTENT_MAX_LENGTH:
+            logger.warning(
+                f"Content too long ({len(content)} chars), truncating to {DISCORD_CONTENT_MAX_LENGTH}"
+            )
+            content = content[: DISCORD_CONTENT_MAX_LENGTH - 3] + "..."
+        message_data["content"] = content
+    if embed:
+        message_data["embeds"] = [embed]
+    return message_data
+
+
+async def send_message_to_thread(
+    config,
+    thread_id: str,
+    content: Optional[str] = None,
+    embed: Optional[Dict] = None,
+    max_retries: int = 3,
+) -> Optional[str]:
+    """发送消息到 Thread（带 rate limit 处理）
+
+    Args:
+        config: 配置对象
+        thread_id: Thread ID
+        content: 消息内容
+        embed: 可选的 embed 字典
+        max_retries: 遇到 429 时的最大重试次数
+
+    Returns:
+        成功返回消息 ID，失败返回 None
+    """
+    try:
+        if not config.discord_bot_token:
+            logger.error("Discord bot token not configured")
+            return None
+
+        headers = {
+            "Authorization": f"Bot {config.discord_bot_token}",
+            "Content-Type": "application/json",
+        }
+
+        url = f"https://discord.com/api/v10/channels/{thread_id}/messages"
+        result_message_id = None
+
+        # 重试逻辑（处理 rate limit）；请求体只编码一次，重试时复用
+        body = dumps_json(_build_thread_message_data(content, embed))
+        client = get_http_client()
+        for attempt in range(max_retries):
+            try:
+                response = await client.post(
+                    url,
+                    content=body,
+                    headers=headers,
+                    timeout=30.0,
+                )
+
+                if response.status_code in _OK_STATUSES:
+                    result = loads_json(response.content)
+                    result_message_id = result.get("id")
+                    logger.debug(
+                        f"Sent message to thread {thread_id}, message_id={result_message_id}"
+                    )
+                    break
+
+                # Discord rate limit (429)
+                if response.status_code == 429:
+                    retry_after = loads_json(response.content).get("retry_after", 1.0)
+                    logger.warning(
+                        f"Discord rate limit hit (429) for thread message, "
+                        f"retry after {retry_after}s (attempt {attempt + 1}/{max_retries})"
+                    )
+                    if attempt < max_retries - 1:
+                        await asyncio.sleep(retry_after)
+                        continue
+                    logger.error("Max retries reached for rate limit")
+                    break
+
+                logger.error(
+                    f"Failed to send message to Thread: {response.status_code}, {response.text}"
+                )
+                break
+
+            except httpx.TimeoutException:
+                logger.error("Timeout sending message to thread")
+                if attempt < max_retries - 1:
+                    await asyncio.sleep(1)
+                    continue
+                break
+
+            except (httpx.HTTPError, RuntimeError) as e:
+                logger.error(f"Error sending message to thread: {e}", exc_info=True)
+                break
+
+        return result_message_id
+
+    except (ValueError, KeyError) as e:
+        logger.error(f"Data error sending message to Thread: {e}", exc_info=True)
+        return None
+
+
+async def update_message_in_thread(
+    config, thread_id: str, message_id: str, content: str, embed: Optional[Dict] = None
+) -> bool:
+    """更新 Thread 中的消息
+
+    Args:
+        config: 配置对象
+        thread_id: Thread ID
+        message_id: 要更新的消息 ID
+        content: 消息内容
+        embed: 可选的 embed 字典
+
+    Returns:
+        成功返回 True，失败返回 False
+    """
+    try:
+        if not config.discord_bot_token:
+            logger.error("Discord bot token not configured")
+            return False
+
+        headers = {
+            "Authorization": f"Bot {config.discord_bot_token}",
+            "Content-Type": "application/json",
+        }
+
+        client = get_http_client()
+        response = await client.patch(
+            f"https://discord.com/api/v10/channels/{thread_id}/messages/{message_id}",
+            content=dumps_json(_build_thread_message_data(content, embed)),
+            headers=headers,
+            timeout=30.0,
+        )
+
+        if response.status_code in _OK_STATUSES:
+            logger.debug(f"Updated message {message_id} in thread {thread_id}")
+            return True
+        logger.error(
+            f"Failed to update message in Thread: {response.status_code}, {response.text}"
+        )
+        return False
+
+    except httpx.HTTPError as e:
+        logger.error(f"HTTP error updating message in Thread: {e}", exc_info=True)
+        return False
+    except (ValueError, KeyError) as e:
+        logger.error(f"Data error updating message in Thread: {e}", exc_info=True)
+        return False
@@ -7,17 +7,65 @@
 - Thread：发送 Thread 通知卡片（Feishu 不支持真正的 Thread，用通知卡片代替）
 """
 
+import asyncio
+import random
+import time
 from typing import Dict, Optional, Tuple
 
 import httpx
 from nonebot.log import logger
 
 from .base import PatchCardClient, ThreadClient
+from .json_codec import JSON_HEADERS, dumps_json
 from ..renders.types import (
     FeishuRenderedPatchCard,
     FeishuRenderedThreadNotification,
 )
 
+# 视为发送成功的 HTTP 状态码
+_OK_STATUSES = frozenset((200, 201))
+# 可重试的 HTTP 状态码（限流和临时性服务端错误），其余 4xx 直接放弃
+_RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+# 可重试的网络层错误（连接未建立或未取得连接池连接，请求一定没有发出）
+_RETRY_TRANSPORT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+# 单个 webhook 请求的最大尝试次数，以及指数退避的初始等待和上限（秒）
+_MAX_ATTEMPTS = 3
+_BACKOFF_BASE_SECONDS = 0.5
+_BACKOFF_MAX_SECONDS = 8.0
+# Thread 更新通知的合并窗口（秒）：窗口内重复的通知只发送一次
+_UPDATE_COALESCE_SECONDS = 1.0
+_UPDATE_PURPOSE = "thread update notification"
+
+
+def _retry_delay(attempt: int, response: Optional[httpx.Response] = None) -> float:
+    """计算第 attempt 次（从 0 开始）失败后的等待时间
+
+    响应带有合法的 Retry-After 头时优先使用（不超过上限），否则按指数退避并加少量抖动。
+    """
+    if response is not None:
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            try:
+                return min(_BACKOFF_MAX_SECONDS, max(0.0, float(retry_after)))
+            except ValueError:
+                pass
+    backoff = min(_BACKOFF_MAX_SECONDS, _BACKOFF_BASE_SECONDS * 2**attempt)
+    return backoff + random.random() * 0.1
+
+
+def _parse_webhook_urls(webhook_url: str) -> Tuple[httpx.URL, ...]:
+    """解析逗号分隔的 webhook 地址（无效地址记录警告后跳过）"""
+    urls = []
+    for raw in webhook_url.split(","):
+        raw = raw.strip()
+        if not raw:
+            continue
+        try:
+            urls.append(httpx.URL(raw))
+        except httpx.InvalidURL as e:
+            logger.warning("Ignoring invalid Feishu webhook URL: {}", e)
+    return tuple(urls)
+
 
 class FeishuClient(
     PatchCardClient, ThreadClient
@@ -27,57 +75,227 @@ class FeishuClient(
     负责发送 Patch Card 和 Thread 通知卡片到 Feishu webhook。
     """
 
+    __slots__ = (
+        "config",
+        "webhook_urls",
+        "_client",
+        "_dedup_ttl",
+        "_last_sent",
+        "_pending_updates",
+        "_flush_task",
+    )
+
     def __init__(self, config):
         """初始化 FeishuClient
 
         Args:
-            config: 插件配置对象（需要包含 feishu_webhook_url）
+            config: 插件配置对象（需要包含 feishu_webhook_url，多个地址用逗号分隔）
         """
         self.config = config
-        self.webhook_url: str = getattr(config, "feishu_webhook_url", "") or ""
+        webhook_url = getattr(config, "feishu_webhook_url", "") or ""
+        # 支持同时推送到多个群（逗号分隔的多个 webhook 地址）
+        # 地址在这里解析为 httpx.URL，每次发送不再重复解析 URL 字符串
+        self.webhook_urls: Tuple[httpx.URL, ...] = _parse_webhook_urls(webhook_url)
+        # 复用的 HTTP 客户端（首次发送时创建，保持 keep-alive 连接）
+        self._client: Optional[httpx.AsyncClient] = None
+        # 重复卡片去重：{purpose: (上次成功发送的请求体哈希, 发送时间（monotonic 秒）)}
+        self._dedup_ttl: float = float(
+            getattr(config, "feishu_dedup_ttl_seconds", 0) or 0
+        )
+        self._last_sent: Dict[str, Tuple[int, float]] = {}
+        # 待发送的 Thread 更新通知：{已编码请求体: 发送结果 Future}（dict 保持先进先出顺序）
+        # 短时间内大量回复触发的相同通知合并为一次发送，由单个后台任务依次发出；
+        # 合并的通知共享同一个 Future，发送完成后得到 webhook 的实际结果
+        self._pending_updates: Dict[bytes, asyncio.Future] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+
+    @property
+    def is_configured(self) -> bool:
+        """是否配置了 webhook URL（未配置时调用方可以跳过渲染）"""
+        return bool(self.webhook_urls)
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """获取复用的 HTTP 客户端（首次使用或已关闭时创建）"""
+        if self._client is None or self._client.is_closed:
+            # JSON 请求头和超时作为客户端默认值，每次请求不再传入、合并
+            self._client = httpx.AsyncClient(
+                headers=JSON_HEADERS,
+                timeout=30.0,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """发出排队中的通知后关闭复用的 HTTP 客户端（在 bot 关闭时调用）"""
+        if self._flush_task is not None and not self._flush_task.done():
+            await self._flush_task
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def _post_webhook(self, payload: dict, purpose: str) -> bool:
-        """发送 webhook 请求并统一处理错误"""
-        if not self.webhook_url:
-            logger.debug("Feishu webhook URL not configured, skip sending %s", purpose)
+        """发送 webhook 请求并统一处理错误
+
+        请求体只编码一次；配置了多个 webhook 时并发发送到所有地址，全部成功才返回 True。
+        """
+        if not self.webhook_urls:
+            logger.debug("Feishu webhook URL not configured, skip sending {}", purpose)
             return False
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self.webhook_url, json=payload, timeout=30.0
+            body = dumps_json(payload)
+        except (ValueError, TypeError) as e:
+            logger.warning("Data error encoding {} for Feishu: {}", purpose, e)
+            return False
+
+        return await self._post_encoded(body, purpose)
+
+    async def _post_encoded(self, body: bytes, purpose: str) -> bool:
+        """发送已编码的请求体（去重检查后发送到所有 webhook 地址）"""
+        body_hash = hash(body)
+        now = time.monotonic()
+        last = self._last_sent.get(purpose)
+        if (
+            last is not None
+            and last[0] == body_hash
+            and now - last[1] < self._dedup_ttl
+        ):
+            logger.debug("Skip sending duplicate {} to Feishu", purpose)
+            return True
+
+        if len(self.webhook_urls) == 1:
+            ok = await self._post_body(self.webhook_urls[0], body, purpose)
+        else:
+            results = await asyncio.gather(
+                *(self._post_body(url, body, purpose) for url in self.webhook_urls)
+            )
+            ok = all(results)
+
+        if ok and self._dedup_ttl > 0:
+            self._last_sent[purpose] = (body_hash, now)
+        return ok
+
+    def queue_thread_update(
+        self, rendered: FeishuRenderedThreadNotification
+    ) -> Optional[asyncio.Future]:
+        """将 Thread 更新通知加入发送队列
+
+        优先使用渲染结果中预先编码的请求体；与队列中已有的相同通知合并（保留原有位置）；
+        后台发送任务未运行时启动一个。
+
+        Returns:
+            发送结果 Future（完成时为 webhook 实际发送是否成功），无法加入队列时返回 None
+        """
+        if not self.webhook_urls:
+            logger.debug(
+                "Feishu webhook URL not configured, skip sending {}", _UPDATE_PURPOSE
+            )
+            return None
+
+        body = rendered.body
+        try:
+            if body is None:
+                body = dumps_json(rendered.card)
+        except (ValueError, TypeError) as e:
+            logger.warning("Data error encoding {} for Feishu: {}", _UPDATE_PURPOSE, e)
+            return None
+
+        future = self._pending_updates.get(body)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._pending_updates[body] = future
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_updates())
+        return future
+
+    async def _flush_updates(self) -> None:
+        """等待合并窗口结束后，按先进先出顺序依次发出排队中的 Thread 更新通知"""
+        await asyncio.sleep(_UPDATE_COALESCE_SECONDS)
+        while self._pending_updates:
+            body = next(iter(self._pending_updates))
+            future = self._pending_updates.pop(body)
+            ok = False
+            try:
+                ok = await self._post_encoded(body, _UPDATE_PURPOSE)
+            except Exception as e:  # pylint: disable=broad-except
+                logger.opt(exception=True).warning(
+                    "Error sending {} to Feishu: {}", _UPDATE_PURPOSE, e
                 )
-                if response.status_code in {200, 201}:
+            finally:
+                if not future.done():
+                    future.set_result(ok)
+
+    async def _post_body(self, url: httpx.URL, body: bytes, purpose: str) -> bool:
+        """将已编码的请求体发送到单个 webhook 地址
+
+        遇到限流、临时性服务端错误或请求未发出的连接错误时按指数退避重试，
+        最多尝试 _MAX_ATTEMPTS 次。
+        """
+        client = self._get_client()
+        for attempt in range(_MAX_ATTEMPTS):
+            is_last = attempt == _MAX_ATTEMPTS - 1
+            try:
+                response = await client.post(url, content=body)
+                if response.status_code in _OK_STATUSES:
                     return True
+                if response.status_code in _RETRY_STATUSES and not is_last:
+                    delay = _retry_delay(attempt, response)
+                    logger.warning(
+                        "Feishu returned {} for {}, retry after {:.2f}s (attempt {}/{})",
+                        response.status_code,
+                        purpose,
+                        delay,
+                        attempt + 1,
+                        _MAX_ATTEMPTS,
+                    )
+                    await asyncio.sleep(delay)
+                    continue
                 logger.warning(
-                    "Failed to send %s to Feishu: %s, %s",
+                    "Failed to send {} to Feishu: {}, {}",
                     purpose,
                     response.status_code,
                     response.text,
                 )
                 return False
-        except httpx.HTTPError as e:
-            logger.warning("HTTP error sending %s to Feishu: %s", purpose, e)
-            return False
-        except (ValueError, KeyError, TypeError) as e:
-            logger.warning("Data error sending %s to Feishu: %s", purpose, e)
-            return False
+            except _RETRY_TRANSPORT_ERRORS as e:
+                # 只重试请求尚未发出的连接错误；webhook POST 不是幂等的，
+                # 读超时等错误时飞书可能已经收到卡片，重试会导致重复推送
+                if is_last:
+                    logger.warning("HTTP error sending {} to Feishu: {}", purpose, e)
+                    return False
+                delay = _retry_delay(attempt)
+                logger.warning(
+                    "HTTP error sending {} to Feishu: {}, retry after {:.2f}s (attempt {}/{})",
+                    purpose,
+                    e,
+                    delay,
+                    attempt + 1,
+                    _MAX_ATTEMPTS,
+                )
+                await asyncio.sleep(delay)
+            except httpx.HTTPError as e:
+                logger.warning("HTTP error sending {} to Feishu: {}", purpose, e)
+                return False
+            except (ValueError, KeyError, TypeError) as e:
+                logger.warning("Data error sending {} to Feishu: {}", purpose, e)
+                return False
+        return False
 
     async def send_patch_card(
         self, rendered_data: FeishuRenderedPatchCard
-    ) -> Optional[str]:
+    ) -> Tuple[Optional[str], Optional[str]]:
         """发送 Patch Card 到 Feishu
 
         Args:
             rendered_data: 渲染后的 Feishu 卡片数据
 
         Returns:
-            由于 Feishu webhook 一般不会返回消息 ID，这里统一返回 None。
+            由于 Feishu webhook 一般不会返回消息 ID，这里统一返回 (None, None)。
         """
         await self._post_webhook(rendered_data.card, "patch card")
 
-        # 当前不返回 Feishu 消息 ID
-        return None
+        # 当前不返回 Feishu 消息 ID / 频道 ID
+        return None, None
 
     async def send_card_message(self, card: dict) -> bool:
         """发送卡片消息到 Feishu webhook"""
@@ -129,8 +347,9 @@ class FeishuClient(
         """
         if not isinstance(overview_data, FeishuRenderedThreadNotification):
             logger.error(
-                f"Invalid overview_data type: {type(overview_data)}, "
-                "expected FeishuRenderedThreadNotification"
+                "Invalid overview_data type: {}, "
+                "expected FeishuRenderedThreadNotification",
+                type(overview_data),
             )
             return {}
 
@@ -143,24 +362,26 @@ class FeishuClient(
     ) -> bool:
         """更新 Thread Overview（Feishu 不支持更新，发送新的通知卡片）
 
+        通知卡片加入发送队列后立即返回，由后台任务合并重复通知后发送。
+        需要 webhook 实际发送结果的调用方使用 queue_thread_update 并等待返回的 Future。
+
         Args:
             thread_id: Thread ID（未使用）
             message_id: 消息 ID（未使用）
             overview_data: FeishuRenderedThreadNotification 渲染结果
 
         Returns:
-            成功返回 True，失败返回 False
+            成功加入发送队列返回 True（不代表已发送成功），失败返回 False
         """
         if not isinstance(overview_data, FeishuRenderedThreadNotification):
             logger.error(
-                f"Invalid overview_data type: {type(overview_data)}, "
-                "expected FeishuRenderedThreadNotification"
+                "Invalid overview_data type: {}, "
+                "expected FeishuRenderedThreadNotification",
+                type(overview_data),
             )
             return False
 
-        return await self._post_webhook(
-            overview_data.card, "thread update notification"
-        )
+        return self.queue_thread_update(overview_data) is not None
 
     async def send_thread_update_notification(
         self, channel_id: str, thread_id: str, platform_message_id: Optional[str] = None
@@ -0,0 +1,36 @@
+"""共享 HTTP 客户端
+
+Discord REST API 请求共用一个 httpx.AsyncClient，复用连接池和 keep-alive 连接，
+避免每次请求都新建客户端并重新进行 TCP/TLS 握手。
+"""
+
+from typing import Optional
+
+import httpx
+
+# 模块级共享的 HTTP 客户端（首次使用时创建）
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """获取共享的 HTTP 客户端（首次使用或已关闭时创建）
+
+    调用方不要关闭返回的客户端，统一由 aclose_http_client 在 bot 关闭时关闭。
+    """
+    global _http_client  # pylint: disable=global-statement
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(
+                max_keepalive_connections=20, max_connections=100, keepalive_expiry=60.0
+            ),
+        )
+    return _http_client
+
+
+async def aclose_http_client() -> None:
+    """关闭共享的 HTTP 客户端（在 bot 关闭时调用）"""
+    global _http_client  # pylint: disable=global-statement
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
@@ -0,0 +1,46 @@
+"""JSON 请求体编码 / 响应体解码工具
+
+优先使用 orjson（C 扩展，直接输出 bytes），未安装时回退到标准库 json。
+"""
+
+import json
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _stdlib_dumps(payload: dict) -> bytes:
+    """标准库 json 编码（紧凑格式，保留非 ASCII 字符，与 orjson 输出一致）"""
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode(
+        "utf-8"
+    )
+
+
+try:
+    from orjson import dumps as _dumps, loads as _loads
+except ImportError:  # pragma: no cover - 未安装 orjson 时使用标准库
+    _dumps = _stdlib_dumps
+    _loads = json.loads
+
+
+def dumps_json(payload: dict) -> bytes:
+    """将请求体编码为 UTF-8 JSON bytes
+
+    Args:
+        payload: 请求体字典
+
+    Returns:
+        编码后的 JSON bytes，可直接作为 httpx 的 content 参数
+    """
+    return _dumps(payload)
+
+
+def loads_json(content: bytes):
+    """解码 JSON 响应体
+
+    Args:
+        content: 响应体 bytes（httpx Response.content）
+
+    Returns:
+        解码后的对象；格式错误时抛出 ValueError（与 Response.json() 一致）
+    """
+    return _loads(content)
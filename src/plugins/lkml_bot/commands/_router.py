@@ -0,0 +1,128 @@
+"""命令路由模块
+
+所有斜杠命令共用一个 on_message 处理器：每条 @ 消息只提取一次纯文本，
+用一个由已注册命令名编译成的正则定位 `/命令` 后在路由表中做一次字典查找，
+再分发到对应的命令函数，避免每个命令各自注册处理器、对同一条消息重复做文本提取和匹配。
+"""
+
+import re
+from typing import Awaitable, Callable, Dict, Iterable, NamedTuple, Optional, Tuple
+
+from nonebot import on_message
+from nonebot.adapters import Event, Message
+from nonebot.log import logger
+from nonebot.matcher import Matcher
+from nonebot.params import EventMessage
+from nonebot.rule import to_me
+
+from ..shared import (
+    ERR_COMMAND_FAILED,
+    ERR_NO_PERMISSION,
+    check_admin,
+    register_command,
+)
+
+# 命令函数签名：(event, text)，text 为已去除首尾空白、以命令开头的消息纯文本
+CommandHandler = Callable[[Event, str], Awaitable[None]]
+
+
+class _Route(NamedTuple):
+    """路由表项"""
+
+    handler: CommandHandler
+    admin_only: bool
+
+
+# 路由表：{命令名（不含 "/"）: 路由表项}，别名指向同一个表项
+_ROUTES: Dict[str, _Route] = {}
+# 由路由表中所有命令名编译的匹配正则（注册新命令后置空，下次分发时重建）
+_command_re: Optional[re.Pattern] = None
+
+# 仅当消息 @ 到机器人时处理
+# 优先级设为 50：NoneBot 中数值越小越先执行，help (40) 先于本路由处理
+# block=False：未识别到命令时不阻断其他处理器；识别到命令后再调用 stop_propagation
+CommandRouter = on_message(rule=to_me(), priority=50, block=False)
+
+
+def register_routed_command(
+    name: str,
+    usage: str,
+    description: str,
+    handler: CommandHandler,
+    admin_only: bool = False,
+    aliases: Iterable[str] = (),
+) -> None:
+    """注册命令元信息（供 help 显示）并将命令函数加入路由表
+
+    Args:
+        name: 命令名（如 subscribe）
+        usage: 用法字符串
+        description: 简短描述
+        handler: 命令函数
+        admin_only: 是否仅管理员可用（由路由器统一检查权限）
+        aliases: 命令别名（如 sub）
+    """
+    global _command_re  # pylint: disable=global-statement
+    register_command(
+        name=name, usage=usage, description=description, admin_only=admin_only
+    )
+    route = _Route(handler=handler, admin_only=admin_only)
+    _ROUTES[name] = route
+    for alias in aliases:
+        _ROUTES[alias] = route
+    _command_re = None
+
+
+def _get_command_re() -> re.Pattern:
+    """获取命令匹配正则（命令须位于开头或空白之后，且后面是空白或文本结尾）"""
+    global _command_re  # pylint: disable=global-statement
+    if _command_re is None:
+        names = "|".join(
+            re.escape(name) for name in sorted(_ROUTES, key=len, reverse=True)
+        )
+        _command_re = re.compile(rf"(?:^|(?<=\s))/({names})(?=\s|$)")
+    return _command_re
+
+
+def _match_command(text: str) -> Optional[Tuple[str, str]]:
+    """在文本中定位已注册的命令
+
+    Returns:
+        (命令名, 从命令开始的文本) 元组，未找到时返回 None
+    """
+    if "/" not in text:
+        return None
+    match = _get_command_re().search(text)
+    if match is None:
+        return None
+    return match.group(1), text[match.start() :]
+
+
+@CommandRouter.handle()
+async def dispatch_command(
+    matcher: Matcher, event: Event, message: Message = EventMessage()
+):
+    """定位消息中的命令并分发到已注册的命令函数"""
+    text = message.extract_plain_text().strip()
+    matched = _match_command(text)
+    if matched is None:
+        return
+
+    command, text = matched
+    route = _ROUTES[command]
+    # 已识别到命令，阻止消息继续传递给更低优先级的处理器
+    matcher.stop_propagation()
+
+    logger.info("Command /{} triggered, text: '{}'", command, text)
+    if route.admin_only and not check_admin(event):
+        await CommandRouter.finish(ERR_NO_PERMISSION)
+        return
+
+    # 命令函数统一的错误边界：FinishedException 不在捕获范围内，会直接向上传递给 NoneBot
+    try:
+        await route.handler(event, text)
+    except (ValueError, RuntimeError, AttributeError) as e:
+        logger.opt(exception=True).error(
+            "Unexpected error in /{} command: {}", command, e
+        )
+        await CommandRouter.finish(f"{ERR_COMMAND_FAILED}: {e}")
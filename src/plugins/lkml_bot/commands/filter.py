@@ -1,8 +1,9 @@
 """PATCH 卡片过滤规则命令模块"""
 
+from typing import Awaitable, Callable, Dict
+
 from nonebot import on_message
 from nonebot.adapters import Event, Message
-from nonebot.exception import FinishedException
 from nonebot.log import logger
 from nonebot.params import EventMessage
 from nonebot.rule import to_me
@@ -22,22 +23,27 @@ from ..shared import (
     send_embed_message,
 )
 
+# 回复 embed 通用的标题、颜色与文案
+_ERROR_TITLE = "❌ 错误"
+_ERROR_COLOR = 0xE74C3C
+_SUCCESS_COLOR = 0x2ECC71
+_NO_USER_INFO_DESC = "无法获取用户信息"
+
 # 仅当消息 @ 到机器人，并且以 "/filter" 开头时处理
 FilterCmd = on_message(rule=to_me(), priority=50, block=False)
 
 
 def _convert_scalar(s: str):
     """转换标量值，处理引号"""
-    try:
+    s = s.strip()
+    # 先用 isdigit 判断整数，避免对普通字符串抛出并捕获 ValueError
+    digits = s[1:] if s[:1] in ("-", "+") else s
+    if digits.isascii() and digits.isdigit():
         return int(s)
-    except ValueError:
-        # 去除首尾的引号（单引号或双引号）
-        s = s.strip()
-        if (s.startswith('"') and s.endswith('"')) or (
-            s.startswith("'") and s.endswith("'")
-        ):
-            s = s[1:-1]
-        return s
+    # 去除首尾的引号（单引号或双引号）
+    if len(s) >= 2 and s[0] == s[-1] and s[0] in ('"', "'"):
+        s = s[1:-1]
+    return s
 
 
 def _build_help_embed() -> dict:
@@ -153,12 +159,14 @@ async def _handle_config_command(
     try:
         user_id, user_name = get_user_info(event)
     except (AttributeError, ValueError, TypeError):
-        await _send_embed_response(event, "❌ 错误", "无法获取用户信息", 0xE74C3C)
+        await _send_embed_response(
+            event, _ERROR_TITLE, _NO_USER_INFO_DESC, _ERROR_COLOR
+        )
         return
     resp_msg = await _handle_config(filter_service, parts, user_id, user_name)
     if resp_msg:
-        color = 0x2ECC71 if resp_msg.startswith("✅") else 0xE74C3C
-        title = "配置结果" if resp_msg.startswith("✅") else "❌ 错误"
+        color = _SUCCESS_COLOR if resp_msg.startswith("✅") else _ERROR_COLOR
+        title = "配置结果" if resp_msg.startswith("✅") else _ERROR_TITLE
         await _send_embed_response(event, title, resp_msg, color)
 
 
@@ -170,16 +178,16 @@ async def _handle_type_command(event: Event, parts: list) -> None:
             await _send_embed_response(event, "📋 支持的过滤类型", resp_msg)
         return
     await _send_embed_response(
-        event, "❌ 用法错误", "用法: /filter rule type list", 0xE74C3C
+        event, "❌ 用法错误", "用法: /filter rule type list", _ERROR_COLOR
     )
 
 
 def _get_response_color_and_title(resp_msg: str) -> tuple[int, str]:
     """根据响应消息获取颜色和标题"""
     if resp_msg.startswith("✅"):
-        return (0x2ECC71, "操作成功")
+        return (_SUCCESS_COLOR, "操作成功")
     if resp_msg.startswith("❌"):
-        return (0xE74C3C, "❌ 错误")
+        return (_ERROR_COLOR, _ERROR_TITLE)
     return (0x5865F2, "信息")
 
 
@@ -191,21 +199,15 @@ async def _execute_rule_command(
         try:
             user_id, user_name = get_user_info(event)
         except (AttributeError, ValueError, TypeError):
-            await _send_embed_response(event, "❌ 错误", "无法获取用户信息", 0xE74C3C)
+            await _send_embed_response(
+                event, _ERROR_TITLE, _NO_USER_INFO_DESC, _ERROR_COLOR
+            )
             return ""
         return await _handle_rule_add(filter_service, parts, user_id, user_name)
 
-    handlers = {
-        "list": lambda: _handle_rule_list(filter_service),
-        "show": lambda: _handle_rule_show(filter_service, parts),
-        "del": lambda: _handle_rule_del(filter_service, parts),
-        "enable": lambda: _handle_rule_enable(filter_service, parts),
-        "disable": lambda: _handle_rule_disable(filter_service, parts),
-    }
-
-    handler = handlers.get(rule_cmd)
+    handler = _RULE_HANDLERS.get(rule_cmd)
     if handler:
-        return await handler()
+        return await handler(filter_service, parts)
     return f"❌ 未知的 rule 子命令: {rule_cmd}"
 
 
@@ -218,7 +220,7 @@ async def _handle_rule_command(
             event,
             "❌ 用法错误",
             "用法: /filter rule <add|list|show|del|enable|disable|type> [参数...]",
-            0xE74C3C,
+            _ERROR_COLOR,
         )
         return
 
@@ -250,7 +252,7 @@ async def handle_filter(event: Event, message: Message = EventMessage()):
     try:
         if not check_admin(event):
             await _send_embed_response(
-                event, "❌ 权限不足", "此命令仅管理员可用", 0xE74C3C
+                event, "❌ 权限不足", "此命令仅管理员可用", _ERROR_COLOR
             )
             return
 
@@ -273,7 +275,9 @@ async def handle_filter(event: Event, message: Message = EventMessage()):
 
         database = get_database()
         if not database:
-            await _send_embed_response(event, "❌ 错误", "数据库未初始化", 0xE74C3C)
+            await _send_embed_response(
+                event, _ERROR_TITLE, "数据库未初始化", _ERROR_COLOR
+            )
             return
 
         async with database.get_db_session() as session:
@@ -291,24 +295,21 @@ async def handle_filter(event: Event, message: Message = EventMessage()):
                     "❌ 用法错误",
                     "用法: /filter rule <add|list|show|del|enable|disable|type> [参数...]\n"
                     "或: /filter config exclusive <on|off>",
-                    0xE74C3C,
+                    _ERROR_COLOR,
                 )
 
-    except FinishedException:
-        raise
     except (ValueError, RuntimeError, AttributeError) as e:
-        logger.error(f"Error in filter command: {e}", exc_info=True)
+        logger.opt(exception=True).error("Error in filter command: {}", e)
         await _send_embed_response(
-            event, "❌ 错误", f"处理命令时发生错误: {str(e)}", 0xE74C3C
+            event, _ERROR_TITLE, f"处理命令时发生错误: {e}", _ERROR_COLOR
         )
 
 
 def _parse_condition_value(joined: str):
     """解析条件值"""
     if "," in joined:
-        items = [s.strip() for s in joined.split(",") if s.strip()]
-        return [_convert_scalar(x) for x in items]
-    return _convert_scalar(joined.strip())
+        return [_convert_scalar(x) for x in joined.split(",") if x and not x.isspace()]
+    return _convert_scalar(joined)
 
 
 def _merge_condition_value(existing, new_value):
@@ -335,9 +336,8 @@ def _parse_filter_conditions(parts: list) -> dict:
     conditions = {}
     i = 4
     while i < len(parts):
-        part = parts[i]
-        if "=" in part:
-            k, v = part.split("=", 1)
+        k, sep, v = parts[i].partition("=")
+        if sep:
             acc = [v]
             j = i + 1
             while j < len(parts) and ("=" not in parts[j]):
@@ -399,7 +399,7 @@ async def _handle_rule_add(
 
         return _format_rule_group_response(name, filter_data)
     except (RuntimeError, ValueError, AttributeError) as e:
-        logger.error(f"Failed to create rule group: {e}", exc_info=True)
+        logger.opt(exception=True).error("Failed to create rule group: {}", e)
         return f"❌ 创建规则组失败: {str(e)}"
 
 
@@ -437,7 +437,7 @@ async def _handle_rule_list(filter_service: PatchCardFilterService) -> str:
 
         return "\n".join(lines)
     except (RuntimeError, ValueError, AttributeError) as e:
-        logger.error(f"Failed to list rule groups: {e}", exc_info=True)
+        logger.opt(exception=True).error("Failed to list rule groups: {}", e)
         return f"❌ 列出规则组失败: {str(e)}"
 
 
@@ -501,7 +501,7 @@ async def _handle_rule_show(filter_service: PatchCardFilterService, parts: list)
 
         return "\n".join(lines)
     except (RuntimeError, ValueError, AttributeError) as e:
-        logger.error(f"Failed to show rule group: {e}", exc_info=True)
+        logger.opt(exception=True).error("Failed to show rule group: {}", e)
         return f"❌ 显示规则组失败: {str(e)}"
 
 
@@ -540,7 +540,7 @@ async def _handle_config(
             result = f"✅ 已设置自动 watch: {state_text}"
         return result
     except (RuntimeError, ValueError, AttributeError) as e:
-        logger.error(f"Failed to set config: {e}", exc_info=True)
+        logger.opt(exception=True).error("Failed to set config: {}", e)
         return f"❌ 设置配置失败: {str(e)}"
 
 
@@ -625,18 +625,20 @@ async def _handle_rule_del(filter_service: PatchCardFilterService, parts: list)
         remaining = " ".join(parts[4:])
         if "=" in remaining:
             filter_type, pattern_str = remaining.split("=", 1)
-            pattern = _convert_scalar(pattern_str.strip())
+            pattern = _convert_scalar(pattern_str)
             return await _delete_condition_value(
                 filter_service, name, filter_type, pattern
             )
 
         filter_types_str = remaining.strip()
-        filter_types = [t.strip() for t in filter_types_str.split(",") if t.strip()]
+        filter_types = [
+            t for t in (t.strip() for t in filter_types_str.split(",")) if t
+        ]
         if not filter_types:
             return "❌ 请指定要删除的类型"
         return await _delete_filter_types(filter_service, name, filter_types)
     except (RuntimeError, ValueError, AttributeError) as e:
-        logger.error(f"Failed to delete rule: {e}", exc_info=True)
+        logger.opt(exception=True).error("Failed to delete rule: {}", e)
         return f"❌ 删除失败: {str(e)}"
 
 
@@ -655,7 +657,7 @@ async def _handle_rule_enable(
             return f"✅ 已启用规则组: {name}"
         return f"❌ 未找到规则组: {name}"
     except (RuntimeError, ValueError, AttributeError) as e:
-        logger.error(f"Failed to enable rule group: {e}", exc_info=True)
+        logger.opt(exception=True).error("Failed to enable rule group: {}", e)
         return f"❌ 启用规则组失败: {str(e)}"
 
 
@@ -674,10 +676,27 @@ async def _handle_rule_disable(
             return f"✅ 已禁用规则组: {name}"
         return f"❌ 未找到规则组: {name}"
     except (RuntimeError, ValueError, AttributeError) as e:
-        logger.error(f"Failed to disable rule group: {e}", exc_info=True)
+        logger.opt(exception=True).error("Failed to disable rule group: {}", e)
         return f"❌ 禁用规则组失败: {str(e)}"
 
 
+async def _dispatch_rule_list(
+    filter_service: PatchCardFilterService, _parts: list
+) -> str:
+    """rule list 分发入口（统一为 (filter_service, parts) 签名）"""
+    return await _handle_rule_list(filter_service)
+
+
+# rule 子命令分发表（add 需要用户信息，在 _execute_rule_command 中单独处理）
+_RULE_HANDLERS: Dict[str, Callable[[PatchCardFilterService, list], Awaitable[str]]] = {
+    "list": _dispatch_rule_list,
+    "show": _handle_rule_show,
+    "del": _handle_rule_del,
+    "enable": _handle_rule_enable,
+    "disable": _handle_rule_disable,
+}
+
+
 # 在导入时注册命令元信息（管理员命令）
 register_command(
     name="filter",
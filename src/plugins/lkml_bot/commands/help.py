@@ -1,5 +1,7 @@
 """帮助命令模块"""
 
+from typing import Optional, Tuple
+
 from nonebot import on_message
 from nonebot.rule import to_me
 from nonebot.adapters import Message, Event
@@ -18,6 +20,46 @@ from ..shared import (
 HelpCmd = on_message(rule=to_me(), priority=40, block=False)
 
 
+# 命令列表部分的缓存：(构建时的注册命令数, 渲染结果)
+# 命令在模块导入时注册，注册数变化时才重新渲染
+_help_body_cache: Optional[Tuple[int, str]] = None
+
+
+def _render_command_list() -> str:
+    """渲染命令列表部分（按管理员命令/公开命令分组）
+
+    Returns:
+        命令列表文本
+    """
+    if not COMMAND_REGISTRY:
+        return "目前没有可用命令。"
+
+    admin_lines = []
+    public_lines = []
+    for meta in COMMAND_REGISTRY:
+        line = f"• `{meta.usage}` - {meta.description}"
+        (admin_lines if meta.admin_only else public_lines).append(line)
+
+    parts = []
+    if admin_lines:
+        parts.append("**管理员命令**")
+        parts.extend(admin_lines)
+        parts.append("")
+    if public_lines:
+        parts.append("**公开命令**")
+        parts.extend(public_lines)
+    return "\n".join(parts)
+
+
+def _get_command_list() -> str:
+    """获取命令列表文本（注册数不变时复用缓存）"""
+    global _help_body_cache  # pylint: disable=global-statement
+    count = len(COMMAND_REGISTRY)
+    if _help_body_cache is None or _help_body_cache[0] != count:
+        _help_body_cache = (count, _render_command_list())
+    return _help_body_cache[1]
+
+
 def _build_help_embed() -> tuple[str, str]:
     """构建帮助信息的标题和描述
 
@@ -25,32 +67,8 @@ def _build_help_embed() -> tuple[str, str]:
         (title, description) 元组
     """
     bot_name = get_bot_mention_name()
-
-    description_parts = [f"**命令格式**\n```\n{bot_name} /<子命令> [参数...]\n```"]
-
-    if not COMMAND_REGISTRY:
-        description_parts.append("目前没有可用命令。")
-    else:
-        # 分组显示：管理员命令和公开命令
-        admin_commands = [m for m in COMMAND_REGISTRY if m.get("admin_only")]
-        public_commands = [m for m in COMMAND_REGISTRY if not m.get("admin_only")]
-
-        if admin_commands:
-            description_parts.append("**管理员命令**")
-            for meta in admin_commands:
-                usage = meta.get("usage", "")
-                desc = meta.get("description", "")
-                description_parts.append(f"• `{usage}` - {desc}")
-            description_parts.append("")
-
-        if public_commands:
-            description_parts.append("**公开命令**")
-            for meta in public_commands:
-                usage = meta.get("usage", "")
-                desc = meta.get("description", "")
-                description_parts.append(f"• `{usage}` - {desc}")
-
-    return "LKML Bot 帮助", "\n".join(description_parts)
+    header = f"**命令格式**\n```\n{bot_name} /<子命令> [参数...]\n```"
+    return "LKML Bot 帮助", f"{header}\n{_get_command_list()}"
 
 
 @HelpCmd.handle()
@@ -3,23 +3,20 @@
 import re
 from typing import Optional
 
-import httpx
-from nonebot import on_message
-from nonebot.adapters import Event, Message
+from nonebot.adapters import Event
 from nonebot.exception import FinishedException
 from nonebot.log import logger
-from nonebot.params import EventMessage
-from nonebot.rule import to_me
 
-from lkml.service import LKMLService
+from lkml.service import lkml_service
+from ..client.http_pool import get_http_client
+from ..client.json_codec import dumps_json
 from ..config import get_config
-from ..shared import extract_command, get_user_info_or_finish, register_command
+from ..shared import get_event_channel_id, get_user_info_or_finish
+from ._router import CommandRouter, register_routed_command
 
 # Discord 相关常量
 DISCORD_EMBED_DESCRIPTION_MAX = 4096  # Discord Embed description 最大长度
 
-lkml_service = LKMLService()
-
 
 def _format_names_multiline(names: list[str], per_line: int = 5) -> str:
     """将名称列表格式化为每行固定数量的字符串。
@@ -41,79 +38,52 @@ def _format_names_multiline(names: list[str], per_line: int = 5) -> str:
     return "\n".join(chunks)
 
 
-# 仅当消息 @ 到机器人，并且以 "/subscribe" 开头时处理
-# 优先级设为 50，高于 help (40)，确保优先匹配
-SubscribeCmd = on_message(rule=to_me(), priority=50, block=False)
-
-
-@SubscribeCmd.handle()
-async def handle_subscribe(event: Event, message: Message = EventMessage()):
-    """处理订阅命令
+async def handle_subscribe(event: Event, text: str) -> None:
+    """处理订阅命令（由命令路由器分发）
 
     Args:
         event: 事件对象
-        message: 消息对象
+        text: 以 /subscribe 或 /sub 开头的消息纯文本
     """
-    try:
-        # 获取消息纯文本（Discord 适配器会自动去除 mention）
-        text = message.extract_plain_text().strip()
-        logger.info("Subscribe command handler triggered, text: '%s'", text)
-
-        command_text = extract_command(text, "/subscribe") or extract_command(
-            text, "/sub"
+    parts = text.split(None, 2)
+
+    # 如果没有参数，显示帮助信息
+    if len(parts) < 2:
+        await CommandRouter.finish(
+            "subscribe: 缺少参数\n"
+            "用法: @机器人 /subscribe|/sub <subsystem...> | list | search <keyword>\n"
+            "示例:\n"
+            "  /subscribe list - 查看当前订阅列表\n"
+            "  /subscribe search net - 搜索包含 'net' 的子系统\n"
+            "  /subscribe netdev dri-devel - 批量订阅多个子系统"
         )
-        if command_text is None:
-            logger.debug(
-                "Text does not match '/subscribe' or '/sub', returning. Text: '%s'",
-                text,
-            )
-            return
-
-        parts = command_text.split()
-
-        # 如果没有参数，显示帮助信息
-        if len(parts) == 0:
-            await SubscribeCmd.finish(
-                "subscribe: 缺少参数\n"
-                "用法: @机器人 /subscribe|/sub <subsystem...> | list | search <keyword>\n"
-                "示例:\n"
-                "  /subscribe list - 查看当前订阅列表\n"
-                "  /subscribe search net - 搜索包含 'net' 的子系统\n"
-                "  /subscribe netdev dri-devel - 批量订阅多个子系统"
-            )
-            return
+        return
 
-        # 检查第一个参数是否是已知的子命令
-        first_arg = parts[1].strip().lower()
+    # 检查第一个参数是否是已知的子命令
+    first_arg = parts[1].lower()
 
-        logger.info(f"First argument: {first_arg}")
+    logger.info("First argument: {}", first_arg)
 
-        if first_arg == "list":
-            await _handle_subscribe_list(event)
-            return
+    if first_arg == "list":
+        await _handle_subscribe_list(event)
+        return
 
-        if first_arg == "search":
-            if len(parts) < 3:
-                await SubscribeCmd.finish(
-                    "subscribe search: 缺少搜索关键词\n"
-                    "用法: @机器人 /subscribe search <keyword>"
-                )
-                return
-            keyword = " ".join(parts[2:]).strip()
-            logger.info(f"Keyword: {keyword}")
-            await _handle_subscribe_search(keyword, event)
+    if first_arg == "search":
+        if len(parts) < 3:
+            await CommandRouter.finish(
+                "subscribe search: 缺少搜索关键词\n"
+                "用法: @机器人 /subscribe search <keyword>"
+            )
             return
+        keyword = parts[2]
+        logger.info("Keyword: {}", keyword)
+        await _handle_subscribe_search(keyword, event)
+        return
 
-        # 如果不是子命令，则将所有参数视为子系统名称进行批量订阅
-        # 获取用户信息
-        user_id, user_name = await get_user_info_or_finish(event, SubscribeCmd)
-        await _handle_subscribe_batch(parts, user_id, user_name)
-    except FinishedException:  # pylint: disable=try-except-raise
-        # FinishedException 由 matcher.finish() 抛出，需要重新抛出以终止处理
-        raise
-    except (ValueError, RuntimeError, AttributeError) as e:
-        logger.error("Unexpected error in handle_subscribe: %s", e, exc_info=True)
-        await SubscribeCmd.finish(f"❌ 处理命令时发生错误: {str(e)}")
+    # 如果不是子命令，则将所有参数视为子系统名称进行批量订阅
+    # 获取用户信息
+    user_id, user_name = await get_user_info_or_finish(event, CommandRouter)
+    await _handle_subscribe_batch(parts, user_id, user_name)
 
 
 async def _handle_subscribe_list(event: Optional[Event] = None) -> None:
@@ -129,11 +99,9 @@ async def _handle_subscribe_list(event: Optional[Event] = None) -> None:
         subscribed_set = set(subscribed)
 
         await _send_discord_embed_list(subscribed, subscribed_set, supported, event)
-    except FinishedException:
-        raise
     except (ValueError, RuntimeError, AttributeError) as e:
-        logger.error("Error in list subcommands: %s", e, exc_info=True)
-        await SubscribeCmd.finish(f"❌ 列表查询时发生错误: {str(e)}")
+        logger.opt(exception=True).error("Error in list subcommands: {}", e)
+        await CommandRouter.finish(f"❌ 列表查询时发生错误: {str(e)}")
 
 
 async def _send_subscribed_embed(
@@ -164,13 +132,13 @@ async def _send_subscribed_embed(
         "footer": {"text": "LKML Bot"},
     }
 
-    async with httpx.AsyncClient() as client:
-        await client.post(
-            f"https://discord.com/api/v10/channels/{channel_id}/messages",
-            json={"embeds": [embed]},
-            headers=headers,
-            timeout=30.0,
-        )
+    client = get_http_client()
+    await client.post(
+        f"https://discord.com/api/v10/channels/{channel_id}/messages",
+        content=dumps_json({"embeds": [embed]}),
+        headers=headers,
+        timeout=30.0,
+    )
 
 
 async def _send_discord_embed_list(
@@ -190,12 +158,10 @@ async def _send_discord_embed_list(
     try:
         config = get_config()
         if not config.discord_bot_token or not config.platform_channel_id:
-            await SubscribeCmd.finish("❌ Discord 配置未设置")
+            await CommandRouter.finish("❌ Discord 配置未设置")
             return
 
-        channel_id = config.platform_channel_id
-        if event and hasattr(event, "channel_id"):
-            channel_id = str(event.channel_id)
+        channel_id = get_event_channel_id(event, config.platform_channel_id)
 
         headers = {
             "Authorization": f"Bot {config.discord_bot_token}",
@@ -224,22 +190,22 @@ async def _send_discord_embed_list(
             "footer": {"text": "LKML Bot"},
         }
 
-        async with httpx.AsyncClient() as client:
-            await client.post(
-                f"https://discord.com/api/v10/channels/{channel_id}/messages",
-                json={"embeds": [unsubscribed_embed]},
-                headers=headers,
-                timeout=30.0,
-            )
+        client = get_http_client()
+        await client.post(
+            f"https://discord.com/api/v10/channels/{channel_id}/messages",
+            content=dumps_json({"embeds": [unsubscribed_embed]}),
+            headers=headers,
+            timeout=30.0,
+        )
 
-        await SubscribeCmd.finish()
+        await CommandRouter.finish()
 
     except FinishedException:
         # 正常结束流程，向上抛出让 NoneBot 处理
         raise
     except Exception as e:  # pylint: disable=broad-except
-        logger.error(f"Error sending Discord embed list: {e}", exc_info=True)
-        await SubscribeCmd.finish(f"❌ 发送订阅列表时发生错误: {str(e)}")
+        logger.opt(exception=True).error("Error sending Discord embed list: {}", e)
+        await CommandRouter.finish(f"❌ 发送订阅列表时发生错误: {str(e)}")
 
 
 async def _handle_subscribe_search(keyword: str, event: Optional[Event] = None) -> None:
@@ -252,7 +218,7 @@ async def _handle_subscribe_search(keyword: str, event: Optional[Event] = None)
     try:
         config = get_config()
         supported = config.get_supported_subsystems()
-        logger.info(f"Supported subsystems: {supported}")
+        logger.info("Supported subsystems: {}", supported)
         subscribed = await lkml_service.get_subscribed_subsystems()
         subscribed_set = set(subscribed)
 
@@ -261,7 +227,7 @@ async def _handle_subscribe_search(keyword: str, event: Optional[Event] = None)
         matches = [name for name in supported if keyword_lower in name.lower()]
 
         if not matches:
-            await SubscribeCmd.finish(
+            await CommandRouter.finish(
                 f"🔍 搜索 '{keyword}': 未找到匹配的子系统\n"
                 f"提示: 使用 /subscribe list 查看所有可订阅的子系统"
             )
@@ -271,11 +237,9 @@ async def _handle_subscribe_search(keyword: str, event: Optional[Event] = None)
         matches.sort(key=lambda x: (x not in subscribed_set, x.lower()))
 
         await _send_search_result(keyword, matches, subscribed_set, config, event)
-    except FinishedException:
-        raise
     except (ValueError, RuntimeError, AttributeError) as e:
-        logger.error("Error in search subcommand: %s", e, exc_info=True)
-        await SubscribeCmd.finish(f"❌ 搜索时发生错误: {str(e)}")
+        logger.opt(exception=True).error("Error in search subcommand: {}", e)
+        await CommandRouter.finish(f"❌ 搜索时发生错误: {str(e)}")
 
 
 async def _handle_subscribe_batch(
@@ -291,32 +255,30 @@ async def _handle_subscribe_batch(
     # 将所有部分合并，支持逗号或空格分隔
     # parts[0] 是命令本身（/subscribe 或 /sub），需要排除
     raw_args = " ".join(parts[1:]) if len(parts) > 1 else ""
-    targets = [x.strip() for x in re.split(r"[,\s]+", raw_args) if x.strip()]
+    targets = [x for x in re.split(r"[,\s]+", raw_args) if x]
     if not targets:
-        await SubscribeCmd.finish("subscribe: 子系统名称不能为空")
+        await CommandRouter.finish("subscribe: 子系统名称不能为空")
         return
 
-    logger.info("Processing batch subscribe for subsystems: %s", targets)
+    logger.info("Processing batch subscribe for subsystems: {}", targets)
 
     try:
         config = get_config()
-        supported = set(config.get_supported_subsystems())
+        supported = config.get_supported_subsystems_set()
         prev_subscribed = set(await lkml_service.get_subscribed_subsystems())
 
         result_lines = await _subscribe_targets(
             targets, supported, prev_subscribed, user_id, user_name
         )
-        await SubscribeCmd.finish("\n".join(result_lines))
-    except FinishedException:
-        raise
+        await CommandRouter.finish("\n".join(result_lines))
     except (ValueError, RuntimeError, AttributeError) as e:
-        logger.error("Error in batch subscribe: %s", e, exc_info=True)
-        await SubscribeCmd.finish(f"❌ 订阅时发生错误: {str(e)}")
+        logger.opt(exception=True).error("Error in batch subscribe: {}", e)
+        await CommandRouter.finish(f"❌ 订阅时发生错误: {str(e)}")
 
 
 async def _subscribe_targets(
     targets: list[str],
-    supported: set[str],
+    supported: frozenset[str],
     prev_subscribed: set[str],
     user_id: str,
     user_name: str,
@@ -343,10 +305,8 @@ async def _subscribe_targets(
                 already_subscribed.append(name)
             else:
                 newly_subscribed.append(name)
-        except FinishedException:
-            raise
         except (ValueError, RuntimeError, AttributeError) as e:
-            logger.error("Error subscribing %s: %s", name, e, exc_info=True)
+            logger.opt(exception=True).error("Error subscribing {}: {}", name, e)
             failed.append(name)
 
     lines: list[str] = ["subscribe: 批量订阅结果"]
@@ -386,13 +346,11 @@ async def _send_search_result(
         if unsubscribed_matches:
             unsubscribed_text = _format_names_multiline(sorted(unsubscribed_matches))
             lines.append(f"📦 未订阅:\n{unsubscribed_text}")
-        await SubscribeCmd.finish("\n".join(lines))
+        await CommandRouter.finish("\n".join(lines))
         return
 
     # Discord 渠道 ID：优先使用事件中的 channel_id，其次使用配置
-    channel_id = config.platform_channel_id
-    if event and hasattr(event, "channel_id"):
-        channel_id = str(event.channel_id)
+    channel_id = get_event_channel_id(event, config.platform_channel_id)
 
     # 构造 Embed 内容，样式参考订阅列表（每行最多 5 个）
     subscribed_text = (
@@ -427,21 +385,22 @@ async def _send_search_result(
         "Content-Type": "application/json",
     }
 
-    async with httpx.AsyncClient() as client:
-        await client.post(
-            f"https://discord.com/api/v10/channels/{channel_id}/messages",
-            json={"embeds": [embed]},
-            headers=headers,
-            timeout=30.0,
-        )
+    client = get_http_client()
+    await client.post(
+        f"https://discord.com/api/v10/channels/{channel_id}/messages",
+        content=dumps_json({"embeds": [embed]}),
+        headers=headers,
+        timeout=30.0,
+    )
 
-    await SubscribeCmd.finish()
+    await CommandRouter.finish()
 
 
-# 在导入时注册命令元信息（非管理员命令）
-register_command(
+# 在导入时注册命令元信息和路由（非管理员命令）
+register_routed_command(
     name="subscribe",
     usage="/(subscribe | sub) <subsystem...> | list | search <keyword>",
     description="订阅子系统；查看订阅列表；搜索子系统；批量订阅",
-    admin_only=False,
+    handler=handle_subscribe,
+    aliases=("sub",),
 )
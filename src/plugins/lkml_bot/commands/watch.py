@@ -11,7 +11,6 @@ from nonebot.rule import to_me
 from nonebot.adapters import Message, Event
 from nonebot.adapters.discord import MessageCreateEvent
 from nonebot.params import EventMessage
-from nonebot.exception import FinishedException
 from nonebot.log import logger
 
 from lkml.feed.feed_message_classifier import parse_patch_subject
@@ -23,8 +22,8 @@ from lkml.service import (
 )
 from lkml.service.types import FeedMessage
 
-from ..client.discord_client import check_thread_exists
-
+from ..client.discord_thread import check_thread_exists
+from ..config import get_config
 from ..shared import (
     register_command,
     extract_command,
@@ -63,10 +62,10 @@ async def handle_watch(_event: Event, message: Message = EventMessage()):
 
     # 只处理 MessageCreateEvent
     if not isinstance(_event, MessageCreateEvent):
-        logger.debug(f"[watch] Ignoring non-create event: {type(_event).__name__}")
+        logger.debug("[watch] Ignoring non-create event: {}", type(_event).__name__)
         return
 
-    logger.info(f"[watch] Received watch command: {msg_text}")
+    logger.info("[watch] Received watch command: {}", msg_text)
 
     try:
         # 1. 验证命令并获取参数
@@ -97,16 +96,16 @@ async def handle_watch(_event: Event, message: Message = EventMessage()):
 
         # 6. 发送成功消息
         logger.info(
-            f"User {user_name} successfully watched PATCH: {patch_card.subject}, "
-            f"Thread ID: {thread_id}"
+            "User {} successfully watched PATCH: {}, Thread ID: {}",
+            user_name,
+            patch_card.subject,
+            thread_id,
         )
         success_msg = _build_success_message(patch_card, thread_id, should_recreate)
         await WatchCmd.finish(success_msg)
 
-    except FinishedException:  # pylint: disable=try-except-raise
-        raise
     except (ValueError, KeyError, AttributeError) as e:
-        logger.error(f"Data error watching PATCH: {e}", exc_info=True)
+        logger.opt(exception=True).error("Data error watching PATCH: {}", e)
         await WatchCmd.finish("❌ 关注失败，请联系管理员查看日志")
 
 
@@ -124,10 +123,10 @@ async def _validate_command(
     # 匹配 /watch 或 /w
     cmd_text = extract_command(msg_text, "/watch") or extract_command(msg_text, "/w")
     if not cmd_text:
-        logger.debug(f"[watch] Not a watch command, ignoring. Message: '{msg_text}'")
+        logger.debug("[watch] Not a watch command, ignoring. Message: '{}'", msg_text)
         return None, None
 
-    logger.info(f"[watch] Processing command: {cmd_text}")
+    logger.info("[watch] Processing command: {}", cmd_text)
 
     # 获取用户信息
     user_info = await get_user_info_or_finish(event, matcher)
@@ -141,7 +140,9 @@ async def _validate_command(
     if not message_id_header:
         return None, None
 
-    logger.info(f"User {user_name} ({user_id}) watching PATCH: {message_id_header}")
+    logger.info(
+        "User {} ({}) watching PATCH: {}", user_name, user_id, message_id_header
+    )
 
     return message_id_header, user_info
 
@@ -164,11 +165,10 @@ def _parse_message_id(cmd_text: str, matcher) -> Optional[str]:
         return None
 
     # 清理输入
-    message_id = parts[1].strip()
-    message_id = message_id.replace("\n", "").replace("\r", "").replace("\t", "")
+    message_id = parts[1].replace("\n", "").replace("\r", "").replace("\t", "")
     message_id = " ".join(message_id.split())
 
-    logger.debug(f"[watch] Cleaned message_id_header: '{message_id}'")
+    logger.debug("[watch] Cleaned message_id_header: '{}'", message_id)
 
     return message_id
 
@@ -235,8 +235,8 @@ async def _find_or_create_patch_card(
             and not patch_card.is_cover_letter
         ):
             logger.info(
-                f"Found sub-patch card, looking for Cover Letter: "
-                f"{patch_card.series_message_id}"
+                "Found sub-patch card, looking for Cover Letter: {}",
+                patch_card.series_message_id,
             )
             result = await _find_or_create_cover_letter_from_id(
                 patch_card.series_message_id, matcher
@@ -265,8 +265,8 @@ async def _find_or_create_patch_card(
         and patch_info.index > 0
     ):
         logger.info(
-            f"Found sub-patch in feed_messages, looking for Cover Letter: "
-            f"{feed_message.series_message_id}"
+            "Found sub-patch in feed_messages, looking for Cover Letter: {}",
+            feed_message.series_message_id,
         )
         result = await _find_or_create_cover_letter_from_id(
             feed_message.series_message_id, matcher
@@ -284,8 +284,9 @@ async def _find_feed_message(message_id_header: str, matcher):
 
     if not feed_message:
         logger.warning(
-            f"PATCH not found in feed_messages: '{message_id_header}' "
-            f"(length: {len(message_id_header)})"
+            "PATCH not found in feed_messages: '{}' (length: {})",
+            message_id_header,
+            len(message_id_header),
         )
         await matcher.finish(
             f"❌ 未找到 PATCH: `{message_id_header}`\n\n"
@@ -327,8 +328,6 @@ async def _create_patch_card(feed_message, patch_info, matcher) -> Optional[Patc
     2. 保存到数据库
     """
     try:
-        from ..config import get_config
-
         config = get_config()
 
         # 1. 构建 PatchCard 数据
@@ -350,7 +349,8 @@ async def _create_patch_card(feed_message, patch_info, matcher) -> Optional[Patc
 
         if not platform_message_id:
             logger.error(
-                f"Failed to send PATCH card to Discord: {feed_message.message_id_header}"
+                "Failed to send PATCH card to Discord: {}",
+                feed_message.message_id_header,
             )
             await matcher.finish(
                 f"❌ 创建 PATCH 订阅记录失败: `{feed_message.message_id_header}`\n\n"
@@ -370,16 +370,19 @@ async def _create_patch_card(feed_message, patch_info, matcher) -> Optional[Patc
             )
 
         logger.info(
-            f"Created PATCH card from FeedMessage: {feed_message.message_id_header}, "
-            f"subject: {feed_message.subject[:50]}, "
-            f"platform_message_id: {platform_message_id}"
+            "Created PATCH card from FeedMessage: {}, subject: {}, "
+            "platform_message_id: {}",
+            feed_message.message_id_header,
+            feed_message.subject[:50],
+            platform_message_id,
         )
 
         return patch_card
 
     except (ValueError, KeyError, AttributeError) as e:
-        logger.error(
-            f"Failed to create PATCH card from FeedMessage: {e}", exc_info=True
+        logger.opt(exception=True).error(
+            "Failed to create PATCH card from FeedMessage: {}",
+            e,
         )
         await matcher.finish(
             f"❌ 创建 PATCH 订阅记录失败: `{feed_message.message_id_header}`\n\n"
@@ -472,30 +475,32 @@ async def _check_existing_thread(
     # 检查是否标记为 inactive
     if not existing_thread.is_active:
         logger.info(
-            f"Found inactive Thread for PATCH {patch_card.message_id_header}, "
-            f"will recreate. Old Thread ID: {existing_thread.thread_id}"
+            "Found inactive Thread for PATCH {}, will recreate. Old Thread ID: {}",
+            patch_card.message_id_header,
+            existing_thread.thread_id,
         )
         async with get_thread_service() as service:
             await service.delete(existing_thread.thread_id)
         return None, True
 
     # 验证 Discord Thread 是否真的存在
-    from ..config import get_config
-
     config = get_config()
     thread_exists = await check_thread_exists(config, existing_thread.thread_id)
 
     if thread_exists:
         logger.info(
-            f"Thread {existing_thread.thread_id} exists in Discord "
-            f"for PATCH {patch_card.message_id_header}"
+            "Thread {} exists in Discord for PATCH {}",
+            existing_thread.thread_id,
+            patch_card.message_id_header,
         )
         return existing_thread, False
 
     # Thread 不存在，需要重建
     logger.warning(
-        f"Thread {existing_thread.thread_id} marked as active but "
-        f"doesn't exist in Discord, will recreate for PATCH {patch_card.message_id_header}"
+        "Thread {} marked as active but doesn't exist in Discord, "
+        "will recreate for PATCH {}",
+        existing_thread.thread_id,
+        patch_card.message_id_header,
     )
 
     async with get_thread_service() as service:
@@ -507,13 +512,15 @@ async def _check_existing_thread(
 
 async def _handle_existing_thread(existing_thread, patch_card, matcher):
     """处理已存在的 Thread"""
-    logger.info(f"Thread {existing_thread.thread_id} exists in Discord, returning link")
+    logger.info(
+        "Thread {} exists in Discord, returning link", existing_thread.thread_id
+    )
 
     # 标记 PatchCard 为已建立 Thread
     if not patch_card.has_thread:
         logger.info(
-            f"Thread exists but PATCH {patch_card.message_id_header} "
-            f"is not marked as has_thread, marking now"
+            "Thread exists but PATCH {} is not marked as has_thread, marking now",
+            patch_card.message_id_header,
         )
         async with get_patch_card_service() as service:
             await service.mark_as_has_thread(patch_card.message_id_header)
@@ -546,8 +553,8 @@ async def _create_new_thread(patch_card: PatchCard, matcher) -> Optional[str]:
 
         if not overview_data:
             logger.error(
-                f"Failed to prepare thread overview data "
-                f"for {patch_card.message_id_header}"
+                "Failed to prepare thread overview data for {}",
+                patch_card.message_id_header,
             )
             await matcher.finish(
                 f"❌ 创建 Thread 失败: `{patch_card.message_id_header}`\n\n"
@@ -584,30 +591,33 @@ async def _create_new_thread(patch_card: PatchCard, matcher) -> Optional[str]:
             )
             return None
 
-        logger.info(f"Created Discord Thread: {thread_name} (ID: {thread_id})")
+        logger.info("Created Discord Thread: {} (ID: {})", thread_name, thread_id)
 
         # 3. 保存 Thread 记录
         async with get_thread_service() as service:
             await service.create(patch_card.message_id_header, thread_id, thread_name)
             logger.info(
-                f"Created Thread record: thread_id={thread_id}, "
-                f"message_id_header={patch_card.message_id_header}, "
-                f"name={thread_name}"
+                "Created Thread record: thread_id={}, message_id_header={}, name={}",
+                thread_id,
+                patch_card.message_id_header,
+                thread_name,
             )
 
             # 保存子 PATCH 消息映射
             if sub_patch_messages:
                 await service.update_sub_patch_messages(thread_id, sub_patch_messages)
                 logger.info(
-                    f"Saved {len(sub_patch_messages)} sub-patch messages "
-                    f"for thread {thread_id}"
+                    "Saved {} sub-patch messages for thread {}",
+                    len(sub_patch_messages),
+                    thread_id,
                 )
 
         # 4. 标记 PatchCard 为已建立 Thread
         async with get_patch_card_service() as service:
             await service.mark_as_has_thread(patch_card.message_id_header)
             logger.info(
-                f"Marked patch card as has_thread: {patch_card.message_id_header}"
+                "Marked patch card as has_thread: {}",
+                patch_card.message_id_header,
             )
 
         return thread_id
@@ -617,7 +627,7 @@ async def _create_new_thread(patch_card: PatchCard, matcher) -> Optional[str]:
         ValueError,
         AttributeError,
     ) as e:
-        logger.error(f"Failed to create new thread: {e}", exc_info=True)
+        logger.opt(exception=True).error("Failed to create new thread: {}", e)
         await matcher.finish("❌ 创建 Thread 失败\n\n请联系管理员查看日志。")
         return None
 
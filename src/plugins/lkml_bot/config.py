@@ -1,7 +1,7 @@
 """插件配置管理模块（包含机器人特定配置）"""
 
 import os
-from typing import Optional
+from typing import FrozenSet, Optional
 
 from lkml.config import LKMLConfig as BaseLKMLConfig
 
@@ -15,6 +15,9 @@ class PluginConfig(BaseLKMLConfig):
     platform_channel_id: str = ""  # Discord 频道 ID（用于发送消息和创建 Thread）
     bot_mention_name: str = "@lkml-bot"  # Bot 在消息中的提及名称
     feishu_webhook_url: str = ""
+    feishu_dedup_ttl_seconds: int = 60  # 相同卡片的去重窗口（秒），0 表示关闭
+    # 管理员 Discord 用户 ID 集合（加载时解析一次，权限检查为 O(1) 成员判断；为空表示不限制）
+    discord_admin_user_ids: FrozenSet[str] = frozenset()
 
     # Thread 相关配置
     thread_subscription_timeout_hours: int = 24  # 订阅卡片过期时间（小时）
@@ -33,20 +36,29 @@ class PluginConfig(BaseLKMLConfig):
         # 先创建基础配置（已经处理了所有基础配置的环境变量和默认值）
         base_config = BaseLKMLConfig.from_env()
 
+        # 只取一次环境变量映射，后续读取都在同一个映射上进行
+        env = os.environ
+
         # 获取 Discord 相关配置
-        discord_webhook_url = os.getenv("LKML_DISCORD_WEBHOOK_URL", "")
-        discord_bot_token = os.getenv("LKML_DISCORD_BOT_TOKEN", "")
-        platform_channel_id = os.getenv("LKML_DISCORD_CHANNEL_ID", "")
-        bot_mention_name = os.getenv("LKML_BOT_MENTION_NAME", "@lkml-bot")
-        feishu_webhook_url = os.getenv("LKML_FEISHU_WEBHOOK_URL", "")
+        discord_webhook_url = env.get("LKML_DISCORD_WEBHOOK_URL", "")
+        discord_bot_token = env.get("LKML_DISCORD_BOT_TOKEN", "")
+        platform_channel_id = env.get("LKML_DISCORD_CHANNEL_ID", "")
+        bot_mention_name = env.get("LKML_BOT_MENTION_NAME", "@lkml-bot")
+        feishu_webhook_url = env.get("LKML_FEISHU_WEBHOOK_URL", "")
+        feishu_dedup_ttl_seconds = int(env.get("LKML_FEISHU_DEDUP_TTL_SECONDS", "60"))
+        discord_admin_user_ids = frozenset(
+            s.strip()
+            for s in env.get("LKML_DISCORD_ADMIN_USER_IDS", "").split(",")
+            if s.strip()
+        )
 
         # Thread 相关配置
         thread_subscription_timeout_hours = int(
-            os.getenv("LKML_THREAD_SUBSCRIPTION_TIMEOUT_HOURS", "24")
+            env.get("LKML_THREAD_SUBSCRIPTION_TIMEOUT_HOURS", "24")
         )
-        thread_pool_max_size = int(os.getenv("LKML_THREAD_POOL_MAX_SIZE", "50"))
+        thread_pool_max_size = int(env.get("LKML_THREAD_POOL_MAX_SIZE", "50"))
         card_builder_interval_minutes = int(
-            os.getenv("LKML_CARD_BUILDER_INTERVAL_MINUTES", "5")
+            env.get("LKML_CARD_BUILDER_INTERVAL_MINUTES", "5")
         )
 
         return cls(
@@ -60,6 +72,8 @@ class PluginConfig(BaseLKMLConfig):
             platform_channel_id=platform_channel_id,
             bot_mention_name=bot_mention_name,
             feishu_webhook_url=feishu_webhook_url,
+            feishu_dedup_ttl_seconds=feishu_dedup_ttl_seconds,
+            discord_admin_user_ids=discord_admin_user_ids,
             thread_subscription_timeout_hours=thread_subscription_timeout_hours,
             thread_pool_max_size=thread_pool_max_size,
             card_builder_interval_minutes=card_builder_interval_minutes,
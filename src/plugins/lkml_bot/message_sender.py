@@ -7,7 +7,7 @@ from nonebot.log import logger
 
 from lkml.feed import SubsystemUpdate
 from .adapters.discord_adapter import DiscordAdapter
-from .renders import DiscordRenderer
+from .renders.discord_render import DiscordRenderer
 
 
 class MessageSender:  # pylint: disable=too-few-public-methods
@@ -8,7 +8,10 @@ Service 层只关心“有一个 PatchCard 要发送”，以及“用于持久
 和频道 ID”（目前选择 Discord 作为主平台），具体多平台细节由本模块处理。
 """
 
-from typing import Optional, Tuple
+import asyncio
+import copy
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Tuple
 
 from nonebot.log import logger
 
@@ -21,6 +24,39 @@ from .renders.patch_card.renderer import PatchCardRenderer
 from .renders.patch_card.feishu_render import FeishuPatchCardRenderer
 
 
+class _PatchCardRenderCache:  # pylint: disable=too-few-public-methods
+    """PatchCard 渲染结果缓存
+
+    同一张卡片（按 message_id 和各字段内容判断）再次发送时（如上次发送失败后
+    下一轮监控重建并重发），直接复用上次的渲染结果，跳过模板格式化。
+    """
+
+    def __init__(self, maxsize: int = 128):
+        self._maxsize = maxsize
+        # {(平台, message_id): (渲染时的 PatchCard 快照, 渲染结果)}
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[PatchCard, Any]]" = (
+            OrderedDict()
+        )
+
+    def get_or_render(
+        self, platform: str, patch_card: PatchCard, render: Callable[[PatchCard], Any]
+    ) -> Any:
+        """获取缓存的渲染结果，卡片内容有变化或未缓存时重新渲染"""
+        key = (platform, patch_card.message_id_header)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == patch_card:
+            self._entries.move_to_end(key)
+            return entry[1]
+
+        rendered = render(patch_card)
+        # 保存浅拷贝作为快照，避免调用方之后修改卡片字段导致误命中
+        self._entries[key] = (copy.copy(patch_card), rendered)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+        return rendered
+
+
 class MultiPlatformPatchCardSender:  # pylint: disable=too-few-public-methods
     """PatchCard 多平台发送服务
 
@@ -40,12 +76,22 @@ class MultiPlatformPatchCardSender:  # pylint: disable=too-few-public-methods
         self.discord_renderer = discord_renderer
         self.feishu_client = feishu_client
         self.feishu_renderer = feishu_renderer
+        self._render_cache = _PatchCardRenderCache()
+        # Discord 频道 ID 来自进程级配置，构造时取一次快照（用于 Reply 通知）
+        channel_id = getattr(
+            getattr(discord_client, "config", None), "platform_channel_id", ""
+        )
+        self._discord_channel_id: str = (
+            str(channel_id) if channel_id is not None else ""
+        )
 
     async def send_patch_card(
         self, patch_card: PatchCard
     ) -> Tuple[Optional[str], Optional[str]]:
         """发送 PatchCard 到各个平台
 
+        各平台互不依赖，并发发送。
+
         Args:
             patch_card: PatchCard 渲染数据
 
@@ -54,77 +100,98 @@ class MultiPlatformPatchCardSender:  # pylint: disable=too-few-public-methods
             - 当前选择 Discord 作为主平台：返回 Discord 消息 ID 和频道 ID
             - 如果 Discord 发送失败，则返回 (None, None)
         """
+        # 未配置 Feishu 时只有 Discord 一路，直接 await，不创建 gather 任务
+        if not self.feishu_client.is_configured:
+            return await self._send_patch_card_to_discord(patch_card)
+
+        discord_result, _ = await asyncio.gather(
+            self._send_patch_card_to_discord(patch_card),
+            self._send_patch_card_to_feishu(patch_card),
+        )
+        return discord_result
+
+    async def _send_patch_card_to_discord(
+        self, patch_card: PatchCard
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """渲染并发送 PatchCard 到 Discord，返回 (消息 ID, 频道 ID)"""
         platform_message_id: Optional[str] = None
         platform_channel_id: Optional[str] = None
 
-        # 1) Discord：渲染并发送
         try:
-            discord_rendered = self.discord_renderer.render(patch_card)
-            platform_message_id = await self.discord_client.send_patch_card(
-                discord_rendered
+            discord_rendered = self._render_cache.get_or_render(
+                "discord", patch_card, self.discord_renderer.render
+            )
+            platform_message_id, platform_channel_id = (
+                await self.discord_client.send_patch_card(discord_rendered)
             )
             if platform_message_id:
-                # Discord 频道 ID 从配置中获取
-                channel_id = getattr(
-                    getattr(self.discord_client, "config", None),
-                    "platform_channel_id",
-                    "",
-                )
-                platform_channel_id = str(channel_id) if channel_id is not None else ""
                 logger.info(
-                    "Sent PATCH card to Discord: message_id=%s, channel_id=%s",
+                    "Sent PATCH card to Discord: message_id={}, channel_id={}",
                     platform_message_id,
                     platform_channel_id,
                 )
             else:
                 logger.warning("Failed to send PATCH card to Discord")
         except Exception as e:  # pylint: disable=broad-except
-            logger.error("Error sending PATCH card to Discord: %s", e, exc_info=True)
+            logger.opt(exception=True).error(
+                "Error sending PATCH card to Discord: {}", e
+            )
+
+        return platform_message_id, platform_channel_id
 
-        # 2) Feishu：渲染并发送
+    async def _send_patch_card_to_feishu(self, patch_card: PatchCard) -> None:
+        """渲染并发送 PatchCard 到 Feishu"""
+        if not self.feishu_client.is_configured:
+            return
         try:
-            feishu_rendered = self.feishu_renderer.render(patch_card)
+            feishu_rendered = self._render_cache.get_or_render(
+                "feishu", patch_card, self.feishu_renderer.render
+            )
             await self.feishu_client.send_patch_card(feishu_rendered)
         except Exception as e:  # pylint: disable=broad-except
-            logger.warning(f"Error sending PATCH card to Feishu: {e}", exc_info=True)
-
-        return platform_message_id, platform_channel_id
+            logger.opt(exception=True).warning(
+                "Error sending PATCH card to Feishu: {}", e
+            )
 
     async def send_reply_notification(self, payload: dict) -> None:
-        """发送 Reply 视角通知消息到各平台"""
-        # 1) Discord：发送 embed 到频道
+        """发送 Reply 视角通知消息到各平台（各平台并发发送）"""
+        if not self.feishu_client.is_configured:
+            await self._send_reply_notification_to_discord(payload)
+            return
+
+        await asyncio.gather(
+            self._send_reply_notification_to_discord(payload),
+            self._send_reply_notification_to_feishu(payload),
+        )
+
+    async def _send_reply_notification_to_discord(self, payload: dict) -> None:
+        """发送 embed 到 Discord 频道"""
+        if not self._discord_channel_id:
+            logger.warning("Discord channel ID not configured for reply notification")
+            return
         try:
-            channel_id = getattr(
-                getattr(self.discord_client, "config", None),
-                "platform_channel_id",
-                "",
+            # 使用 Discord renderer 渲染
+            discord_rendered = self.discord_renderer.render_reply_notification(payload)
+            message_id = await send_channel_embed(
+                self.discord_client.config,
+                discord_rendered.title,
+                discord_rendered.description,
+                url=discord_rendered.url,
+                color=discord_rendered.embed_color,
             )
-            if not channel_id:
-                logger.warning(
-                    "Discord channel ID not configured for reply notification"
-                )
+            if message_id:
+                logger.info("Sent reply notification to Discord: {}", message_id)
             else:
-                # 使用 Discord renderer 渲染
-                discord_rendered = self.discord_renderer.render_reply_notification(
-                    payload
-                )
-                message_id = await send_channel_embed(
-                    self.discord_client.config,
-                    discord_rendered.title,
-                    discord_rendered.description,
-                    url=discord_rendered.url,
-                    color=discord_rendered.embed_color,
-                )
-                if message_id:
-                    logger.info("Sent reply notification to Discord: %s", message_id)
-                else:
-                    logger.warning("Failed to send reply notification to Discord")
+                logger.warning("Failed to send reply notification to Discord")
         except Exception as e:  # pylint: disable=broad-except
-            logger.error(
-                "Error sending reply notification to Discord: %s", e, exc_info=True
+            logger.opt(exception=True).error(
+                "Error sending reply notification to Discord: {}", e
             )
 
-        # 2) Feishu：发送卡片消息
+    async def _send_reply_notification_to_feishu(self, payload: dict) -> None:
+        """发送卡片消息到 Feishu"""
+        if not self.feishu_client.is_configured:
+            return
         try:
             # 使用 Feishu renderer 渲染
             feishu_rendered = self.feishu_renderer.render_reply_notification(payload)
@@ -135,4 +202,4 @@ class MultiPlatformPatchCardSender:  # pylint: disable=too-few-public-methods
             if not success:
                 logger.warning("Reply notification not sent to Feishu")
         except Exception as e:  # pylint: disable=broad-except
-            logger.warning("Error sending reply notification to Feishu: %s", e)
+            logger.warning("Error sending reply notification to Feishu: {}", e)
@@ -8,6 +8,7 @@ Service 层只关心"有一个 Thread Overview 要发送/更新"，
 具体多平台细节由本模块处理。
 """
 
+import asyncio
 from typing import Dict, Optional, Tuple
 
 from nonebot.log import logger
@@ -64,8 +65,10 @@ class MultiPlatformThreadSender:  # pylint: disable=too-few-public-methods
                 thread_name, message_id
             )
             if thread_id:
-                # 渲染并发送
-                discord_rendered = self.discord_renderer.render(overview_data)
+                # 渲染并发送（回复树渲染是纯 CPU 计算，放到线程中执行，避免阻塞事件循环）
+                discord_rendered = await asyncio.to_thread(
+                    self.discord_renderer.render, overview_data
+                )
                 sub_patch_messages = await self.discord_client.send_thread_overview(
                     thread_id, discord_rendered
                 )
@@ -85,13 +88,8 @@ class MultiPlatformThreadSender:  # pylint: disable=too-few-public-methods
             )
 
         # 2) Feishu：发送 Thread 创建通知卡片
-        try:
-            feishu_rendered = self.feishu_renderer.render_create_notification(
-                overview_data
-            )
-            await self.feishu_client.send_thread_overview("", feishu_rendered)
-        except Exception as e:  # pylint: disable=broad-except
-            logger.warning("Error sending Feishu thread creation notification: %s", e)
+        if self.feishu_client.is_configured:
+            await self._send_feishu_create_notification(overview_data)
 
         return thread_id, sub_patch_messages
 
@@ -115,8 +113,9 @@ class MultiPlatformThreadSender:  # pylint: disable=too-few-public-methods
 
         # 1) Discord：更新 Thread 消息
         try:
-            discord_rendered = self.discord_renderer.render_overview_message(
-                overview_data
+            # 回复树渲染是纯 CPU 计算，放到线程中执行，避免阻塞事件循环
+            discord_rendered = await asyncio.to_thread(
+                self.discord_renderer.render_overview_message, overview_data
             )
             success = await self.discord_client.update_thread_overview(
                 thread_id, message_id, discord_rendered
@@ -131,15 +130,34 @@ class MultiPlatformThreadSender:  # pylint: disable=too-few-public-methods
             logger.error("Error updating Discord Thread message: %s", e, exc_info=True)
 
         # 2) Feishu：发送 Thread 更新通知卡片
+        if self.feishu_client.is_configured:
+            await self._send_feishu_update_notification(overview_data)
+
+        return success
+
+    async def _send_feishu_create_notification(
+        self, overview_data: ThreadOverviewData
+    ) -> None:
+        """渲染并发送 Feishu Thread 创建通知卡片"""
+        try:
+            feishu_rendered = self.feishu_renderer.render_create_notification(
+                overview_data
+            )
+            await self.feishu_client.send_thread_overview("", feishu_rendered)
+        except Exception as e:  # pylint: disable=broad-except
+            logger.warning("Error sending Feishu thread creation notification: {}", e)
+
+    async def _send_feishu_update_notification(
+        self, overview_data: ThreadOverviewData
+    ) -> None:
+        """渲染并发送 Feishu Thread 更新通知卡片"""
         try:
             feishu_rendered = self.feishu_renderer.render_update_notification(
                 overview_data
             )
             await self.feishu_client.update_thread_overview("", "", feishu_rendered)
         except Exception as e:  # pylint: disable=broad-except
-            logger.warning("Error sending Feishu thread update notification: %s", e)
-
-        return success
+            logger.warning("Error sending Feishu thread update notification: {}", e)
 
     async def send_thread_update_notification(
         self, channel_id: str, thread_id: str, platform_message_id: Optional[str] = None
@@ -1,9 +1,32 @@
 """消息渲染模块"""
 
-from .base import BaseRenderer, BaseTextRenderer
-from .discord_render import DiscordRenderer
+# pylint: disable=undefined-all-variable
+# 注意：__all__ 中的名称通过 __getattr__ 动态提供，在静态分析时未定义是正常的
 
-__all__ = [
+# 名称 -> 所在子模块（相对本包）
+# 导入 renders.types / renders.patch_card 等子模块时会先执行本包的 __init__，
+# 延迟导入可避免每次都连带加载 Discord 渲染器及其依赖
+_LAZY_IMPORTS = {
+    "BaseRenderer": "base",
+    "BaseTextRenderer": "base",
+    "DiscordRenderer": "discord_render",
+}
+
+
+def __getattr__(name: str):
+    """按需导入渲染器类（PEP 562）"""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = __import__(f"{__name__}.{module_name}", fromlist=[name])
+    value = getattr(module, name)
+    # 缓存到模块命名空间，之后的访问不再经过 __getattr__
+    globals()[name] = value
+    return value
+
+
+__all__ = [  # pylint: disable=undefined-all-variable
     "BaseRenderer",
     "BaseTextRenderer",
     "DiscordRenderer",
@@ -2,7 +2,29 @@
 
 from lkml.service import PatchCard
 
-from ..types import FeishuRenderedPatchCard
+from ..types import FeishuRenderedPatchCard, FeishuRenderedReplyNotification
+from .formatting import format_card_datetime, format_series_markdown
+
+# 各卡片共用的固定片段（模块级共享，避免每次渲染重新分配）
+# 渲染结果只用于序列化发送，调用方不得修改其中内容
+_CARD_CONFIG = {"update_multi": True}
+_EMPTY_SUBTITLE = {"tag": "plain_text", "content": ""}
+_NEW_PATCH_TAG_LIST = [
+    {
+        "tag": "text_tag",
+        "text": {"tag": "plain_text", "content": "新提交"},
+        "color": "blue",
+    }
+]
+_REPLY_TAG_LIST = [
+    {
+        "tag": "text_tag",
+        "text": {"tag": "plain_text", "content": "Reply 通知"},
+        "color": "blue",
+    }
+]
+_PATCH_DETAIL_BUTTON_TEXT = {"tag": "plain_text", "content": "查看补丁详情"}
+_REPLY_BUTTON_TEXT = {"tag": "plain_text", "content": "查看 Reply"}
 
 
 class FeishuPatchCardRenderer:  # pylint: disable=too-few-public-methods
@@ -22,7 +44,7 @@ class FeishuPatchCardRenderer:  # pylint: disable=too-few-public-methods
         """
         header_title = patch_card.subject[:200]
         date_str = (
-            patch_card.expires_at.strftime("%Y-%m-%d %H:%M UTC")
+            f"{format_card_datetime(patch_card.expires_at)[:16]} UTC"
             if patch_card.expires_at
             else ""
         )
@@ -54,137 +76,117 @@ class FeishuPatchCardRenderer:  # pylint: disable=too-few-public-methods
 
         base_content = "\n".join(base_content_lines)
 
+        elements = [self._make_markdown_column("blue-50", base_content)]
+
+        # 只有系列 PATCH 时才添加 Series 模块
+        if is_series and subpatch_md:
+            elements.append(self._make_markdown_column("grey-50", subpatch_md))
+
+        # 查看详情按钮（始终存在）
+        elements.append(
+            self._make_open_url_button(_PATCH_DETAIL_BUTTON_TEXT, patch_card.url or "")
+        )
+
         card = {
             "msg_type": "interactive",
             "card": {
                 "schema": "2.0",
-                "config": {"update_multi": True},
+                "config": _CARD_CONFIG,
                 "header": {
                     "title": {
                         "tag": "plain_text",
-                        "content": f"{header_title}",
+                        "content": header_title,
                     },
-                    "subtitle": {"tag": "plain_text", "content": ""},
-                    "text_tag_list": [
-                        {
-                            "tag": "text_tag",
-                            "text": {"tag": "plain_text", "content": "新提交"},
-                            "color": "blue",
-                        }
-                    ],
+                    "subtitle": _EMPTY_SUBTITLE,
+                    "text_tag_list": _NEW_PATCH_TAG_LIST,
                     "template": "blue",
                     "padding": "12px 8px 12px 8px",
                 },
                 "body": {
                     "direction": "vertical",
-                    "elements": [],
+                    "elements": elements,
                 },
             },
         }
 
-        elements = [
-            {
-                "tag": "column_set",
-                "flex_mode": "stretch",
-                "horizontal_spacing": "8px",
-                "horizontal_align": "left",
-                "columns": [
-                    {
-                        "tag": "column",
-                        "width": "weighted",
-                        "background_style": "blue-50",
-                        "elements": [
-                            {
-                                "tag": "markdown",
-                                "content": base_content,
-                                "text_align": "left",
-                                "text_size": "normal",
-                            }
-                        ],
-                        "padding": "12px 12px 12px 12px",
-                        "vertical_spacing": "8px",
-                        "horizontal_align": "left",
-                        "vertical_align": "top",
-                        "weight": 1,
-                    }
-                ],
-                "margin": "0px 0px 0px 0px",
-            }
-        ]
+        return FeishuRenderedPatchCard(card=card)
 
-        # 只有系列 PATCH 时才添加 Series 模块
-        if is_series and subpatch_md:
-            elements.append(
+    @staticmethod
+    def _make_markdown_column(background_style: str, content: str) -> dict:
+        """构建只包含一段 Markdown 的单列 column_set 元素
+
+        Args:
+            background_style: 列背景样式（如 "blue-50"、"grey-50"）
+            content: Markdown 内容
+
+        Returns:
+            column_set 元素字典
+        """
+        return {
+            "tag": "column_set",
+            "flex_mode": "stretch",
+            "horizontal_spacing": "8px",
+            "horizontal_align": "left",
+            "columns": [
                 {
-                    "tag": "column_set",
-                    "flex_mode": "stretch",
-                    "horizontal_spacing": "8px",
-                    "horizontal_align": "left",
-                    "columns": [
+                    "tag": "column",
+                    "width": "weighted",
+                    "background_style": background_style,
+                    "elements": [
                         {
-                            "tag": "column",
-                            "width": "weighted",
-                            "background_style": "grey-50",
-                            "elements": [
-                                {
-                                    "tag": "markdown",
-                                    "content": ("• **Series** ：\n" + subpatch_md),
-                                    "text_align": "left",
-                                    "text_size": "normal",
-                                }
-                            ],
-                            "padding": "12px 12px 12px 12px",
-                            "vertical_spacing": "8px",
-                            "horizontal_align": "left",
-                            "vertical_align": "top",
-                            "weight": 1,
+                            "tag": "markdown",
+                            "content": content,
+                            "text_align": "left",
+                            "text_size": "normal",
                         }
                     ],
-                    "margin": "0px 0px 0px 0px",
+                    "padding": "12px 12px 12px 12px",
+                    "vertical_spacing": "8px",
+                    "horizontal_align": "left",
+                    "vertical_align": "top",
+                    "weight": 1,
                 }
-            )
+            ],
+            "margin": "0px 0px 0px 0px",
+        }
 
-        # 查看详情按钮（始终存在）
-        elements.append(
-            {
-                "tag": "button",
-                "text": {
-                    "tag": "plain_text",
-                    "content": "查看补丁详情",
-                },
-                "type": "primary_filled",
-                "width": "fill",
-                "behaviors": [
-                    {
-                        "type": "open_url",
-                        "default_url": patch_card.url or "",
-                        "pc_url": "",
-                        "ios_url": "",
-                        "android_url": "",
-                    }
-                ],
-                "margin": "4px 0px 4px 0px",
-            }
-        )
+    @staticmethod
+    def _make_open_url_button(text: dict, url: str) -> dict:
+        """构建点击后打开链接的按钮元素
 
-        card["card"]["body"]["elements"] = elements
+        Args:
+            text: 按钮文字元素（模块级常量）
+            url: 点击后打开的链接
 
-        return FeishuRenderedPatchCard(card=card)
+        Returns:
+            button 元素字典
+        """
+        return {
+            "tag": "button",
+            "text": text,
+            "type": "primary_filled",
+            "width": "fill",
+            "behaviors": [
+                {
+                    "type": "open_url",
+                    "default_url": url,
+                    "pc_url": "",
+                    "ios_url": "",
+                    "android_url": "",
+                }
+            ],
+            "margin": "4px 0px 4px 0px",
+        }
 
     def _build_series_markdown_and_received(
         self, patch_card: PatchCard, is_series: bool
     ) -> tuple[str, int]:
-        """构建系列 PATCH 的 Markdown 列表及计数。"""
+        """构建系列 PATCH 的 Markdown（已包含 Series 标题行）及计数。"""
         if not (is_series and patch_card.series_patches):
             return "", 0
 
-        subpatch_lines = []
-        for series_patch in patch_card.series_patches:
-            subject = series_patch.subject
-            link = series_patch.url or ""
-            subpatch_lines.append(f"  - [{subject}]({link}) ")
-
-        return "\n".join(subpatch_lines), len(patch_card.series_patches)
+        series_patches = patch_card.series_patches
+        return format_series_markdown(series_patches), len(series_patches)
 
     def render_reply_notification(self, payload: dict):
         """渲染 Reply 通知为 Feishu 卡片（不发送）
@@ -200,8 +202,6 @@ class FeishuPatchCardRenderer:  # pylint: disable=too-few-public-methods
         Returns:
             FeishuRenderedReplyNotification 渲染结果
         """
-        from ..types import FeishuRenderedReplyNotification
-
         reply_author = payload.get("reply_author") or "unknown"
         reply_subject = payload.get("reply_subject") or ""
         reply_url = payload.get("reply_url")
@@ -225,14 +225,12 @@ class FeishuPatchCardRenderer:  # pylint: disable=too-few-public-methods
         reply_subsystem = payload.get("reply_subsystem") or ""
         reply_date = payload.get("reply_date") or ""
 
-        base_content_lines = []
-        if reply_subsystem:
-            base_content_lines.append(f"• **Subsystem** ：{reply_subsystem}")
-        if reply_date:
-            base_content_lines.append(f"• **Date** ：{reply_date}")
-        base_content_lines.append(f"• **Author** ：{reply_author}")
-
-        return "\n".join(base_content_lines)
+        # 行数固定（可选行为空串），直接用一个 f-string 拼接
+        subsystem_line = (
+            f"• **Subsystem** ：{reply_subsystem}\n" if reply_subsystem else ""
+        )
+        date_line = f"• **Date** ：{reply_date}\n" if reply_date else ""
+        return f"{subsystem_line}{date_line}• **Author** ：{reply_author}"
 
     def _build_reply_elements(self, payload: dict, base_content: str) -> list:
         """构建 Reply 通知的卡片元素列表"""
@@ -241,35 +239,7 @@ class FeishuPatchCardRenderer:  # pylint: disable=too-few-public-methods
         root_subject = payload.get("root_subject") or ""
         root_url = payload.get("root_url")
 
-        elements = [
-            {
-                "tag": "column_set",
-                "flex_mode": "stretch",
-                "horizontal_spacing": "8px",
-                "horizontal_align": "left",
-                "columns": [
-                    {
-                        "tag": "column",
-                        "width": "weighted",
-                        "background_style": "grey-50",
-                        "elements": [
-                            {
-                                "tag": "markdown",
-                                "content": base_content,
-                                "text_align": "left",
-                                "text_size": "normal",
-                            }
-                        ],
-                        "padding": "12px 12px 12px 12px",
-                        "vertical_spacing": "8px",
-                        "horizontal_align": "left",
-                        "vertical_align": "top",
-                        "weight": 1,
-                    }
-                ],
-                "margin": "0px 0px 0px 0px",
-            }
-        ]
+        elements = [self._make_markdown_column("grey-50", base_content)]
 
         # Reply Subject 和 Root Patch 显示在单独的区域
         if reply_subject:
@@ -302,27 +272,7 @@ class FeishuPatchCardRenderer:  # pylint: disable=too-few-public-methods
 
         # 查看 Reply 按钮
         if reply_url:
-            elements.append(
-                {
-                    "tag": "button",
-                    "text": {
-                        "tag": "plain_text",
-                        "content": "查看 Reply",
-                    },
-                    "type": "primary_filled",
-                    "width": "fill",
-                    "behaviors": [
-                        {
-                            "type": "open_url",
-                            "default_url": reply_url,
-                            "pc_url": "",
-                            "ios_url": "",
-                            "android_url": "",
-                        }
-                    ],
-                    "margin": "4px 0px 4px 0px",
-                }
-            )
+            elements.append(self._make_open_url_button(_REPLY_BUTTON_TEXT, reply_url))
 
         return elements
 
@@ -332,20 +282,14 @@ class FeishuPatchCardRenderer:  # pylint: disable=too-few-public-methods
             "msg_type": "interactive",
             "card": {
                 "schema": "2.0",
-                "config": {"update_multi": True},
+                "config": _CARD_CONFIG,
                 "header": {
                     "title": {
                         "tag": "lark_md",
                         "content": header_title,
                     },
-                    "subtitle": {"tag": "plain_text", "content": ""},
-                    "text_tag_list": [
-                        {
-                            "tag": "text_tag",
-                            "text": {"tag": "plain_text", "content": "Reply 通知"},
-                            "color": "blue",
-                        }
-                    ],
+                    "subtitle": _EMPTY_SUBTITLE,
+                    "text_tag_list": _REPLY_TAG_LIST,
                     "template": "blue",
                     "padding": "12px 8px 12px 8px",
                 },
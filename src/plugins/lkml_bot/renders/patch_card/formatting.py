@@ -0,0 +1,61 @@
+"""卡片渲染共用的格式化工具"""
+
+from datetime import datetime
+from typing import Iterable
+
+from lkml.service.types import SeriesPatchInfo
+
+# Markdown 链接文字转义表（str.translate 一次遍历完成替换）
+# 主题中的方括号（如 "[PATCH v2 1/3]"）会提前结束链接文字，导致链接显示错乱
+# Discord 支持反斜杠转义；Feishu 卡片 Markdown 使用 HTML 字符实体转义
+_DISCORD_LINK_TEXT_ESCAPE = str.maketrans({"\\": "\\\\", "[": "\\[", "]": "\\]"})
+_FEISHU_LINK_TEXT_ESCAPE = str.maketrans({"[": "&#91;", "]": "&#93;"})
+
+
+def escape_discord_link_text(text: str) -> str:
+    """转义 Discord Markdown 链接文字中的特殊字符"""
+    return text.translate(_DISCORD_LINK_TEXT_ESCAPE)
+
+
+def escape_feishu_link_text(text: str) -> str:
+    """转义 Feishu 卡片 Markdown 链接文字中的特殊字符"""
+    return text.translate(_FEISHU_LINK_TEXT_ESCAPE)
+
+
+def format_card_datetime(dt: datetime) -> str:
+    """将卡片时间格式化为 "YYYY-MM-DD HH:MM:SS"
+
+    Discord 和 Feishu 渲染器共用，Feishu 取前 16 个字符（精确到分钟）使用。
+
+    Args:
+        dt: 卡片时间
+
+    Returns:
+        格式化后的时间字符串
+    """
+    # 固定宽度的 ASCII 格式，用 isoformat 代替 strftime（不解析格式串、不涉及 locale）；
+    # 带时区的时间 isoformat 会追加 "+00:00" 之类的偏移，截取前 19 个字符去掉
+    return dt.isoformat(sep=" ", timespec="seconds")[:19]
+
+
+def format_series_markdown(patches: Iterable[SeriesPatchInfo]) -> str:
+    """构建 Feishu 卡片的系列 PATCH 列表 Markdown（包含 Series 标题行）
+
+    PatchCard 卡片和 Thread 创建通知卡片共用，保证两处的列表格式一致。
+
+    Args:
+        patches: 子 PATCH 列表
+
+    Returns:
+        Markdown 文本
+    """
+    # 标题行作为第一个元素参与 join，一次拼接生成完整内容
+    return "\n".join(
+        [
+            "• **Series** ：",
+            *(
+                f"  - [{escape_feishu_link_text(p.subject)}]({p.url or ''}) "
+                for p in patches
+            ),
+        ]
+    )
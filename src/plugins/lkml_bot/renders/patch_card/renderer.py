@@ -7,7 +7,14 @@ Plugins 层渲染器：只负责将 PatchCard 渲染成 Discord 格式。
 from lkml.service import PatchCard
 
 from ...client.discord_params import PatchCardParams
-from ..types import DiscordRenderedPatchCard
+from ..types import DiscordRenderedPatchCard, DiscordRenderedReplyNotification
+from .formatting import escape_discord_link_text, format_card_datetime
+
+# 卡片末尾的 watch 命令提示（后接 "/watch <message_id>" 和代码块结束标记）
+_WATCH_HINT = (
+    "\nCreate a dedicated Thread to receive follow-up replies using the command:\n"
+    "```bash\n"
+)
 
 
 class PatchCardRenderer:
@@ -44,9 +51,13 @@ class PatchCardRenderer:
         # 构建描述
         description = self._build_description(patch_card)
 
-        # 构建标题（如果匹配了 filter，添加高亮标记）
-        title_prefix = "⭐ " if patch_card.matched_filters else "📨 "
-        title = f"{title_prefix}{patch_card.subject[:200]}"
+        # 如果匹配了 filter，标题添加高亮标记并使用高亮颜色（金色）
+        if patch_card.matched_filters:
+            title_prefix, embed_color = "⭐ ", 0xFFD700
+        else:
+            title_prefix, embed_color = "📨 ", 0x5865F2
+        # 切片覆盖整个字符串时 CPython 直接返回原对象，短标题不会产生拷贝
+        title = title_prefix + patch_card.subject[:200]
 
         # 构建 Embed 参数
         params = PatchCardParams(
@@ -62,9 +73,6 @@ class PatchCardRenderer:
             patch_total=patch_card.patch_total,
         )
 
-        # 如果匹配了 filter，使用高亮颜色（金色）
-        embed_color = 0xFFD700 if patch_card.matched_filters else 0x5865F2
-
         return DiscordRenderedPatchCard(
             params=params,
             description=description,
@@ -81,17 +89,30 @@ class PatchCardRenderer:
         Returns:
             描述字符串
         """
-        lines = []
+        date_line = (
+            f"Date: {format_card_datetime(patch_card.expires_at)}\n"
+            if patch_card.expires_at
+            else ""
+        )
+        show_series_stats = bool(patch_card.is_series_patch and patch_card.patch_total)
+
+        # 单个 PATCH（最常见）：结构固定，直接用一个 f-string 生成，不走列表拼接
+        if not show_series_stats and not patch_card.series_patches:
+            return (
+                f"```yaml\nSubsystem: {patch_card.subsystem_name}\n{date_line}"
+                f"Author: {patch_card.author}\n```\n"
+                f"{_WATCH_HINT}"
+                f"/watch {patch_card.message_id_header}\n```"
+            )
 
         # 基本信息（YAML 格式）
-        lines.append("```yaml")
-        lines.append(f"Subsystem: {patch_card.subsystem_name}")
-        if patch_card.expires_at:
-            lines.append(f"Date: {patch_card.expires_at.strftime('%Y-%m-%d %H:%M:%S')}")
-        lines.append(f"Author: {patch_card.author}")
+        lines = [
+            f"```yaml\nSubsystem: {patch_card.subsystem_name}\n{date_line}"
+            f"Author: {patch_card.author}"
+        ]
 
         # 如果是系列，显示总数和已接收数
-        if patch_card.is_series_patch and patch_card.patch_total:
+        if show_series_stats:
             received = (
                 len(patch_card.series_patches) if patch_card.series_patches else 0
             )
@@ -111,17 +132,14 @@ class PatchCardRenderer:
                     subject[:80] + "..." if len(subject) > 80 else subject
                 )
                 if url:
-                    lines.append(f"[{subject_truncated}]({url})")
+                    lines.append(
+                        f"[{escape_discord_link_text(subject_truncated)}]({url})"
+                    )
                 else:
                     lines.append(subject_truncated)
 
         # 添加 watch 命令提示
-        lines.append(
-            "\nCreate a dedicated Thread to receive follow-up replies using the command:"
-        )
-        lines.append("```bash")
-        lines.append(f"/watch {patch_card.message_id_header}")
-        lines.append("```")
+        lines.append(f"{_WATCH_HINT}/watch {patch_card.message_id_header}\n```")
 
         return "\n".join(lines)
 
@@ -139,8 +157,6 @@ class PatchCardRenderer:
         Returns:
             DiscordRenderedReplyNotification 渲染结果
         """
-        from ..types import DiscordRenderedReplyNotification
-
         reply_author = payload.get("reply_author") or "unknown"
         reply_subject = payload.get("reply_subject") or ""
         reply_url = payload.get("reply_url")
@@ -4,16 +4,52 @@
 发送由客户端负责。
 """
 
+from collections import OrderedDict
+from typing import Tuple
+
 from lkml.service.types import ThreadOverviewData
 
+from ...client.json_codec import dumps_json
+from ..patch_card.formatting import format_series_markdown
 from ..types import FeishuRenderedThreadNotification
 
+# 各卡片共用的固定片段（模块级共享，避免每次渲染重新分配）
+# 渲染结果只用于序列化发送，调用方不得修改其中内容
+_CARD_CONFIG = {"update_multi": True}
+_EMPTY_SUBTITLE = {"tag": "plain_text", "content": ""}
+_CREATE_TAG_LIST = [
+    {
+        "tag": "text_tag",
+        "text": {
+            "tag": "plain_text",
+            "content": "Thread 已创建，有新回复时将自动推送",
+        },
+        "color": "green",
+    }
+]
+_REPLY_TAG_LIST = [
+    {
+        "tag": "text_tag",
+        "text": {"tag": "plain_text", "content": "有回复"},
+        "color": "green",
+    }
+]
+_PATCH_DETAIL_BUTTON_TEXT = {"tag": "plain_text", "content": "查看补丁详情"}
+# 更新通知卡片缓存的最大条目数
+_UPDATE_CACHE_SIZE = 256
+
 
 class FeishuThreadOverviewRenderer:  # pylint: disable=too-few-public-methods
     """Feishu 平台 ThreadOverview 渲染器（只负责渲染，不负责发送）"""
 
     def __init__(self, config):
         self.config = config  # 目前未使用，保留以便未来扩展
+        # 更新通知卡片缓存：{(主题, 链接): 渲染结果}
+        # 同一 Thread 每次有新回复发送的更新卡片内容相同，复用同一个渲染结果，
+        # 渲染结果中带有编码好的请求体，客户端发送时不再重复编码
+        self._update_cache: (
+            "OrderedDict[Tuple[str, str], FeishuRenderedThreadNotification]"
+        ) = OrderedDict()
 
     def render_create_notification(
         self, overview_data: ThreadOverviewData
@@ -29,35 +65,22 @@ class FeishuThreadOverviewRenderer:  # pylint: disable=too-few-public-methods
         subject = overview_data.patch_card.subject[:200]
         patch_card_link = overview_data.patch_card.url or ""
 
-        lines = []
-        if overview_data.sub_patch_overviews:
-            for sp in overview_data.sub_patch_overviews:
-                subj = sp.patch.subject
-                link = sp.patch.url or ""
-                lines.append(f"  - [{subj}]({link}) ")
-        sub_md = "\n".join(lines) if lines else ""
+        series_md = format_series_markdown(
+            sp.patch for sp in overview_data.sub_patch_overviews or ()
+        )
 
         card = {
             "msg_type": "interactive",
             "card": {
                 "schema": "2.0",
-                "config": {"update_multi": True},
+                "config": _CARD_CONFIG,
                 "header": {
                     "title": {
                         "tag": "plain_text",
                         "content": f"Thread Create: {subject}",
                     },
-                    "subtitle": {"tag": "plain_text", "content": ""},
-                    "text_tag_list": [
-                        {
-                            "tag": "text_tag",
-                            "text": {
-                                "tag": "plain_text",
-                                "content": "Thread 已创建，有新回复时将自动推送",
-                            },
-                            "color": "green",
-                        }
-                    ],
+                    "subtitle": _EMPTY_SUBTITLE,
+                    "text_tag_list": _CREATE_TAG_LIST,
                     "template": "green",
                     "padding": "12px 8px 12px 8px",
                 },
@@ -77,7 +100,7 @@ class FeishuThreadOverviewRenderer:  # pylint: disable=too-few-public-methods
                                     "elements": [
                                         {
                                             "tag": "markdown",
-                                            "content": ("• **Series** ：\n" + sub_md),
+                                            "content": series_md,
                                             "text_align": "left",
                                             "text_size": "normal",
                                         }
@@ -93,16 +116,13 @@ class FeishuThreadOverviewRenderer:  # pylint: disable=too-few-public-methods
                         },
                         {
                             "tag": "button",
-                            "text": {
-                                "tag": "plain_text",
-                                "content": "查看补丁详情",
-                            },
+                            "text": _PATCH_DETAIL_BUTTON_TEXT,
                             "type": "primary_filled",
                             "width": "fill",
                             "behaviors": [
                                 {
                                     "type": "open_url",
-                                    "default_url": patch_card_link or "",
+                                    "default_url": patch_card_link,
                                     "pc_url": "",
                                     "ios_url": "",
                                     "android_url": "",
@@ -131,47 +151,35 @@ class FeishuThreadOverviewRenderer:  # pylint: disable=too-few-public-methods
         subj = overview_data.patch_card.subject[:200]
         link = overview_data.patch_card.url or ""
 
+        key = (subj, link)
+        rendered = self._update_cache.get(key)
+        if rendered is not None:
+            self._update_cache.move_to_end(key)
+            return rendered
+
         card = {
             "msg_type": "interactive",
             "card": {
                 "schema": "2.0",
-                "config": {"update_multi": True},
+                "config": _CARD_CONFIG,
                 "header": {
                     "title": {
                         "tag": "plain_text",
                         "content": f"Thread Reply: {subj}",
                     },
-                    "subtitle": {"tag": "plain_text", "content": ""},
-                    "text_tag_list": [
-                        {
-                            "tag": "text_tag",
-                            "text": {"tag": "plain_text", "content": "有回复"},
-                            "color": "green",
-                        }
-                    ],
+                    "text_tag_list": _REPLY_TAG_LIST,
                     "template": "green",
                     "padding": "12px 8px 12px 8px",
                 },
+                # 只保留影响显示的字段：空副标题、各端为空的链接、默认的纵向排列都省略
                 "body": {
-                    "direction": "vertical",
                     "elements": [
                         {
                             "tag": "button",
-                            "text": {
-                                "tag": "plain_text",
-                                "content": "查看补丁详情",
-                            },
+                            "text": _PATCH_DETAIL_BUTTON_TEXT,
                             "type": "primary_filled",
                             "width": "fill",
-                            "behaviors": [
-                                {
-                                    "type": "open_url",
-                                    "default_url": link or "",
-                                    "pc_url": "",
-                                    "ios_url": "",
-                                    "android_url": "",
-                                }
-                            ],
+                            "behaviors": [{"type": "open_url", "default_url": link}],
                             "margin": "4px 0px 4px 0px",
                         },
                     ],
@@ -179,4 +187,8 @@ class FeishuThreadOverviewRenderer:  # pylint: disable=too-few-public-methods
             },
         }
 
-        return FeishuRenderedThreadNotification(card=card)
+        rendered = FeishuRenderedThreadNotification(card=card, body=dumps_json(card))
+        self._update_cache[key] = rendered
+        if len(self._update_cache) > _UPDATE_CACHE_SIZE:
+            self._update_cache.popitem(last=False)
+        return rendered
@@ -4,7 +4,11 @@ Plugins 层渲染器：只负责渲染 Thread Overview。
 所有业务逻辑由 Service 层处理，发送由客户端处理。
 """
 
-from typing import Dict
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, List, Tuple
 
 from lkml.service import FeedMessage
 from lkml.service.types import (
@@ -13,8 +17,104 @@ from lkml.service.types import (
     ThreadOverviewData,
 )
 
+from ...client.discord_thread import DISCORD_CONTENT_MAX_LENGTH
+from ..patch_card.formatting import escape_discord_link_text
 from ..types import DiscordRenderedThreadMessage, DiscordRenderedThreadOverview
 
+# 回复行前缀（tab 缩进 + "\` "），按层级预先生成，超出范围时再临时拼接
+_MAX_CACHED_LEVEL = 64
+# 子 PATCH 渲染结果缓存的最大条目数
+_SUB_PATCH_CACHE_SIZE = 128
+_LINE_PREFIXES = tuple("\t" * level + "\\` " for level in range(_MAX_CACHED_LEVEL))
+
+
+@lru_cache(maxsize=1024)
+def _reply_display_parts(subject: str, author: str) -> Tuple[str, str]:
+    """提取回复行显示用的主题标签和作者名
+
+    每条新回复到达时都会重新渲染整个 Thread，按原始字符串缓存后
+    已渲染过的回复不再重复切分字符串。
+
+    Args:
+        subject: 回复主题（如 "[PATCH v2 1/3] foo: bar"）
+        author: 回复作者（如 "Name (email)"）
+
+    Returns:
+        (主题标签（如 "[PATCH v2 1/3]"，已转义为 Markdown 链接文字）, 作者名)
+    """
+    subject_label = escape_discord_link_text(subject.split("] ", 1)[0] + "]")
+    author_name = author.split(" (", 1)[0] if author else "Unknown"
+    return subject_label, author_name
+
+
+def _format_reply_time(received_at: datetime) -> str:
+    """将回复时间格式化为 "YYYY-MM-DD HH:MM"
+
+    用 isoformat 代替 strftime（不解析格式串）；带时区时截掉末尾的偏移。
+    """
+    return received_at.isoformat(sep=" ", timespec="minutes")[:16]
+
+
+def _fit_discord_content(content: str) -> str:
+    """将消息内容截断到 Discord content 长度限制内
+
+    链接文字转义会增加字符数，因此在转义之后按行截断：
+    保证不会把转义序列或 Markdown 链接截成两半，发送端也不再需要逐字符截断。
+    """
+    if len(content) <= DISCORD_CONTENT_MAX_LENGTH:
+        return content
+    # 预留 "\n..." 的 4 个字符
+    cut = content.rfind("\n", 0, DISCORD_CONTENT_MAX_LENGTH - 3)
+    if cut <= 0:
+        cut = DISCORD_CONTENT_MAX_LENGTH - 4
+    return content[:cut] + "\n..."
+
+
+def _format_reply_line(reply: FeedMessage, level: int) -> str:
+    """格式化单条回复行：tab 缩进 + "\\` 时间 [主题标签](链接) 作者"
+
+    Args:
+        reply: 回复对象
+        level: 层级深度（0 = 顶层）
+
+    Returns:
+        回复行文本
+    """
+    if level < _MAX_CACHED_LEVEL:
+        prefix = _LINE_PREFIXES[level]
+    else:
+        prefix = "\t" * level + "\\` "
+    subject, author = _reply_display_parts(reply.subject, reply.author)
+    reply_time = _format_reply_time(reply.received_at)
+    return f"{prefix}{reply_time} [{subject}]({reply.url}) {author}"
+
+
+def _sub_patch_signature(sub_overview: SubPatchOverviewData) -> tuple:
+    """计算子 PATCH 渲染内容的结构签名
+
+    包含渲染用到的所有字段（PATCH 信息、顶层回复顺序、每条回复的显示字段和子回复），
+    签名相同时渲染结果必然相同。
+    """
+    patch = sub_overview.patch
+    reply_hierarchy = sub_overview.reply_hierarchy
+    return (
+        patch.subject,
+        patch.url,
+        tuple(reply_hierarchy.root_replies),
+        tuple(
+            (
+                message_id,
+                entry.reply.message_id_header,
+                entry.reply.subject,
+                entry.reply.author,
+                entry.reply.url,
+                entry.reply.received_at,
+                tuple(entry.children),
+            )
+            for message_id, entry in reply_hierarchy.reply_map.items()
+        ),
+    )
+
 
 class ThreadOverviewRenderer:
     """Thread Overview 渲染器
@@ -37,6 +137,11 @@ class ThreadOverviewRenderer:
             config: 配置对象（保留以便未来扩展）
         """
         self.config = config
+        # 子 PATCH 渲染结果缓存：{结构签名: 渲染文本}
+        # 每条新回复到达都会重新渲染整个 Thread，未变化的子 PATCH 直接复用上次的结果
+        self._sub_patch_cache: "OrderedDict[tuple, str]" = OrderedDict()
+        # 发送服务通过 asyncio.to_thread 调用渲染，缓存可能被多个线程同时访问
+        self._sub_patch_cache_lock = threading.Lock()
 
     def render(
         self, overview_data: ThreadOverviewData
@@ -74,14 +179,14 @@ class ThreadOverviewRenderer:
         Returns:
             DiscordRenderedThreadMessage 渲染结果
         """
-        content = self._render_sub_patch(sub_overview)
+        content = _fit_discord_content(self._render_sub_patch(sub_overview))
         return DiscordRenderedThreadMessage(content=content, embed=None)
 
     def render_overview_message(
         self, overview_data: ThreadOverviewData
     ) -> DiscordRenderedThreadMessage:
         """渲染 Thread Overview 为单条消息（用于更新）"""
-        content = self._render_overview_content(overview_data)
+        content = _fit_discord_content(self._render_overview_content(overview_data))
         return DiscordRenderedThreadMessage(content=content, embed=None)
 
     def _render_sub_patch(self, sub_overview: SubPatchOverviewData) -> str:
@@ -100,10 +205,31 @@ class ThreadOverviewRenderer:
         Returns:
             渲染后的子 PATCH 文本
         """
-        lines = []
+        key = _sub_patch_signature(sub_overview)
+        with self._sub_patch_cache_lock:
+            content = self._sub_patch_cache.get(key)
+            if content is not None:
+                self._sub_patch_cache.move_to_end(key)
+                return content
+
+        # 渲染在锁外进行，不阻塞其他线程的缓存查询
+        lines: List[str] = []
+        self._append_sub_patch_lines(sub_overview, lines)
+        content = "\n".join(lines)
+        with self._sub_patch_cache_lock:
+            self._sub_patch_cache[key] = content
+            self._sub_patch_cache.move_to_end(key)
+            if len(self._sub_patch_cache) > _SUB_PATCH_CACHE_SIZE:
+                self._sub_patch_cache.popitem(last=False)
+        return content
+
+    def _append_sub_patch_lines(
+        self, sub_overview: SubPatchOverviewData, lines: List[str]
+    ) -> None:
+        """将单个子 PATCH 的各行追加到 lines（格式见 _render_sub_patch）"""
         patch = sub_overview.patch
 
-        lines.append(f"[{patch.subject}]({patch.url})")
+        lines.append(f"[{escape_discord_link_text(patch.subject)}]({patch.url})")
         lines.append("")  # 空行
 
         # 使用 service 层准备好的回复层级结构
@@ -114,32 +240,35 @@ class ThreadOverviewRenderer:
         if root_replies:
             # 为该 PATCH 的每个顶层回复构建层级树
             for root_reply_id in root_replies:
-                if root_reply_id in reply_map:
-                    root_reply = reply_map[root_reply_id].reply
-                    reply_lines = self._format_reply_tree(
-                        root_reply, reply_map, level=0
-                    )
-                    lines.extend(reply_lines)
+                root_entry = reply_map.get(root_reply_id)
+                if root_entry is not None:
+                    self._format_reply_tree(root_entry.reply, reply_map, lines)
         else:
             lines.append("_(No replies)_")
 
-        return "\n".join(lines)
-
     def _render_overview_content(self, overview_data: ThreadOverviewData) -> str:
         """渲染所有子 PATCH 概览为单条消息内容"""
-        if not overview_data.sub_patch_overviews:
+        sub_patch_overviews = overview_data.sub_patch_overviews
+        if not sub_patch_overviews:
             return ""
+        # 单 PATCH 只有一个块，直接返回，不构建列表再 join
+        if len(sub_patch_overviews) == 1:
+            return self._render_sub_patch(sub_patch_overviews[0])
 
+        # 未变化的子 PATCH 直接取自缓存，只有新回复所在的子 PATCH 需要重新渲染
         blocks = [
-            self._render_sub_patch(sub_overview)
-            for sub_overview in overview_data.sub_patch_overviews
+            self._render_sub_patch(sub_overview) for sub_overview in sub_patch_overviews
         ]
         return "\n".join(blocks)
 
     def _format_reply_tree(
-        self, reply: FeedMessage, reply_map: Dict[str, ReplyMapEntry], level: int
-    ) -> list:
-        """递归格式化回复树
+        self,
+        reply: FeedMessage,
+        reply_map: Dict[str, ReplyMapEntry],
+        lines: List[str],
+        level: int = 0,
+    ) -> None:
+        """格式化回复树并追加到 lines（显式栈先序遍历，避免长线程递归过深）
 
         格式：
         ` 时间 作者 (邮箱)
@@ -149,34 +278,25 @@ class ThreadOverviewRenderer:
         Args:
             reply: 回复对象
             reply_map: 回复映射 {message_id: ReplyMapEntry}
+            lines: 输出行列表（直接追加，不再为每棵树创建中间列表）
             level: 层级深度（0 = 顶层）
-
-        Returns:
-            格式化后的行列表
         """
-        lines = []
-
-        # 缩进：使用 tab 字符
-        indent = "\t" * level
-
-        # 格式化当前回复：` 时间 作者 (邮箱)
-        subject = reply.subject.split("] ", 1)[0] + "]"
-        reply_time = reply.received_at.strftime("%Y-%m-%d %H:%M")
-        author = reply.author.split(" (", 1)[0] if reply.author else "Unknown"
-
-        lines.append(f"{indent}\\` {reply_time} [{subject}]({reply.url}) {author}")
-
-        # 递归处理子回复
-        message_id = reply.message_id_header
-        if message_id in reply_map:
-            reply_entry = reply_map[message_id]
-            children_ids = reply_entry.children
-            for child_id in children_ids:
-                if child_id in reply_map:
-                    child_reply = reply_map[child_id].reply
-                    child_lines = self._format_reply_tree(
-                        child_reply, reply_map, level + 1
-                    )
-                    lines.extend(child_lines)
-
-        return lines
+        visited = set()  # 防止异常的 in_reply_to 链形成环
+        stack = [(reply, level)]
+
+        while stack:
+            current, current_level = stack.pop()
+            message_id = current.message_id_header
+            if message_id in visited:
+                continue
+            visited.add(message_id)
+
+            lines.append(_format_reply_line(current, current_level))
+
+            # 子回复逆序入栈，出栈时保持原有顺序
+            reply_entry = reply_map.get(message_id)
+            if reply_entry is not None:
+                for child_id in reversed(reply_entry.children):
+                    child_entry = reply_map.get(child_id)
+                    if child_entry is not None:
+                        stack.append((child_entry.reply, current_level + 1))
@@ -46,6 +46,8 @@ class FeishuRenderedThreadNotification:
     """Feishu Thread 通知卡片渲染结果"""
 
     card: Dict  # Feishu 卡片 JSON
+    # 预先编码的请求体（渲染器缓存的卡片会填充，发送时直接复用）
+    body: Optional[bytes] = None
 
 
 @dataclass
@@ -6,8 +6,8 @@
 - 插件元数据
 """
 
-from functools import wraps
-from typing import Any, Awaitable, Callable, Optional, Tuple
+from dataclasses import dataclass
+from typing import FrozenSet, List, Optional, Tuple
 
 from nonebot.adapters import Event
 from nonebot.exception import FinishedException
@@ -16,6 +16,14 @@ from nonebot.plugin import PluginMetadata
 
 from .config import get_config
 
+# getattr 默认值哨兵（区分"属性不存在"和"属性值为 None"）
+_MISSING = object()
+
+# 命令通用的错误回复文案（各命令共用，统一措辞）
+ERR_NO_PERMISSION = "❌ 权限不足：此命令仅限管理员使用"
+ERR_NO_USER_INFO = "❌ 无法获取用户信息"
+ERR_COMMAND_FAILED = "❌ 处理命令时发生错误"
+
 
 __plugin_meta__ = PluginMetadata(
     name="LKML Bot",
@@ -24,8 +32,18 @@ __plugin_meta__ = PluginMetadata(
 )
 
 
+@dataclass(frozen=True, slots=True)
+class CommandSpec:
+    """命令元信息（供 help 命令显示）"""
+
+    name: str
+    usage: str
+    description: str
+    admin_only: bool = False
+
+
 # 命令注册表：各命令模块在导入时将自身的元信息注册到这里
-COMMAND_REGISTRY = []  # list of dict: {name, usage, description, admin_only}
+COMMAND_REGISTRY: List[CommandSpec] = []
 
 
 def register_command(name: str, usage: str, description: str, admin_only: bool = False):
@@ -38,79 +56,39 @@ def register_command(name: str, usage: str, description: str, admin_only: bool =
     - admin_only: 是否仅管理员可用
     """
 
-    COMMAND_REGISTRY.append(
-        {
-            "name": name,
-            "usage": usage,
-            "description": description,
-            "admin_only": admin_only,
-        }
-    )
-
-
-def check_admin(event: Event) -> bool:
-    """检查事件发起者是否为管理员（Discord 角色/用户ID 或 SUPERUSERS）。
-
-    返回值: True 表示是管理员，False 表示不是。
-    """
-
-    return _is_admin(event)
-
-
-def require_admin(func: Callable[..., Awaitable[Any]]):
-    """装饰器：要求调用者为管理员。
-
-    用法示例：
-    @require_admin
-    async def handle_cmd(event: Event, matcher: Matcher):
-        # 只有管理员才能执行到这里
-        await matcher.finish("管理员专用命令")
-
-    注意：被装饰的函数需要接收 event 和 matcher 参数。
-    """
-
-    @wraps(func)
-    async def wrapper(*args, **kwargs):
-        # 尝试找到 Event 和 Matcher
-        event = None
-        matcher = None
-
-        for arg in args:
-            if isinstance(arg, Event):
-                event = arg
-            elif hasattr(arg, "finish"):  # 通常是 Matcher
-                matcher = arg
-
-        if not event:
-            event = kwargs.get("event")
-        if not matcher:
-            matcher = kwargs.get("matcher")
+    COMMAND_REGISTRY.append(CommandSpec(name, usage, description, admin_only))
 
-        if not event or not _is_admin(event):
-            if matcher and hasattr(matcher, "finish"):
-                await matcher.finish("没有权限")
-            return
 
-        return await func(*args, **kwargs)
+# 管理员 Discord 用户 ID 集合（首次检查时从配置取一次，之后直接使用模块级引用）
+_admin_user_ids: Optional[FrozenSet[str]] = None
 
-    return wrapper
 
+def check_admin(event: Event) -> bool:
+    """检查事件发起者是否为管理员（Discord 用户 ID 在管理员集合中）。
 
-def _is_admin(_event: Event) -> bool:
-    """判断事件发起者是否为管理员。
+    规则：用户 ID 在 `discord_admin_user_ids` 中（配置加载时已解析为 frozenset）。
+    未配置管理员时不做限制，所有用户均视为管理员。
 
-    规则（任一满足）：
-    1) Discord: 用户 ID 在 `discord_admin_user_ids` 或拥有 `discord_admin_role_ids` 中的角色
-    2) 回退: 用户 ID 在 `superusers` 配置中
+    返回值: True 表示是管理员，False 表示不是。
     """
-    return True
+    global _admin_user_ids  # pylint: disable=global-statement
+    admin_ids = _admin_user_ids
+    if admin_ids is None:
+        admin_ids = _admin_user_ids = get_config().discord_admin_user_ids
+    if not admin_ids:
+        return True
+    try:
+        return str(event.get_user_id()) in admin_ids
+    except ValueError:
+        # 事件不包含用户信息
+        return False
 
 
 def extract_command(text: str, command: str) -> Optional[str]:
     """从文本中提取命令。
 
     参数:
-        text: 原始文本
+        text: 已去除首尾空白的消息文本（调用方通常已执行 extract_plain_text().strip()）
         command: 命令名称（如 "/start-monitor"）
 
     返回:
@@ -120,8 +98,6 @@ def extract_command(text: str, command: str) -> Optional[str]:
         命令必须是完整的词，即命令后面必须是空格、字符串结尾或标点符号，
         而不能是其他字符（避免 /subscribe 误匹配 /watch）
     """
-    text = text.strip()
-
     # 检查是否以命令开头
     if text.startswith(command):
         # 确保命令后面是空格或字符串结尾（完整匹配）
@@ -134,11 +110,48 @@ def extract_command(text: str, command: str) -> Optional[str]:
         # 确保命令后面是空格或字符串结尾
         end_idx = idx + len(command)
         if end_idx == len(text) or text[end_idx] in (" ", "\n", "\t"):
-            return text[idx:].strip()
+            return text[idx:]
 
     return None
 
 
+def _extract_author_username(event: Event, default: str) -> str:
+    """从事件的 author 字段提取用户名（单次 getattr 探测，不使用 hasattr 链）
+
+    参数:
+        event: 事件对象
+        default: 无法提取时返回的默认值（通常为 user_id）
+
+    返回:
+        用户名
+    """
+    author = getattr(event, "author", None)
+    if author is None:
+        return default
+    if isinstance(author, dict):
+        return author.get("username", default)
+    username = getattr(author, "username", _MISSING)
+    if username is not _MISSING:
+        return username
+    return getattr(author, "global_name", None) or default
+
+
+def get_event_channel_id(event: Optional[Event], default: str) -> str:
+    """获取事件所在的频道 ID（事件没有 channel_id 时返回默认频道）
+
+    参数:
+        event: 事件对象（可为 None）
+        default: 默认频道 ID（通常为配置中的 platform_channel_id）
+
+    返回:
+        频道 ID 字符串
+    """
+    channel_id = getattr(event, "channel_id", _MISSING)
+    if channel_id is _MISSING:
+        return default
+    return str(channel_id)
+
+
 def get_user_info(event: Event) -> Tuple[str, str]:
     """从事件中提取用户ID和用户名。
 
@@ -154,25 +167,15 @@ def get_user_info(event: Event) -> Tuple[str, str]:
     """
     try:
         user_id = event.get_user_id()
-        user_name = user_id
-        if hasattr(event, "author"):
-            author = getattr(event, "author", {})
-            if isinstance(author, dict):
-                user_name = author.get("username", user_id)
-            elif hasattr(author, "username"):
-                user_name = author.username
-            elif hasattr(author, "global_name"):
-                user_name = author.global_name or user_id
-        logger.debug(f"Operator: {user_id} ({user_name})")
+        user_name = _extract_author_username(event, user_id)
+        logger.debug("Operator: {} ({})", user_id, user_name)
         return (user_id, user_name)
-    except FinishedException:
-        raise  # 重新抛出 FinishedException，这是正常流程
     except (
         ValueError,
         AttributeError,
         KeyError,
-    ) as e:  # pylint: disable=try-except-raise
-        logger.error(f"Failed to get user info: {e}")
+    ) as e:
+        logger.error("Failed to get user info: {}", e)
         raise
 
 
@@ -194,7 +197,7 @@ async def get_user_info_or_finish(event: Event, matcher) -> Tuple[str, str]:
     try:
         return get_user_info(event)
     except (AttributeError, ValueError, TypeError) as exc:
-        await matcher.finish("❌ 无法获取用户信息")
+        await matcher.finish(ERR_NO_USER_INFO)
         # finish() 会抛出 FinishedException，所以这里实际上不会执行
         raise FinishedException from exc
 
@@ -235,7 +238,8 @@ async def send_embed_message(
         cmd_handler: 命令处理器（用于 finish）
         color: embed 颜色，默认 Discord 蓝色
     """
-    import httpx
+    from .client.http_pool import get_http_client
+    from .client.json_codec import dumps_json
 
     config = get_config()
 
@@ -246,9 +250,7 @@ async def send_embed_message(
         return
 
     # 获取频道 ID
-    channel_id = config.platform_channel_id
-    if hasattr(event, "channel_id"):
-        channel_id = str(event.channel_id)
+    channel_id = get_event_channel_id(event, config.platform_channel_id)
 
     embed = {
         "title": title,
@@ -263,26 +265,18 @@ async def send_embed_message(
     }
 
     try:
-        async with httpx.AsyncClient() as client:
-            await client.post(
-                f"https://discord.com/api/v10/channels/{channel_id}/messages",
-                json={"embeds": [embed]},
-                headers=headers,
-                timeout=30.0,
-            )
+        client = get_http_client()
+        await client.post(
+            f"https://discord.com/api/v10/channels/{channel_id}/messages",
+            content=dumps_json({"embeds": [embed]}),
+            headers=headers,
+            timeout=30.0,
+        )
         await cmd_handler.finish()
-    except FinishedException:
-        # finish() 正常抛出的异常，重新抛出
-        raise
     except (RuntimeError, ValueError, AttributeError, KeyError) as e:
-        logger.error(f"Error sending embed message: {e}", exc_info=True)
+        logger.opt(exception=True).error("Error sending embed message: {}", e)
         # 失败时回退到文本格式
-        try:
-            text = f"{title}\n\n{description}"
-            await cmd_handler.finish(text)
-        except FinishedException:
-            # finish() 正常抛出的异常，重新抛出
-            raise
+        await cmd_handler.finish(f"{title}\n\n{description}")
 
 
 # 数据库单例